@@ -12,12 +12,19 @@ import wifi
 import socketpool
 import ssl
 import os
+import gc
+import array
+import struct
+import bitmaptools
 from adafruit_bitmap_font import bitmap_font
 from adafruit_display_text import label
 import adafruit_imageload
 import terminalio
 import adafruit_requests
 import rgbmatrix
+import settings_store
+import metrics
+import layout
 
 # Version and Update Configuration
 VERSION = "1.0.0"  # Current version - update this with each release
@@ -133,26 +140,81 @@ def check_github_releases():
         print(f"Error checking for updates: {e}")
         return {'error': str(e)}
 
-TIMEZONE = os.getenv("TIMEZONE") 
-try: 
-    FONT = bitmap_font.load_font("/fonts/6x10.bdf")
-except:
-    FONT = terminalio.FONT
+# settings.toml is parsed once; the config server shares the same cached copy
+settings = settings_store.snapshot()
 
-try:
-    SMALLER_FONT = bitmap_font.load_font("/fonts/5x7.bdf")
-except:
-    SMALLER_FONT = terminalio.FONT
+# Runtime metrics, exported by the config server's /metrics endpoint
+metrics.describe('fetch_seconds', 'histogram', 'API request time including downloading and parsing the body')
+metrics.describe('fetch_bytes', 'histogram', 'API response body size in bytes (Content-Length)', metrics.SIZE_BUCKETS)
+metrics.describe('fetches_total', 'counter', 'API requests by result')
+metrics.describe('render_seconds', 'histogram', 'Time to build a scene, by scene')
+metrics.describe('logo_loads_total', 'counter', 'Logo loads from flash by kind and result')
+metrics.describe('loop_lag_seconds', 'histogram', 'How late the render loop reached its drawing step after a sleep')
+metrics.describe('mem_free_bytes', 'gauge', 'Free heap when scraped')
+metrics.describe('mem_free_low_bytes', 'gauge', 'Lowest free heap seen by the render loop since boot')
+metrics.describe('wifi_rssi_dbm', 'gauge', 'WiFi signal strength')
+metrics.describe('wifi_reconnects_total', 'counter', 'Times WiFi came back after dropping')
+metrics.describe('uptime_seconds', 'gauge', 'Seconds since code.py started')
 
-try:
-    SMALLEST_FONT = bitmap_font.load_font("/fonts/4x6.bdf")
-except:
-    SMALLEST_FONT = terminalio.FONT
+TIMEZONE = settings.get("TIMEZONE") 
+# Standard-time UTC offsets (hours) for the timezones the setup page offers
+TIMEZONE_OFFSETS = {
+    'America/New_York': -5, 'America/Chicago': -6, 'America/Denver': -7, 'America/Phoenix': -7,
+    'America/Los_Angeles': -8, 'America/Anchorage': -9, 'Pacific/Honolulu': -10,
+    'America/Toronto': -5, 'America/Winnipeg': -6, 'America/Edmonton': -7, 'America/Vancouver': -8,
+    'Europe/London': 0, 'Europe/Paris': 1, 'Europe/Berlin': 1, 'Europe/Rome': 1, 'UTC': 0,
+}
+UTC_OFFSET = TIMEZONE_OFFSETS.get(TIMEZONE, -7)
+
+def load_display_font(name):
+    """Load a font, preferring the compact subset PCF over the full BDF
+    
+    The .pcf files are generated by tools/convert_fonts.py and only contain the
+    UI characters, so they are much smaller and faster to read from flash.
+    """
+    for path in (f"/fonts/{name}.pcf", f"/fonts/{name}.bdf"):
+        try:
+            return bitmap_font.load_font(path)
+        except Exception as e:
+            print(f"Could not load font {path}: {e}")
+    return terminalio.FONT
+
+FONT = load_display_font("6x10")
+SMALLER_FONT = load_display_font("5x7")
+SMALLEST_FONT = load_display_font("4x6")
 
 # Character limits based on font choice
 # terminalio.FONT: ~8 chars for 64px width
 # font5x8.bin: ~12-13 chars for 64px width (much better!)
 
+# Every character the display can draw: team/player names, statuses, times and stats
+# (keep in sync with tools/convert_fonts.py, which subsets the PCF fonts to this set)
+UI_CHARACTERS = (
+    "0123456789"
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "abcdefghijklmnopqrstuvwxyz"
+    " #.,:;-/&'()@%+!?"
+)
+
+def preload_font_glyphs():
+    """Load all UI glyphs up front so first renders don't scan the BDF files from flash"""
+    for font_name, font in (("6x10", FONT), ("5x7", SMALLER_FONT), ("4x6", SMALLEST_FONT)):
+        # terminalio.FONT fallback is built in and has nothing to load
+        if not hasattr(font, 'load_glyphs'):
+            continue
+        try:
+            gc.collect()
+            mem_before = gc.mem_free()
+            start_time = time.monotonic()
+            font.load_glyphs(UI_CHARACTERS)
+            load_time = time.monotonic() - start_time
+            glyph_ram = mem_before - gc.mem_free()
+            print(f"Preloaded {font_name} glyphs: {len(UI_CHARACTERS)} chars in {load_time:.2f}s, {glyph_ram} bytes")
+        except Exception as e:
+            print(f"Glyph preload failed for {font_name}: {e}")
+
+preload_font_glyphs()
+
 
 displayio.release_displays()
 
@@ -197,22 +259,28 @@ matrix = rgbmatrix.RGBMatrix(
 
 display = framebufferio.FramebufferDisplay(matrix)
 
-# Calculate board centers dynamically based on chain_across and matrix_width
-board_centers = []
-for i in range(chain_across):
-    center_x = (i * matrix_width) + (matrix_width // 2)
-    board_centers.append(center_x)
+LAYOUT = layout.compute_layout(matrix_width, matrix_height, chain_across, tile_down)
 
-#print(f"Board centers: {board_centers}")  # Debug output
+def read_int_setting(name, default):
+    """Read an integer from settings.toml, which may hold it as a number or a string"""
+    value = settings.get(name)
+    try:
+        return int(value) if value is not None else default
+    except ValueError:
+        print(f"Invalid {name} setting: {value}")
+        return default
 
 # API settings - Build URL dynamically from settings
-def build_api_url():
-    """Build API URL from settings.toml configuration"""
-    # Get base API URL from settings or use default
-    base_api = os.getenv('API_BASE_URL', 'http://143.110.202.154:8000/api/live')
-    
-    # Get collections settings
-    collections = os.getenv('COLLECTIONS', '')
+API_BASE = settings.get('API_BASE_URL', 'http://143.110.202.154:8000/api/live')
+COLLECTIONS = settings.get('COLLECTIONS', '')
+
+def build_api_url(base_api=None, collections=None):
+    """Build API URL from settings.toml configuration (or the given base URL and collections)"""
+    # Get base API URL and collections from settings unless given
+    if base_api is None:
+        base_api = API_BASE
+    if collections is None:
+        collections = COLLECTIONS
     
     # If we have collections configured, build detailed URL
     if collections:
@@ -231,7 +299,76 @@ def build_api_url():
 API_URL = build_api_url()
 BASE_URL = "http://143.110.202.154/"
 UPDATE_INTERVAL = 30  # seconds between API calls
-DISPLAY_TIME = 10  # seconds to show each game
+DISPLAY_TIME = read_int_setting('DISPLAY_TIME', 10)  # seconds to show each game
+
+# Each collection is fetched on its own schedule - slow-moving ones don't need polling like live games
+LIVE_COLLECTION_INTERVAL = UPDATE_INTERVAL * 2
+SLOW_COLLECTION_INTERVAL = 300
+SLOW_COLLECTIONS = ('golf', 'tennis')  # Collections containing these words use SLOW_COLLECTION_INTERVAL
+
+def get_collection_interval(collection):
+    """Return seconds between refreshes of a collection, from COLLECTION_INTERVALS or its kind"""
+    # e.g. COLLECTION_INTERVALS = "golf_pga=600,cfb_top_25=120"
+    for entry in (settings.get('COLLECTION_INTERVALS') or '').split(','):
+        if '=' in entry:
+            name, seconds = entry.split('=', 1)
+            if name.strip() == collection:
+                try:
+                    return int(seconds)
+                except ValueError:
+                    print(f"Invalid interval for {collection}: {seconds}")
+    for word in SLOW_COLLECTIONS:
+        if word in collection:
+            return SLOW_COLLECTION_INTERVAL
+    return LIVE_COLLECTION_INTERVAL
+
+def build_streams():
+    """Return one fetch stream per configured collection (or one for the live endpoint)"""
+    base_api = API_BASE
+    collections = [name.strip() for name in COLLECTIONS.split(',') if name.strip()]
+    if not collections:
+        return [new_stream('live', API_URL, LIVE_COLLECTION_INTERVAL)]
+    return [new_stream(name, f"{base_api}?collections={name}&page_size=10", get_collection_interval(name))
+            for name in collections]
+
+def new_stream(name, url, interval):
+    """Return the state for fetching one collection: its page cursor, schedule and counters"""
+    return {
+        'name': name,
+        'url': url,               # First page
+        'interval': interval,     # Seconds between refreshes
+        'next_url': None,         # Cursor while a refresh is part way through the pages
+        'due': 0,                 # When the next fetch should happen
+        'page': 0,                # Page the next fetch will be
+        'page_urls': {},          # Page -> URL, for re-polling a page (favorites)
+        'refresh_start': None,    # When the current or last refresh started
+        'refreshed_at': None,     # When the last refresh got through every page
+        'requests': 0,
+        'errors': 0,
+        'games': 0,               # Games on the pages of the last complete refresh
+        'pending_games': 0,
+    }
+
+# Show one game per panel when a slate has more games than this (0 disables grid mode)
+GRID_MODE_THRESHOLD = read_int_setting('GRID_MODE_THRESHOLD', 12)
+
+# "scoreboard" shows games one (or one per panel) at a time, "ticker" crawls them across the chain
+DISPLAY_MODE = settings.get('DISPLAY_MODE', 'scoreboard')
+TICKER_SPEED = read_int_setting('TICKER_SPEED', 30)  # pixels per second
+TICKER_FPS = 30
+
+# Rotation weighting - favorites are team abbreviations or names, comma separated
+def parse_favorites(value):
+    """Return the favorite teams from a comma separated setting, upper-cased"""
+    return [team.strip().upper() for team in (value or '').split(',') if team.strip()]
+
+FAVORITE_TEAMS = parse_favorites(settings.get('FAVORITE_TEAMS'))
+MAX_GAME_SLOTS = 5        # Most times one game is shown per pass through a page
+FINAL_HALF_LIFE = 1800    # Seconds for a final's extra airtime to halve
+FAVORITE_POLL_INTERVAL = read_int_setting('FAVORITE_POLL_INTERVAL', 10)  # Seconds between favorite game checks
+FAVORITE_ALERT_COLOR = TEXT_YELLOW  # Border color while a favorite's update is on screen
+DEBUG_HEAP = read_int_setting('DEBUG_HEAP', 0)  # 1 prints heap churn for every game shown
+DEBUG_LAYOUT = read_int_setting('DEBUG_LAYOUT', 0)  # 1 measures the display layout at boot
 
 # Initialize config server variable
 config_server = None
@@ -285,7 +422,7 @@ def show_config_url_on_display(url, update_info=None):
         url_group.append(company_name)
     
     # Boards 2-4 - Configuration information
-    config_start_x = 68  # Start of board 2
+    config_start_x = LAYOUT['info_x']  # Start of board 2
     
     # Configuration title
     config_title = label.Label(SMALLER_FONT, text="Configuration Portal", color=TEXT_GREEN, scale=1)
@@ -306,24 +443,24 @@ def show_config_url_on_display(url, update_info=None):
     url_group.append(url_label)
     
     # Update notification (if available) - use board 4 only with compact text
-    if update_info and update_info.get('available'):
-        board4_start_x = 203  # 3 more pixels right (was 200, now 203)
+    if update_info and update_info.get('available') and LAYOUT['update_notice']:
+        board4_start_x, board4_top = LAYOUT['update_notice']  # 11 pixels into the last panel
         
         # Line 1: "Update Avail" - compact notification
         update_title = label.Label(SMALLEST_FONT, text="Update Avail", color=TEXT_YELLOW, scale=1)
         update_title.anchor_point = (0.0, 0.0)
-        update_title.anchored_position = (board4_start_x, 2)  # 4 pixels up (was 6, now 2)
+        update_title.anchored_position = (board4_start_x, board4_top + 2)  # 4 pixels up (was 6, now 2)
         url_group.append(update_title)
         
         # Line 2: "@configSite" - instruction to visit config (@ symbol bigger)
         at_symbol = label.Label(SMALLER_FONT, text="@", color=TEXT_CYAN, scale=1)
         at_symbol.anchor_point = (0.0, 0.0)
-        at_symbol.anchored_position = (board4_start_x, 10)  # 4 pixels up (was 14, now 10)
+        at_symbol.anchored_position = (board4_start_x, board4_top + 10)  # 4 pixels up (was 14, now 10)
         url_group.append(at_symbol)
         
         config_text = label.Label(SMALLEST_FONT, text="configSite", color=TEXT_CYAN, scale=1)
         config_text.anchor_point = (0.0, 0.0)
-        config_text.anchored_position = (board4_start_x + 6, 11)  # Offset to align with @ symbol baseline
+        config_text.anchored_position = (board4_start_x + 6, board4_top + 11)  # Offset to align with @ symbol baseline
         url_group.append(config_text)
     
     # Show the URL display
@@ -339,28 +476,33 @@ def show_setup_mode_on_display(ap_ip):
     # Create a temporary group for the setup display
     setup_group = displayio.Group()
     
+    # Network details go in a second column (or row); chains too small for both
+    # show only the details, starting at the left edge
+    show_instructions = LAYOUT['setup_details'] is not None
+    details_x, details_y = LAYOUT['setup_details'] if show_instructions else (2, 0)
+    
     # Name label
     name_label = label.Label(SMALLER_FONT, text="Name:", color=TEXT_YELLOW, scale=1)
     name_label.anchor_point = (0.0, 0.0)
-    name_label.anchored_position = (120, 2)
+    name_label.anchored_position = (details_x, details_y + 2)
     setup_group.append(name_label)
     
     # WiFi network name
     network_label = label.Label(SMALLER_FONT, text="SportsDisplay-Setup", color=TEXT_WHITE, scale=1)
     network_label.anchor_point = (0.0, 0.0)
-    network_label.anchored_position = (150, 2)  # Offset to the right of "Name:" label
+    network_label.anchored_position = (details_x + 30, details_y + 2)  # Offset to the right of "Name:" label
     setup_group.append(network_label)
     
     # PW label
     pw_label = label.Label(SMALLER_FONT, text="PW:", color=TEXT_YELLOW, scale=1)
     pw_label.anchor_point = (0.0, 0.0)
-    pw_label.anchored_position = (120, 9)  # Close under the network name
+    pw_label.anchored_position = (details_x, details_y + 9)  # Close under the network name
     setup_group.append(pw_label)
     
     # Password 
     password_label = label.Label(SMALLER_FONT, text="sports123", color=TEXT_WHITE, scale=1)
     password_label.anchor_point = (0.0, 0.0)
-    password_label.anchored_position = (150, 9)  # Aligned with network name, close under it
+    password_label.anchored_position = (details_x + 30, details_y + 9)  # Aligned with network name, close under it
     setup_group.append(password_label)
     
     # Board 1 - Instructions (left side)
@@ -368,18 +510,20 @@ def show_setup_mode_on_display(ap_ip):
     connect_instruction = label.Label(SMALLER_FONT, text="Connect To Wifi:", color=TEXT_CYAN, scale=1)
     connect_instruction.anchor_point = (0.0, 0.0)
     connect_instruction.anchored_position = (2, 5)  # Moved up 3 pixels for better centering
-    setup_group.append(connect_instruction)
+    if show_instructions:
+        setup_group.append(connect_instruction)
     
     # Row 3: "Then Visit to Config:" instruction  
     config_instruction = label.Label(SMALLER_FONT, text="Then Visit to Config:", color=TEXT_CYAN, scale=1)
     config_instruction.anchor_point = (0.0, 0.0)
     config_instruction.anchored_position = (2, 22)
-    setup_group.append(config_instruction)
+    if show_instructions:
+        setup_group.append(config_instruction)
     
     # Row 3: IP address aligned with "Then Visit to Config:"
     ip_label = label.Label(SMALLER_FONT, text=f"http://{ap_ip}:5000", color=TEXT_GREEN, scale=1)
     ip_label.anchor_point = (0.0, 0.0)
-    ip_label.anchored_position = (120, 22)  # Start after board 1
+    ip_label.anchored_position = (details_x, details_y + 22)  # Start after board 1
     setup_group.append(ip_label)
     
     # Show the setup display
@@ -397,8 +541,8 @@ def show_setup_mode_on_display(ap_ip):
 # Connect to WiFi
 print("Connecting to WiFi...")
 try:
-    ssid = os.getenv('CIRCUITPY_WIFI_SSID')
-    password = os.getenv('CIRCUITPY_WIFI_PASSWORD')
+    ssid = settings.get('CIRCUITPY_WIFI_SSID')
+    password = settings.get('CIRCUITPY_WIFI_PASSWORD')
     
     if not ssid or not password:
         raise Exception("WiFi credentials not configured")
@@ -502,10 +646,18 @@ def fetch_sports_data(url=None):
             request_url = API_URL
             
         print(f"Requesting: {request_url}")
+        fetch_start = time.monotonic()
         response = requests.get(request_url, timeout=10)
         
         if response.status_code == 200:
+            # Parsed straight from the socket so the whole page is never held as text next to the
+            # parsed data; the download and parse are timed together
+            content_length = response.headers.get('content-length')
             data = response.json()
+            metrics.observe('fetch_seconds', time.monotonic() - fetch_start)
+            if content_length:
+                metrics.observe('fetch_bytes', int(content_length))
+            metrics.inc('fetches_total', result='ok')
             games = data.get('data', [])
             
             # Get pagination info
@@ -514,13 +666,16 @@ def fetch_sports_data(url=None):
             
             print(f"Fetched {len(games)} games. Next page: {next_page_url}")
             return games, next_page_url
-        return [], None
+        print(f"API error: HTTP {response.status_code}")
+        metrics.inc('fetches_total', result='http_error')
+        return None, None  # None (not []) so callers keep what they have instead of retiring it
     except Exception as e:
         print(f"API error: {e}")
-        return [], None
+        metrics.inc('fetches_total', result='error')
+        return None, None
 
 def format_game_time(game_time_str):
-    """Format game start time for display, converting to Mountain Time and including day"""
+    """Format game start time for display, converting to the TIMEZONE setting and including day"""
     try:
         # Parse the game time (assuming ISO format from API in UTC)
         if 'T' in game_time_str:
@@ -547,9 +702,8 @@ def format_game_time(game_time_str):
                 hour, minute = hour_min.split(':')
                 hour = int(hour)
                 
-                # Convert UTC to Mountain Time (UTC-7 in summer, UTC-6 in winter)
-                # For simplicity, using UTC-7 (Mountain Daylight Time)
-                hour -= 7  # Convert UTC to Mountain Time
+                # Convert UTC to local time (standard time, daylight saving is not applied)
+                hour += UTC_OFFSET
                 
                 # Handle day rollover
                 day_offset = 0
@@ -639,15 +793,99 @@ def format_pro_team_name(team_name, sport):
         print(f"Team name formatting error: {e}")
         return team_name
 
-def get_team_font(team_text):
-    """Select appropriate font based on team text length"""
-    # Define length threshold - if text is longer than this, use smaller font
-    FONT_SWITCH_THRESHOLD = 8
-    
-    if len(team_text) > FONT_SWITCH_THRESHOLD:
-        return SMALLER_FONT  # 5x7.bdf - smaller, more characters fit
+# Fonts from largest to smallest - fitting only ever steps down this ladder
+FONT_LADDER = [FONT, SMALLER_FONT, SMALLEST_FONT]
+
+# Text slots on the display: (pixel budget, preferred font)
+TEXT_SLOTS = {
+    'team_name': (LAYOUT['matchup_text_width'], FONT),      # Full team name between the two team logos
+    'abbrev': (22, SMALLER_FONT),                           # Team abbreviation between a logo and "vs"
+    'status': (LAYOUT['matchup_text_width'], SMALLER_FONT), # Period/clock or start time between the team logos
+    'player': (LAYOUT['stats_text_width'], SMALLER_FONT),   # Performer name across the stats panel (inside the borders)
+    'stat': (LAYOUT['stats_text_width'], SMALLER_FONT),     # Stat value and type across the stats panel
+    'stats_team': (LAYOUT['stats_team_width'], SMALLER_FONT),  # Team abbreviation next to the "STATS" title
+    'rank': (16, SMALLEST_FONT),                            # Small "#25" rank above a team abbreviation
+    'grid_status': (LAYOUT['grid_status_width'], SMALLEST_FONT),  # Grid mode: status line across a panel
+    'grid_team': (LAYOUT['grid_team_width'], SMALLEST_FONT),      # Grid mode: rank and abbreviation on the left of a panel
+    'grid_score': (LAYOUT['grid_score_width'], SMALLEST_FONT),    # Grid mode: score on the right of a panel
+}
+
+# Memoized measurements keyed by (text, font) and fit results keyed by request
+TEXT_CACHE_LIMIT = 256  # Clear caches past this many entries to bound RAM use
+text_width_cache = {}
+text_fit_cache = {}
+
+def measure_text_width(text, font):
+    """Return the rendered pixel width of text in font, memoized per (text, font)"""
+    key = (text, font)
+    width = text_width_cache.get(key)
+    if width is not None:
+        return width
+    
+    width = 0
+    for char in text:
+        glyph = font.get_glyph(ord(char))
+        if glyph:  # Labels skip missing glyphs, so they take no space
+            width += glyph.shift_x
+    
+    if len(text_width_cache) >= TEXT_CACHE_LIMIT:
+        text_width_cache.clear()
+    text_width_cache[key] = width
+    return width
+
+def fit_text(text, max_width, preferred_font=FONT, abbreviation=None):
+    """Fit text into max_width pixels, return (display_text, font) tuple
+    
+    Tries the full text in preferred_font and each smaller font, then the
+    abbreviation (if given) the same way, and finally truncates the full
+    text in the smallest font.
+    """
+    key = (text, max_width, preferred_font, abbreviation)
+    fitted = text_fit_cache.get(key)
+    if fitted is not None:
+        return fitted
+    
+    if preferred_font in FONT_LADDER:
+        fonts = FONT_LADDER[FONT_LADDER.index(preferred_font):]
     else:
-        return FONT  # 6x10.bdf - larger, better readability
+        fonts = [preferred_font]
+    
+    fitted = None
+    for candidate in (text, abbreviation):
+        if not candidate:
+            continue
+        for font in fonts:
+            if measure_text_width(candidate, font) <= max_width:
+                fitted = (candidate, font)
+                break
+        if fitted:
+            break
+    
+    if fitted is None:
+        # Nothing fits whole - trim the text one character at a time in the smallest font
+        font = fonts[-1]
+        trimmed = text
+        while trimmed and measure_text_width(trimmed, font) > max_width:
+            trimmed = trimmed[:-1]
+        fitted = (trimmed.rstrip(), font)
+    
+    if len(text_fit_cache) >= TEXT_CACHE_LIMIT:
+        text_fit_cache.clear()
+    text_fit_cache[key] = fitted
+    return fitted
+
+def get_team_font(team_text):
+    """Select the largest font that fits the team text in its pixel budget"""
+    max_width, preferred_font = TEXT_SLOTS['team_name']
+    return fit_text(team_text, max_width, preferred_font)[1]
+
+def set_fitted_text(text_label, text, slot, abbreviation=None):
+    """Set a label's text and font so the text fits the slot's pixel budget"""
+    max_width, preferred_font = TEXT_SLOTS[slot]
+    display_text, font = fit_text(text, max_width, preferred_font, abbreviation)
+    if text_label.font is not font:
+        text_label.font = font  # Only swap fonts when needed - it re-lays out the label
+    text_label.text = display_text
 
 def load_league_logo(sport_short):
     """Load league logo bitmap, return TileGrid or None if not found"""
@@ -694,10 +932,12 @@ def load_league_logo(sport_short):
         
         # Create a TileGrid to display the scaled bitmap
         tile_grid = displayio.TileGrid(scaled_bitmap, pixel_shader=brightened_palette)
+        metrics.inc('logo_loads_total', kind='league', result='found')
         
         return tile_grid
         
     except Exception as e:
+        metrics.inc('logo_loads_total', kind='league', result='missing')
         return None
 
 def load_team_logo(team_abbrev, sport_short):
@@ -744,10 +984,12 @@ def load_team_logo(team_abbrev, sport_short):
         
         # Create a TileGrid to display the scaled bitmap
         tile_grid = displayio.TileGrid(scaled_bitmap, pixel_shader=brightened_palette)
+        metrics.inc('logo_loads_total', kind='team', result='found')
         
         return tile_grid
         
     except Exception as e:
+        metrics.inc('logo_loads_total', kind='team', result='missing')
         return None
 
 def generate_random_team_bitmap(team_abbrev, width=28, height=28, team_color=None):
@@ -911,6 +1153,69 @@ def generate_random_team_bitmap(team_abbrev, width=28, height=28, team_color=Non
         print(f"DEBUG - Could not generate random bitmap for {team_abbrev}: {e}")
         return None
 
+# Live clocks count down locally between polls so in-progress games don't look frozen
+RUNNING_CLOCK_SPORTS = ('NBA', 'WBB', 'MBB', 'NFL', 'CFB', 'NHL')  # Sports whose game clock counts down
+CLOCK_STOPPED_TIME = 30  # Seconds a clock must read the same upstream before it counts as stopped
+clock_models = {}  # Game key -> server clock seconds, period, when that reading was first seen, whether it is running
+
+def parse_clock(clock):
+    """Return seconds from a game clock like '12:34' or '45.3', or None"""
+    try:
+        if ':' in clock:
+            minutes, seconds = clock.split(':', 1)
+            return int(minutes) * 60 + float(seconds)
+        return float(clock)
+    except (TypeError, ValueError):
+        return None
+
+def update_clock_model(key, game, now):
+    """Record a freshly fetched clock, replacing any locally counted time"""
+    game_details = game.get('game_details') or {}
+    clock = str(game_details.get('clock') or '')
+    seconds = parse_clock(clock)
+    sport_short = get_sport_short(game.get('sport_display', ''))
+    if game.get('status') != "In Progress" or seconds is None or sport_short not in RUNNING_CLOCK_SPORTS:
+        clock_models.pop(key, None)
+        return
+    
+    period = game_details.get('period')
+    previous = clock_models.get(key)
+    if previous and previous['clock'] == seconds and previous['period'] == period:
+        # Same reading again: polls (favorite re-checks especially) can come faster than the
+        # API updates, so keep counting from when it was first seen. Only a reading that
+        # outlasts the API's update time means the clock is stopped (timeout, break).
+        if previous['running'] and now - previous['fetched_at'] > CLOCK_STOPPED_TIME:
+            previous['running'] = False
+        return
+    clock_models[key] = {
+        'clock': seconds,
+        'period': period,
+        'fetched_at': now,
+        'running': seconds > 0,
+        'tenths': ':' not in clock,  # Last-minute clocks like '45.3'
+    }
+
+def get_live_clock(game, now):
+    """Return the locally counted clock text for a live game, or None to use the fetched one"""
+    model = clock_models.get(get_game_key(game))
+    if model is None:
+        return None
+    remaining = model['clock']
+    if model['running']:
+        remaining = max(0, remaining - (now - model['fetched_at']))  # Stops at the end of the period
+    if model['tenths'] and remaining < 60:
+        return f"{remaining:.1f}"
+    remaining = int(remaining)
+    return f"{remaining // 60}:{remaining % 60:02d}"
+
+def format_score(value):
+    """Return a team score as text: blank for null, whole floats without the .0"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value % 1 == 0:
+        value = int(value)
+    return str(value)
+
 def format_game_status(game):
     """Format game status for display, return (status_text, status_color) tuple"""
     # Safety check for None game
@@ -925,11 +1230,11 @@ def format_game_status(game):
         # Show quarter/period and time remaining for live games
         game_details = game.get('game_details') or {}
         period = game_details.get('period', '')
-        time_remaining = game_details.get('clock', '')
+        time_remaining = get_live_clock(game, time.monotonic()) or game_details.get('clock', '')
         if period and time_remaining:
-            status_text = f"{period} {time_remaining}"[:12]  # Increased from 8 to 12
+            status_text = f"{period} {time_remaining}"  # Fitted to the status slot when shown
         elif period:
-            status_text = period[:12]  # Increased from 8 to 12
+            status_text = period
         else:
             status_text = "LIVE"
         status_color = TEXT_GREEN
@@ -960,8 +1265,8 @@ def format_player_name(full_name):
         name_parts = full_name.strip().split()
         
         if len(name_parts) == 1:
-            # Only one name part, return as is (truncated if needed)
-            return name_parts[0][:12]
+            # Only one name part, return as is (fitted to the player slot when shown)
+            return name_parts[0]
         elif len(name_parts) >= 2:
             # First initial + last name
             first_initial = name_parts[0][0].upper() if name_parts[0] else ''
@@ -970,9 +1275,9 @@ def format_player_name(full_name):
                 if len(name_parts) == 3: # likely a Jr. Sr. or III suffix
                     last_name = name_parts[-2]  # Use the second to last part as surname
             formatted = f"{first_initial}. {last_name}"
-            return formatted[:12]  # Truncate to fit display with expanded space
+            return formatted  # Fitted to the player slot when shown
         else:
-            return full_name[:12]
+            return full_name
     except (IndexError, AttributeError):
         return 'Player'
 
@@ -1053,41 +1358,51 @@ def get_team_color(team_abbr, away_team, home_team):
     
     return None  # Return None if no match or no color
 
+def get_sport_short(sport):
+    """Map the API's sport_display to the short code used for logos and labels"""
+    if 'NBA' in sport:
+        return 'NBA'
+    elif 'NHL' in sport:
+        return 'NHL'
+    elif 'NFL' in sport:
+        return 'NFL'
+    elif 'MLB' in sport:
+        return 'MLB'
+    elif 'College' in sport and 'Basketball Mens' in sport:
+        return 'MBB'
+    elif 'College' in sport and 'Basketball Womens' in sport:
+        return 'WBB'
+    elif 'College' in sport and 'Football' in sport:
+        return 'CFB'
+    elif 'Soccer' in sport:
+        return 'SOC'
+    else:
+        return sport.split()[0][:3].upper() if sport else 'GAM'
+
+def get_game_key(game):
+    """Return a stable identity for a game - the API id, or teams and start time"""
+    game_id = game.get('id')
+    if game_id is not None:
+        return game_id
+    away_team = game.get('away_team') or {}
+    home_team = game.get('home_team') or {}
+    return f"{away_team.get('abbreviation', '')}@{home_team.get('abbreviation', '')}@{game.get('date', '')}"
+
 def update_game_display(game):
     """Update existing display labels with new game data - no recreation needed"""
     global current_game_performers, current_home_color, current_away_color, current_home_abbrev_global, current_away_abbrev_global
+    global displayed_game_key
     
     # Safety check for None game
     if game is None:
         print("Warning: Received None game in update_game_display")
         return
 
-    max_chars_with_rank= 10  # Allow for "#15 Duke" format - same as unranked
-    max_chars_no_rank = 10   # More generous for unranked teams
-    
     if not game:
         return
     
     # Extract game data
-    sport = game.get('sport_display', '')
-    if 'NBA' in sport:
-        sport_short = 'NBA'
-    elif 'NHL' in sport:
-        sport_short = 'NHL'
-    elif 'NFL' in sport:
-        sport_short = 'NFL'
-    elif 'MLB' in sport:
-        sport_short = 'MLB'
-    elif 'College' in sport and 'Basketball Mens' in sport:
-        sport_short = 'MBB'
-    elif 'College' in sport and 'Basketball Womens' in sport:
-        sport_short = 'WBB'
-    elif 'College' in sport and 'Football' in sport:
-        sport_short = 'CFB'
-    elif 'Soccer' in sport:
-        sport_short = 'SOC'
-    else:
-        sport_short = sport.split()[0][:3].upper() if sport else 'GAM'
+    sport_short = get_sport_short(game.get('sport_display', ''))
     
     status = game.get('status', 'Unknown')
     away_team = game.get('away_team', {})
@@ -1110,40 +1425,27 @@ def update_game_display(game):
     away_rank = away_team.get('rank')
     home_rank = home_team.get('rank')
     
-    # Truncate team names to fit display, accounting for rankings and font choice
-    # Determine character limits based on which font would be optimal
-    away_font = get_team_font(away)
-    home_font = get_team_font(home)
-    
-    # Adjust character limits based on font choice
-    # 5x7 font (SMALLER_FONT) allows more characters than 6x10 font (FONT)
-    away_char_limit = 12 if away_font == SMALLER_FONT else max_chars_with_rank if away_rank is not None else max_chars_no_rank
-    home_char_limit = 12 if home_font == SMALLER_FONT else max_chars_with_rank if home_rank is not None else max_chars_no_rank
-    
-    if away_rank is not None:
-        away_display = f"#{away_rank} {away}"[:away_char_limit]
-    else:
-        away_display = away[:away_char_limit]
-        
-    if home_rank is not None:
-        home_display = f"#{home_rank} {home}"[:home_char_limit]
-    else:
-        home_display = home[:home_char_limit]
+    # Fit team names (with rankings) to the team name pixel budget, falling back
+    # to smaller fonts and then the abbreviation before truncating
+    team_name_width, team_name_font = TEXT_SLOTS['team_name']
+    away_prefix = f"#{away_rank} " if away_rank is not None else ""
+    home_prefix = f"#{home_rank} " if home_rank is not None else ""
+    away_display, away_font = fit_text(f"{away_prefix}{away}", team_name_width, team_name_font,
+                                       f"{away_prefix}{away_team.get('abbreviation', '')}")
+    home_display, home_font = fit_text(f"{home_prefix}{home}", team_name_width, team_name_font,
+                                       f"{home_prefix}{home_team.get('abbreviation', '')}")
     
     # Update Board 1: League logo (left) + Sport name (right, bold)
     sport_label.text = sport_short
     
     # Load and position league logo
     global sport_logo_tile
-    display_group = display.root_group
+    display_group = main_group  # Game scene group, even while another scene is showing
     
-    league_logo = load_league_logo(sport_short)
+    league_logo = load_league_logo(sport_short) if LAYOUT['sport'] else None
     if league_logo:
         # Position league logo further left on Board 1 (adjusted for smaller size and left border)
-        logo_x = board_centers[0] - 31  # Moved right by 1 pixel to clear the left border
-        logo_y = (display_height // 2) - 14  # Adjusted for 15% smaller logo height (~27px instead of 32px)
-        league_logo.x = logo_x
-        league_logo.y = logo_y
+        league_logo.x, league_logo.y = LAYOUT['league_logo']
         
         # Remove old league logo if it exists
         if sport_logo_tile and sport_logo_tile in display_group:
@@ -1173,8 +1475,8 @@ def update_game_display(game):
     current_away_abbrev_global = away_abbrev
     
     # Update team abbreviations with individual colors (Away vs Home format)
-    home_abbrev_label.text = home_abbrev  # Home team on right side
-    away_abbrev_label.text = away_abbrev  # Away team on left side
+    set_fitted_text(home_abbrev_label, home_abbrev, 'abbrev')  # Home team on right side
+    set_fitted_text(away_abbrev_label, away_abbrev, 'abbrev')  # Away team on left side
     
     # Apply team colors to individual team labels
     if away_color:
@@ -1193,7 +1495,7 @@ def update_game_display(game):
     
     # Try to load team logos
     global home_team_logo_tile, away_team_logo_tile
-    display_group = display.root_group
+    display_group = main_group  # Game scene group, even while another scene is showing
     
     # Load away team logo (positioned towards left edge - away team now on left)
     home_logo = load_team_logo(away_abbrev, sport_short)
@@ -1201,10 +1503,7 @@ def update_game_display(game):
         home_logo = generate_random_team_bitmap(away_abbrev, team_color=away_color)
     if home_logo:
         # Position the logo towards the left side of board 2 (moved closer to center)
-        logo_x = board_centers[1] - 30  # Less extreme left positioning
-        logo_y = (display_height // 2) - 14  # Adjusted for 15% smaller logo height (~27px instead of 32px)
-        home_logo.x = logo_x
-        home_logo.y = logo_y
+        home_logo.x, home_logo.y = LAYOUT['home_logo']  # Less extreme left positioning
         
         # Remove old home logo if it exists
         if home_team_logo_tile and home_team_logo_tile in display_group:
@@ -1239,8 +1538,7 @@ def update_game_display(game):
         away_logo = generate_random_team_bitmap(home_abbrev, team_color=home_color)
     if away_logo:
         # Position the logo towards the right side of board 3 (moved closer to center)
-        away_logo.x = board_centers[2] - 2  # Less extreme right positioning
-        away_logo.y = (display_height // 2) - 14  # Adjusted for 15% smaller logo height (~27px instead of 32px)
+        away_logo.x, away_logo.y = LAYOUT['away_logo']  # Less extreme right positioning
         
         # Remove old away logo if it exists
         if away_team_logo_tile and away_team_logo_tile in display_group:
@@ -1268,11 +1566,19 @@ def update_game_display(game):
             away_team_logo_label.color = TEXT_WHITE
     
     # Update period/status in top center
-    game_period_label.text = status_text
+    displayed_game_key = get_game_key(game)
+    set_fitted_text(game_period_label, status_text, 'status')
     game_period_label.color = status_color
     
-    # Update score in bottom center (Away - Home format to match display)
-    game_score_label.text = f"{away_score} - {home_score}"
+    # Update score in bottom center (Away - Home format to match display),
+    # highlighting it when it changed since this game was last shown
+    key = get_game_key(game)
+    previous_score = last_shown_scores.get(key)
+    score_changed = previous_score is not None and previous_score != (away_score, home_score)
+    if previous_score is None and len(last_shown_scores) >= 100:
+        last_shown_scores.clear()  # Bound memory over a long day of slates
+    last_shown_scores[key] = (away_score, home_score)
+    game_score_label.set_score(away_score, home_score, highlight=score_changed)
     
     # Update Board 4: Prepare performers for cycling
     top_performers = game.get('top_performers', [])
@@ -1301,9 +1607,9 @@ def update_game_display(game):
         else:
             board4_stats_team_label.color = TEXT_CYAN
         
-        board4_stats_team_label.text = team_abbr
-        board4_player_label.text = name
-        board4_stat_label.text = f"{stat_value} {stat_type}"
+        set_fitted_text(board4_stats_team_label, team_abbr, 'stats_team')
+        set_fitted_text(board4_player_label, name, 'player')
+        set_fitted_text(board4_stat_label, f"{stat_value} {stat_type}", 'stat')
         #print(f"Game: {sport_short} {status_text} | {away_abbrev} {away_score} - {home_score} {home_abbrev} | {len(current_game_performers)} performers available")
     else:
         board4_stats_team_label.text = ""
@@ -1313,14 +1619,38 @@ def update_game_display(game):
 
 
 # Initialize
-current_game = 0
-games = []
-next_page_url = None
-last_update = 0
+current_game = 0               # Position in rotation
+games = []                     # Every game from the pages fetched so far, in API order
+game_index = {}                # Game key -> index in games
+game_pages = {}                # Game key -> set of (collection, page) it is on - a game can be in several
+game_last_shown = {}           # Game key -> when it was last shown (or added)
+streams = build_streams()      # One fetch pipeline per collection
+rotation = []                  # Keys of games in the order this pass shows them (may repeat)
+pass_start_time = None         # When the current rotation pass started
+pass_stats = {'duplicates': 0, 'last_duplicates': 0}
+fairness_stats = {'worst_wait': 0, 'worst_game': None}
+favorite_states = {}           # Game key -> (away score, home score, status) last seen for favorites
+favorite_alert = None          # (game key, when the change was fetched) waiting to preempt the rotation
+alert_until = 0                # The alert scene stays up until this time
+last_favorite_poll = 0
+alert_stats = {'count': 0, 'total_latency': 0, 'max_latency': 0}
+game_weights = {}              # Game key -> (weight, reasons) from the last schedule
+final_first_seen = {}          # Game key -> when the game was first seen as final
+last_update = 0                # When the last API request was made
 last_change = time.monotonic()
 
 # Stats display variables
 current_game_performers = []  # Store current game's performers
+last_shown_scores = {}  # (away_score, home_score) last shown per game key, for change highlights
+displayed_game_key = None  # Game on the single-game scene, for live clock updates
+
+def refresh_live_clock(now):
+    """Redraw the status of the game on screen if its clock is counting down locally"""
+    if displayed_game_key not in clock_models or display.root_group is not main_group:
+        return
+    if displayed_game_key in game_index:
+        status_text, _ = format_game_status(games[game_index[displayed_game_key]])
+        set_fitted_text(game_period_label, status_text, 'status')  # No-op when the text is unchanged
 
 # Global team colors for current game (used for persistent Board 4 coloring)
 current_home_color = None
@@ -1329,6 +1659,7 @@ current_home_abbrev_global = ""
 current_away_abbrev_global = ""
 
 # Global label references for efficient updates
+main_group = None            # Single game scene (root group when not in grid mode)
 sport_label = None
 sport_logo_tile = None       # League logo on Board 1
 home_team_logo_label = None  # Left side of combined boards 2+3 (text fallback)
@@ -1336,161 +1667,550 @@ home_team_logo_tile = None   # Left side logo bitmap
 away_team_logo_label = None  # Right side of combined boards 2+3 (text fallback)
 away_team_logo_tile = None   # Right side logo bitmap
 away_abbrev_label = None     # Away team abbreviation (left side)
-vs_label = None              # "vs" text between teams
 home_abbrev_label = None     # Home team abbreviation (right side)
 away_rank_label = None       # Small rank indicator for away team (left side)
 home_rank_label = None       # Small rank indicator for home team (right side)
 game_period_label = None  # Middle top of combined boards 2+3
 game_score_label = None  # Middle bottom of combined boards 2+3
-board4_stats_title = None
+background_bitmap = None     # Prerendered borders, "vs" and "STATS" title
+background_palette = None
 board4_stats_team_label = None  # Team label next to "STATS" title
 board4_player_label = None
 board4_stat_label = None
 
 
+def get_font_height(font):
+    """Return the line height of a font in pixels"""
+    return font.get_bounding_box()[1]
+
+def get_font_ascent(font):
+    """Return the distance from the top of a font's line to its baseline"""
+    bounding_box = font.get_bounding_box()
+    y_offset = bounding_box[3] if len(bounding_box) > 3 else 0
+    return bounding_box[1] + y_offset
+
+def get_glyph_origin(glyph):
+    """Return the (x, y) of a glyph inside its bitmap
+    
+    Built-in fonts keep every glyph in one sprite sheet, BDF/PCF glyphs have their own bitmap.
+    """
+    tiles_per_row = glyph.bitmap.width // glyph.width
+    return ((glyph.tile_index % tiles_per_row) * glyph.width,
+            (glyph.tile_index // tiles_per_row) * glyph.height)
+
+def draw_text_into_bitmap(bitmap, font, text, x, y, color_index):
+    """Draw text with its top-left corner at (x, y) into bitmap, for one-time prerendering"""
+    baseline = y + get_font_ascent(font)
+    for char in text:
+        glyph = font.get_glyph(ord(char))
+        if not glyph:
+            continue
+        source_x, source_y = get_glyph_origin(glyph)
+        glyph_x = x + glyph.dx
+        glyph_y = baseline - glyph.height - glyph.dy
+        for gy in range(glyph.height):
+            for gx in range(glyph.width):
+                if (glyph.bitmap[source_x + gx, source_y + gy]
+                        and 0 <= glyph_x + gx < bitmap.width and 0 <= glyph_y + gy < bitmap.height):
+                    bitmap[glyph_x + gx, glyph_y + gy] = color_index
+        x += glyph.shift_x
+
+class FixedTextLabel(displayio.Group):
+    """Single-line text label drawn into a preallocated bitmap
+    
+    label.Label rebuilds its glyph TileGrids every time .text changes. This label
+    reserves a bitmap max_width pixels wide when it is created and redraws glyphs
+    into it in place, so text, color and font updates never allocate.
+    Supports the Label attributes the display uses: text, color, font,
+    anchor_point and anchored_position.
+    """
+    def __init__(self, font, max_width, text="", color=TEXT_WHITE):
+        super().__init__()
+        self._font = font
+        self._text = None
+        self._text_width = 0
+        self._anchor_point = (0.0, 0.0)
+        self._anchored_position = (0, 0)
+        
+        # Sized for the font given here - fitting only ever switches to smaller fonts
+        self._bitmap = displayio.Bitmap(max_width, get_font_height(font), 2)
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self._palette[1] = color
+        self.append(displayio.TileGrid(self._bitmap, pixel_shader=self._palette))
+        
+        self.text = text
+    
+    def _draw(self):
+        """Redraw the current text into the bitmap, clipped to its width"""
+        bitmap = self._bitmap
+        bitmap.fill(0)
+        font = self._font
+        baseline = get_font_ascent(font)
+        x = 0
+        for char in self._text:
+            glyph = font.get_glyph(ord(char))
+            if not glyph:
+                continue
+            glyph_x = x + glyph.dx
+            if glyph_x + glyph.width > bitmap.width:
+                break
+            source_x, source_y = get_glyph_origin(glyph)
+            bitmaptools.blit(bitmap, glyph.bitmap, glyph_x, max(0, baseline - glyph.height - glyph.dy),
+                             x1=source_x, y1=source_y, x2=source_x + glyph.width, y2=source_y + glyph.height,
+                             skip_source_index=0)
+            x += glyph.shift_x
+        self._text_width = min(x, bitmap.width)
+        self._update_position()
+    
+    def _update_position(self):
+        """Place the label so the drawn text (not the whole bitmap) sits on its anchor"""
+        anchor_x, anchor_y = self._anchor_point
+        position_x, position_y = self._anchored_position
+        self.x = int(position_x - anchor_x * self._text_width)
+        self.y = int(position_y - anchor_y * get_font_height(self._font))
+    
+    @property
+    def text(self):
+        return self._text
+    
+    @text.setter
+    def text(self, new_text):
+        if new_text == self._text:
+            return
+        self._text = new_text
+        self._draw()
+    
+    @property
+    def color(self):
+        return self._palette[1]
+    
+    @color.setter
+    def color(self, new_color):
+        self._palette[1] = new_color
+    
+    @property
+    def font(self):
+        return self._font
+    
+    @font.setter
+    def font(self, new_font):
+        self._font = new_font
+        self._draw()
+    
+    @property
+    def anchor_point(self):
+        return self._anchor_point
+    
+    @anchor_point.setter
+    def anchor_point(self, new_anchor_point):
+        self._anchor_point = new_anchor_point
+        self._update_position()
+    
+    @property
+    def anchored_position(self):
+        return self._anchored_position
+    
+    @anchored_position.setter
+    def anchored_position(self, new_position):
+        self._anchored_position = new_position
+        self._update_position()
+
+def create_slot_label(slot, color):
+    """Create a preallocated label sized to a text slot's pixel budget"""
+    max_width, preferred_font = TEXT_SLOTS[slot]
+    return FixedTextLabel(preferred_font, max_width, color=color)
+
+# Characters the score sprite sheet can show (scores, the dash, "NO DATA" placeholders)
+SCORE_CHARACTERS = " -0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ."
+SCORE_MAX_CHARS = 11         # Fits "DATA - DATA", the widest score the display produces
+SCORE_BOLD = False           # Draw digits twice, 1 pixel apart, for a heavier look
+SCORE_HIGHLIGHT_COLOR = TEXT_WHITE
+SCORE_HIGHLIGHT_TIME = 3     # seconds a changed score stays highlighted
+
+class ScoreBoard(displayio.Group):
+    """Fixed-width score display backed by a prerendered sprite sheet
+    
+    The score characters are rendered from the font once at startup. Showing
+    a score only sets tile indices in a fixed-size TileGrid, so updates need
+    no allocation or glyph lookup. A changed score can be briefly highlighted.
+    """
+    def __init__(self, font, color=TEXT_YELLOW, bold=SCORE_BOLD):
+        super().__init__()
+        self._color = color
+        self._highlight_until = 0
+        self._center_x = 0
+        self._text_tiles = 0
+        
+        glyph_width = max(font.get_glyph(ord(c)).shift_x for c in SCORE_CHARACTERS if font.get_glyph(ord(c)))
+        self._tile_width = glyph_width + (1 if bold else 0)
+        self._tile_height = font.get_bounding_box()[1]
+        self._tile_index = {}
+        
+        # Render every score character into one sprite sheet, one tile per character
+        sheet = displayio.Bitmap(self._tile_width * len(SCORE_CHARACTERS), self._tile_height, 2)
+        baseline = get_font_ascent(font)
+        for index, char in enumerate(SCORE_CHARACTERS):
+            self._tile_index[char] = index
+            glyph = font.get_glyph(ord(char))
+            if not glyph:
+                continue
+            source_x, source_y = get_glyph_origin(glyph)
+            for offset in ((0, 1) if bold else (0,)):
+                bitmaptools.blit(sheet, glyph.bitmap, index * self._tile_width + glyph.dx + offset,
+                                 max(0, baseline - glyph.height - glyph.dy),
+                                 x1=source_x, y1=source_y, x2=source_x + glyph.width, y2=source_y + glyph.height,
+                                 skip_source_index=0)
+        
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self._palette[1] = color
+        self._tiles = displayio.TileGrid(sheet, pixel_shader=self._palette, width=SCORE_MAX_CHARS, height=1,
+                                         tile_width=self._tile_width, tile_height=self._tile_height,
+                                         default_tile=self._tile_index[' '])
+        self.append(self._tiles)
+    
+    @property
+    def height(self):
+        return self._tile_height
+    
+    def place(self, center_x, bottom_y):
+        """Center the score horizontally on center_x with its bottom edge at bottom_y"""
+        self._center_x = center_x
+        self.y = bottom_y - self._tile_height
+        self._update_position()
+    
+    def _update_position(self):
+        self.x = self._center_x - (self._text_tiles * self._tile_width) // 2
+    
+    def _set_tile(self, position, char):
+        if position < SCORE_MAX_CHARS:
+            self._tiles[position] = self._tile_index.get(char, 0)
+        return position + 1
+    
+    def _write_value(self, position, value):
+        """Write a score into the tiles starting at position, return the next position
+        
+        The API may send a score as an int, a str, a float or null; anything that
+        isn't an int is shown as text, and characters with no tile are dropped.
+        """
+        if isinstance(value, float) and value % 1 == 0:
+            value = int(value)
+        if isinstance(value, int):
+            if value < 0:
+                position = self._set_tile(position, '-')
+                value = -value
+            digits = 1
+            while value >= 10 ** digits:
+                digits += 1
+            for place in range(digits - 1, -1, -1):
+                position = self._set_tile(position, SCORE_CHARACTERS[2 + (value // 10 ** place) % 10])
+            return position
+        for char in format_score(value).upper():
+            if char in self._tile_index:
+                position = self._set_tile(position, char)
+        return position
+    
+    def set_score(self, away_score, home_score, highlight=False):
+        """Show "away - home", optionally highlighting it for SCORE_HIGHLIGHT_TIME seconds"""
+        position = self._write_value(0, away_score)
+        position = self._set_tile(position, ' ')
+        position = self._set_tile(position, '-')
+        position = self._set_tile(position, ' ')
+        position = self._write_value(position, home_score)
+        self._text_tiles = min(position, SCORE_MAX_CHARS)
+        for blank in range(self._text_tiles, SCORE_MAX_CHARS):
+            self._tiles[blank] = self._tile_index[' ']
+        self._update_position()
+        
+        if highlight:
+            self._palette[1] = SCORE_HIGHLIGHT_COLOR
+            self._highlight_until = time.monotonic() + SCORE_HIGHLIGHT_TIME
+        elif self._highlight_until:
+            self._palette[1] = self._color
+            self._highlight_until = 0
+    
+    def tick(self, now):
+        """End the highlight once its time is up - call regularly while a game is shown"""
+        if self._highlight_until and now >= self._highlight_until:
+            self._palette[1] = self._color
+            self._highlight_until = 0
+
+# Heap churn for the current game rotation: bytes allocated and garbage collections seen
+# Only tracked with DEBUG_HEAP set, since the extra gc.collect() costs time on every game
+heap_stats = {'last_alloc': 0, 'allocated': 0, 'gc_runs': 0}
+
+def start_heap_tracking():
+    """Collect garbage and start counting allocations for a new game rotation"""
+    if not DEBUG_HEAP:
+        return
+    gc.collect()
+    heap_stats['last_alloc'] = gc.mem_alloc()
+    heap_stats['allocated'] = 0
+    heap_stats['gc_runs'] = 0
+
+def sample_heap():
+    """Add allocations since the last sample - a drop in allocated memory means a GC ran"""
+    if not DEBUG_HEAP:
+        return
+    allocated = gc.mem_alloc()
+    if allocated < heap_stats['last_alloc']:
+        heap_stats['gc_runs'] += 1
+    else:
+        heap_stats['allocated'] += allocated - heap_stats['last_alloc']
+    heap_stats['last_alloc'] = allocated
+
+def report_heap_tracking():
+    """Print the heap churn for the rotation that just finished"""
+    if not DEBUG_HEAP:
+        return
+    sample_heap()
+    print(f"Rotation heap churn: {heap_stats['allocated']} bytes, {heap_stats['gc_runs']} GC runs, {gc.mem_free()} bytes free")
+
+# Health for /metrics: free-heap low-water mark and WiFi drops, sampled every loop tick
+start_time = time.monotonic()
+mem_free_low = None        # Lowest gc.mem_free() the render loop has seen
+wifi_was_connected = True  # WiFi state at the last sample, to count reconnects
+
+def sample_health():
+    """Update the free-heap low-water mark and count WiFi reconnects"""
+    global mem_free_low, wifi_was_connected
+    free = gc.mem_free()
+    if mem_free_low is None or free < mem_free_low:
+        mem_free_low = free
+    if wifi_connected:
+        connected = wifi.radio.connected
+        if connected and not wifi_was_connected:
+            metrics.inc('wifi_reconnects_total')
+        wifi_was_connected = connected
+
+def collect_metrics():
+    """Set the gauges that are only worth reading when /metrics is scraped"""
+    metrics.set_gauge('mem_free_bytes', gc.mem_free())
+    if mem_free_low is not None:
+        metrics.set_gauge('mem_free_low_bytes', mem_free_low)
+    metrics.set_gauge('uptime_seconds', int(time.monotonic() - start_time))
+    ap_info = wifi.radio.ap_info if wifi_connected else None
+    if ap_info is not None:
+        metrics.set_gauge('wifi_rssi_dbm', ap_info.rssi)
+
+metrics.add_collector(collect_metrics)
+
+loop_due = None  # When the loop was due to wake from its last sleep
+
+def loop_sleep(seconds):
+    """Sleep until the next tick; record_loop_lag() then measures how late the tick's drawing starts"""
+    global loop_due
+    loop_due = time.monotonic() + seconds
+    time.sleep(seconds)
+
+def record_loop_lag():
+    """Record loop lag: oversleeping plus anything (GC, config server, fetches) run before drawing"""
+    global loop_due
+    if loop_due is not None:
+        metrics.observe('loop_lag_seconds', time.monotonic() - loop_due)
+        loop_due = None
+
+def timed_render(scene, render, *args):
+    """Call render(*args), recording how long it took under the scene's name"""
+    render_start = time.monotonic()
+    result = render(*args)
+    metrics.observe('render_seconds', time.monotonic() - render_start, scene=scene)
+    return result
+
+# Background palette indices for the prerendered static chrome
+BACKGROUND_BORDER = 1
+BACKGROUND_VS_TEXT = 2
+BACKGROUND_TITLE_TEXT = 3
+
+def parse_color_setting(value, default):
+    """Parse a color from settings.toml - an integer or a "0x002040"/"#002040" string"""
+    if isinstance(value, int):
+        return value
+    if not value:
+        return default
+    try:
+        return int(value.strip().lstrip('#').replace('0x', ''), 16)
+    except ValueError:
+        print(f"Invalid color setting: {value}")
+        return default
+
+BORDER_COLOR = parse_color_setting(settings.get('BORDER_COLOR'), 0x002040)  # Even dimmer blue - very easy on eyes, still visible
+
+def render_background():
+    """Draw the static chrome (borders, "vs", "STATS") into the background bitmap"""
+    bitmap = background_bitmap
+    bitmap.fill(0)
+    
+    # Top and bottom borders on every panel row, with left and right edges
+    # down the whole chain
+    for row_y in LAYOUT['border_rows']:
+        bitmaptools.fill_region(bitmap, 0, row_y, display_width, row_y + 1, BACKGROUND_BORDER)
+        bitmaptools.fill_region(bitmap, 0, row_y + matrix_height - 1, display_width, row_y + matrix_height, BACKGROUND_BORDER)
+    bitmaptools.fill_region(bitmap, 0, 0, 1, display_height, BACKGROUND_BORDER)
+    bitmaptools.fill_region(bitmap, display_width - 1, 0, display_width, display_height, BACKGROUND_BORDER)
+    
+    # "vs" centered between the team abbreviations
+    vs_center_x, vs_center_y = LAYOUT['vs']
+    vs_x = int(vs_center_x - 0.5 * measure_text_width("vs", SMALLER_FONT))
+    vs_y = int(vs_center_y - 0.5 * get_font_height(SMALLER_FONT))
+    draw_text_into_bitmap(bitmap, SMALLER_FONT, "vs", vs_x, vs_y, BACKGROUND_VS_TEXT)
+    
+    # Stats title, 10 pixels more left than the stats panel center
+    if LAYOUT['stats']:
+        title_x, title_y = LAYOUT['stats_title']
+        draw_text_into_bitmap(bitmap, SMALLER_FONT, "STATS", title_x, title_y, BACKGROUND_TITLE_TEXT)
+
+def create_background_layer():
+    """Create the background bitmap once and return a TileGrid showing it"""
+    global background_bitmap, background_palette
+    
+    background_bitmap = displayio.Bitmap(display_width, display_height, 4)
+    background_palette = displayio.Palette(4)
+    background_palette.make_transparent(0)
+    background_palette[BACKGROUND_BORDER] = BORDER_COLOR
+    background_palette[BACKGROUND_VS_TEXT] = TEXT_WHITE
+    background_palette[BACKGROUND_TITLE_TEXT] = TEXT_CYAN
+    render_background()
+    
+    return displayio.TileGrid(background_bitmap, pixel_shader=background_palette)
+
+def set_border_color(color):
+    """Change the border color - only a palette entry, the bitmap is not redrawn"""
+    global BORDER_COLOR
+    BORDER_COLOR = color
+    if background_palette:
+        background_palette[BACKGROUND_BORDER] = color
+
+def count_display_nodes(group):
+    """Count every layer (groups, labels, tile grids, shapes) under a group"""
+    count = 0
+    for item in group:
+        count += 1
+        if isinstance(item, displayio.Group):
+            count += count_display_nodes(item)
+    return count
+
+def measure_refresh_time(frames=10):
+    """Return the average milliseconds to composite and send a full frame of the current root group"""
+    root_group = display.root_group
+    display.auto_refresh = False
+    try:
+        start_time = time.monotonic()
+        for _ in range(frames):
+            # Re-assigning the root group marks the whole display dirty
+            display.root_group = None
+            display.root_group = root_group
+            display.refresh(minimum_frames_per_second=0)
+        return (time.monotonic() - start_time) * 1000 / frames
+    finally:
+        display.auto_refresh = True
+
+def screenshot_bmp():
+    """Yield the current frame as a 24-bit BMP, header then one row at a time
+
+    Rows are composited from display.root_group with fill_row, so the image is never
+    held in RAM - only one row of RGB565 pixels and one row of BMP output.
+    """
+    width, height = display.width, display.height
+    row_size = (width * 3 + 3) & ~3  # BMP rows are padded to 4 bytes
+    yield struct.pack('<2sIHHIIiiHHIIiiII', b'BM', 54 + row_size * height, 0, 0, 54,
+                      40, width, height, 1, 24, 0, row_size * height, 2835, 2835, 0, 0)
+    pixels = array.array('H', [0] * width)
+    row = bytearray(row_size)
+    for y in range(height - 1, -1, -1):  # BMP stores the bottom row first
+        display.fill_row(y, pixels)
+        i = 0
+        for color in pixels:
+            # RGB565 to the BMP's blue, green, red byte order
+            row[i] = (color & 0x1F) << 3
+            row[i + 1] = (color >> 3) & 0xFC
+            row[i + 2] = (color >> 8) & 0xF8
+            i += 3
+        yield row  # Sent before the next row overwrites it
+
 def setup_display_layout():
     """Create the display layout once with all labels"""
     global sport_label, sport_logo_tile, home_team_logo_label, game_period_label, home_rank_label, away_rank_label
-    global game_score_label, away_team_logo_label, board4_stats_title, board4_stats_team_label, board4_player_label, board4_stat_label
-    global home_team_logo_tile, away_team_logo_tile, away_abbrev_label, vs_label, home_abbrev_label
+    global game_score_label, away_team_logo_label, board4_stats_team_label, board4_player_label, board4_stat_label
+    global home_team_logo_tile, away_team_logo_tile, away_abbrev_label, home_abbrev_label, main_group
     
     main_group = displayio.Group()
     
+    # Static chrome (borders, "vs", "STATS") is one prerendered bitmap at the bottom
+    main_group.append(create_background_layer())
+    
     # BOARD 1: League logo (left) + Sport name (right, bold)
     # League logo will be added dynamically based on sport
     # Sport text using smaller font with moderate scale for better size control
     sport_label = label.Label(SMALLER_FONT, text="", color=TEXT_CYAN, scale=2)
     sport_label.anchor_point = (1.0, 0.5)  # Right aligned
-    sport_label.anchored_position = (board_centers[0] + 32, display_height // 2)  # Moved even further right
-    main_group.append(sport_label)
+    if LAYOUT['sport']:
+        sport_label.anchored_position = LAYOUT['sport_label']
+        main_group.append(sport_label)
     
     # BOARDS 2+3 COMBINED: Team logos, period/status, and score
-    # Calculate the center of the combined boards 2+3 area
-    combined_center_x = (board_centers[1] + board_centers[2]) // 2
-    
-    # Add top and bottom border lines spanning entire boards 2+3 width
-    border_left = 64   # Start of board 2
-    border_right = 192  # End of board 3
-    border_width = border_right - border_left
-    
-    # Create border using top and bottom lines only
-    border_palette = displayio.Palette(1)
-    border_palette[0] = 0x002040  # Even dimmer blue - very easy on eyes, still visible
-    
-    # Top border (moved up by 2 pixels to the very top)
-    top_border = vectorio.Rectangle(pixel_shader=border_palette, width=border_width, height=1, x=border_left, y=0)
-    main_group.append(top_border)
-    
-    # Bottom border (moved down by 1 pixel closer to bottom)  
-    bottom_border = vectorio.Rectangle(pixel_shader=border_palette, width=border_width, height=1, x=border_left, y=display_height-1)
-    main_group.append(bottom_border)
-    
-    # Add borders for Board 1 (left border + top/bottom)
-    board1_left = 0
-    board1_right = 64
-    board1_width = board1_right - board1_left
-    
-    # Board 1 top border
-    board1_top_border = vectorio.Rectangle(pixel_shader=border_palette, width=board1_width, height=1, x=board1_left, y=0)
-    main_group.append(board1_top_border)
-    
-    # Board 1 bottom border
-    board1_bottom_border = vectorio.Rectangle(pixel_shader=border_palette, width=board1_width, height=1, x=board1_left, y=display_height-1)
-    main_group.append(board1_bottom_border)
-    
-    # Board 1 left border
-    board1_left_border = vectorio.Rectangle(pixel_shader=border_palette, width=1, height=display_height, x=board1_left, y=0)
-    main_group.append(board1_left_border)
-    
-    # Add borders for Board 4 (right border + top/bottom)
-    board4_left = 192
-    board4_right = 256
-    board4_width = board4_right - board4_left
-    
-    # Board 4 top border
-    board4_top_border = vectorio.Rectangle(pixel_shader=border_palette, width=board4_width, height=1, x=board4_left, y=0)
-    main_group.append(board4_top_border)
-    
-    # Board 4 bottom border
-    board4_bottom_border = vectorio.Rectangle(pixel_shader=border_palette, width=board4_width, height=1, x=board4_left, y=display_height-1)
-    main_group.append(board4_bottom_border)
-    
-    # Board 4 right border
-    board4_right_border = vectorio.Rectangle(pixel_shader=border_palette, width=1, height=display_height, x=board4_right-1, y=0)
-    main_group.append(board4_right_border)
     
     # Left side: Home team (will be logo or text fallback) - positioned towards left side
     home_team_logo_label = label.Label(SMALLER_FONT, text="", color=TEXT_WHITE, scale=1)
     home_team_logo_label.anchor_point = (0.0, 0.5)  # Left aligned
-    home_team_logo_label.anchored_position = (board_centers[1] - 20, display_height // 2)
+    home_team_logo_label.anchored_position = LAYOUT['home_logo_label']
     # Note: home_team_logo_label will be added to main_group only if no logo is available
     
     # Right side: Away team (will be logo or text fallback) - positioned towards right side
     away_team_logo_label = label.Label(SMALLER_FONT, text="", color=TEXT_WHITE, scale=1)
     away_team_logo_label.anchor_point = (1.0, 0.5)  # Right aligned
-    away_team_logo_label.anchored_position = (board_centers[2] + 20, display_height // 2)
+    away_team_logo_label.anchored_position = LAYOUT['away_logo_label']
     # Note: away_team_logo_label will be added to main_group only if no logo is available
     
     # Center: Team abbreviations (AWAY vs HOME) - separate labels for individual colors
-    away_abbrev_label = label.Label(SMALLER_FONT, text="", color=TEXT_WHITE, scale=1)
+    away_abbrev_label = create_slot_label('abbrev', TEXT_WHITE)
     away_abbrev_label.anchor_point = (1.0, 0.5)  # Right aligned
-    away_abbrev_label.anchored_position = (combined_center_x - 8, display_height // 2 + 2)  # Left of center
+    away_abbrev_label.anchored_position = LAYOUT['away_abbrev']  # Left of center
     main_group.append(away_abbrev_label)
     
-    vs_label = label.Label(SMALLER_FONT, text="vs", color=TEXT_WHITE, scale=1)
-    vs_label.anchor_point = (0.5, 0.5)  # Center aligned
-    vs_label.anchored_position = (combined_center_x, display_height // 2 + 2)  # Centered
-    main_group.append(vs_label)
-    
-    home_abbrev_label = label.Label(SMALLER_FONT, text="", color=TEXT_WHITE, scale=1)
+    home_abbrev_label = create_slot_label('abbrev', TEXT_WHITE)
     home_abbrev_label.anchor_point = (0.0, 0.5)  # Left aligned
-    home_abbrev_label.anchored_position = (combined_center_x + 8, display_height // 2 + 2)  # Right of center
+    home_abbrev_label.anchored_position = LAYOUT['home_abbrev']  # Right of center
     main_group.append(home_abbrev_label)
     
     # Small rank indicators positioned above team abbreviations
     global away_rank_label, home_rank_label
-    away_rank_label = label.Label(SMALLEST_FONT, text="", color=TEXT_CYAN, scale=1)
+    away_rank_label = create_slot_label('rank', TEXT_CYAN)
     away_rank_label.anchor_point = (1.0, 1.0)  # Right-bottom aligned
-    away_rank_label.anchored_position = (combined_center_x - 15, display_height // 2 - 1)  # Left of center, above team names
+    away_rank_label.anchored_position = LAYOUT['away_rank']  # Left of center, above team names
     main_group.append(away_rank_label)
     
-    home_rank_label = label.Label(SMALLEST_FONT, text="", color=TEXT_CYAN, scale=1)
+    home_rank_label = create_slot_label('rank', TEXT_CYAN)
     home_rank_label.anchor_point = (0.0, 1.0)  # Left-bottom aligned  
-    home_rank_label.anchored_position = (combined_center_x + 15, display_height // 2 - 1)  # Right of center, above team names
+    home_rank_label.anchored_position = LAYOUT['home_rank']  # Right of center, above team names
     main_group.append(home_rank_label)
     
     # Top: Period/time remaining or status
-    game_period_label = label.Label(SMALLER_FONT, text="", color=TEXT_WHITE, scale=1)
+    game_period_label = create_slot_label('status', TEXT_WHITE)
     game_period_label.anchor_point = (0.5, 0.0)
-    game_period_label.anchored_position = (combined_center_x, 2)
+    game_period_label.anchored_position = LAYOUT['period']
     main_group.append(game_period_label)
     
     # Bottom: Score (X - Y format)
-    game_score_label = label.Label(FONT, text="", color=TEXT_YELLOW, scale=1)
-    game_score_label.anchor_point = (0.5, 1.0)
-    game_score_label.anchored_position = (combined_center_x, display_height)
+    game_score_label = ScoreBoard(FONT, color=TEXT_YELLOW)
+    game_score_label.place(*LAYOUT['score'])
     main_group.append(game_score_label)
     
-    # BOARD 4: Stats title moved left with team label next to it
-    board4_stats_title = label.Label(SMALLER_FONT, text="STATS", color=TEXT_CYAN, scale=1)
-    board4_stats_title.anchor_point = (0.0, 0.0)  # Left aligned
-    board4_stats_title.anchored_position = (board_centers[3] - 28, 2)  # 10 pixels more left than center
-    main_group.append(board4_stats_title)
-    
-    board4_stats_team_label = label.Label(SMALLER_FONT, text="", color=TEXT_CYAN, scale=1)
+    # BOARD 4: Team label next to the prerendered "STATS" title
+    board4_stats_team_label = create_slot_label('stats_team', TEXT_CYAN)
     board4_stats_team_label.anchor_point = (0.0, 0.0)  # Left aligned
-    board4_stats_team_label.anchored_position = (board_centers[3] + 5, 2)  # Next to STATS title
-    main_group.append(board4_stats_team_label)
-    
-    board4_player_label = label.Label(SMALLER_FONT, text="", color=TEXT_WHITE, scale=1)
+    board4_player_label = create_slot_label('player', TEXT_WHITE)
     board4_player_label.anchor_point = (0.5, 0.5)  # Center aligned for full width
-    board4_player_label.anchored_position = (board_centers[3], 16)  # Center of board 4, expanded width
-    main_group.append(board4_player_label)
-    
-    board4_stat_label = label.Label(SMALLER_FONT, text="", color=TEXT_GREEN, scale=1)
+    board4_stat_label = create_slot_label('stat', TEXT_GREEN)
     board4_stat_label.anchor_point = (0.5, 1.0)
-    board4_stat_label.anchored_position = (board_centers[3], 30)
-    main_group.append(board4_stat_label)
+    if LAYOUT['stats']:
+        board4_stats_team_label.anchored_position = LAYOUT['stats_team']  # Next to STATS title
+        board4_player_label.anchored_position = LAYOUT['stats_player']  # Center of board 4, expanded width
+        board4_stat_label.anchored_position = LAYOUT['stats_value']
+        main_group.append(board4_stats_team_label)
+        main_group.append(board4_player_label)
+        main_group.append(board4_stat_label)
     
     # Set the display once
     display.root_group = main_group
@@ -1498,7 +2218,7 @@ def setup_display_layout():
 
 def display_stats():
     """Display stats on Board 4 - cycle through up to X performers for DISPLAY_TIME / max_performers second each"""
-    if not current_game_performers or len(current_game_performers) == 0:
+    if not current_game_performers or len(current_game_performers) == 0 or not LAYOUT['stats']:
         return
     
     max_performers = min(5, len(current_game_performers))
@@ -1528,15 +2248,840 @@ def display_stats():
             board4_stats_team_label.color = TEXT_WHITE
         
         # Update labels - stats team header, player name (center), stat bottom
-        board4_stats_team_label.text = team_abbr
-        board4_player_label.text = name
-        board4_stat_label.text = f"{stat_value} {stat_type}"
+        set_fitted_text(board4_stats_team_label, team_abbr, 'stats_team')
+        set_fitted_text(board4_player_label, name, 'player')
+        set_fitted_text(board4_stat_label, f"{stat_value} {stat_type}", 'stat')
+        sample_heap()
         
         # Display for 1 second
-        time.sleep(sleep_time)
+        if not display_wait(sleep_time):
+            return  # A favorite alert takes over
+
+# Grid mode - one game per panel for big slates
+grid_group = None        # Grid scene, built once on first use
+grid_cells = []          # Per panel: (status, away team, away score, home team, home score) labels
+grid_mode_active = False
+
+def setup_grid_layout():
+    """Create the grid scene once: status, teams and scores for each panel"""
+    global grid_group
+    
+    grid_group = displayio.Group()
+    for x, y, w, h in LAYOUT['grid_cells']:
+        status = create_slot_label('grid_status', TEXT_WHITE)
+        status.anchor_point = (0.5, 0.0)
+        status.anchored_position = (x + w // 2, y + 3)
+        
+        cell = [status]
+        for row_y in (y + 13, y + 22):
+            team = create_slot_label('grid_team', TEXT_WHITE)
+            team.anchored_position = (x + 3, row_y)
+            score = create_slot_label('grid_score', TEXT_YELLOW)
+            score.anchor_point = (1.0, 0.0)
+            score.anchored_position = (x + w - 3, row_y)
+            cell.extend((team, score))
+        
+        for cell_label in cell:
+            grid_group.append(cell_label)
+        grid_cells.append(cell)
+
+def show_game_grid(first_game):
+    """Show games starting at index first_game, one per panel, return how many were shown"""
+    if grid_group is None:
+        setup_grid_layout()
+    if display.root_group is not grid_group:
+        display.root_group = grid_group
+    
+    shown = 0
+    for cell in grid_cells:
+        status_label, away_label, away_score_label, home_label, home_score_label = cell
+        game = get_rotation_game(first_game + shown)
+        if game is None:
+            for cell_label in cell:
+                cell_label.text = ""
+            continue
+        
+        status_text, status_color = format_game_status(game)
+        set_fitted_text(status_label, status_text, 'grid_status')
+        status_label.color = status_color
+        
+        away_team = game.get('away_team') or {}
+        home_team = game.get('home_team') or {}
+        for team, team_label, score_label in ((away_team, away_label, away_score_label),
+                                              (home_team, home_label, home_score_label)):
+            abbrev = team.get('abbreviation', '')
+            rank = team.get('rank')
+            team_text = f"#{rank} {abbrev}" if rank is not None else abbrev
+            set_fitted_text(team_label, team_text, 'grid_team', abbreviation=abbrev)
+            team_label.color = get_team_color(abbrev, away_team, home_team) or TEXT_WHITE
+            set_fitted_text(score_label, format_score(team.get('score')), 'grid_score')
+        mark_game_shown(game, time.monotonic())
+        shown += 1
+    
+    return shown
+
+def get_cycle_time(game_count, use_grid):
+    """Return seconds to show game_count games once, in grid or single-game mode"""
+    games_per_scene = len(LAYOUT['grid_cells']) if use_grid else 1
+    return ((game_count + games_per_scene - 1) // games_per_scene) * DISPLAY_TIME
+
+def update_grid_mode():
+    """Turn grid mode on or off based on how many games the slate has"""
+    global grid_mode_active
+    
+    slate_size = len(games)
+    use_grid = (DISPLAY_MODE != 'ticker' and GRID_MODE_THRESHOLD > 0
+                and len(LAYOUT['grid_cells']) > 1 and slate_size > GRID_MODE_THRESHOLD)
+    if use_grid != grid_mode_active:
+        grid_mode_active = use_grid
+        print(f"Grid mode {'on' if use_grid else 'off'}: {slate_size} games, full cycle "
+              f"{get_cycle_time(slate_size, use_grid)}s (single game: {get_cycle_time(slate_size, False)}s)")
+        if not use_grid:
+            display.root_group = main_group
+
+# Rotation scheduler - busier games get more airtime, every game is shown at least once per pass
+LATE_PERIODS = {'NBA': 4, 'WBB': 4, 'NFL': 4, 'CFB': 4, 'NHL': 3, 'MBB': 2, 'SOC': 2, 'MLB': 7}
+CLOSE_MARGINS = {'NBA': 6, 'WBB': 6, 'MBB': 6, 'NFL': 8, 'CFB': 8, 'NHL': 1, 'SOC': 1, 'MLB': 2}
+
+def parse_int(value):
+    """Return value as an int, or None if it isn't a number"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def parse_period_number(period):
+    """Return the period number from strings like 'Q4', '3rd', '2nd Half' or 'OT' (99), or None"""
+    period = str(period or '').upper()
+    if 'OT' in period or 'SO' in period:
+        return 99
+    digits = ''
+    for char in period:
+        if char.isdigit():
+            digits += char
+        elif digits:
+            break
+    return int(digits) if digits else None
+
+def is_favorite_game(game):
+    """Return True if either team is in FAVORITE_TEAMS"""
+    if not FAVORITE_TEAMS:
+        return False
+    for side in ('away_team', 'home_team'):
+        team = game.get(side) or {}
+        for name in (team.get('abbreviation'), team.get('name')):
+            if name and name.upper() in FAVORITE_TEAMS:
+                return True
+    return False
+
+def get_game_weight(game, now):
+    """Return (weight, reasons) for how much airtime a game deserves; 1 is a normal game"""
+    key = get_game_key(game)
+    sport_short = get_sport_short(game.get('sport_display', ''))
+    status = game.get('status', '')
+    reasons = []
+    weight = 1
+    
+    if status == "In Progress":
+        weight = 2
+        reasons.append('live')
+        game_details = game.get('game_details') or {}
+        period = parse_period_number(game_details.get('period'))
+        if period is not None and period >= LATE_PERIODS.get(sport_short, 4):
+            weight += 1
+            reasons.append('late')
+        away_score = parse_int((game.get('away_team') or {}).get('score'))
+        home_score = parse_int((game.get('home_team') or {}).get('score'))
+        if away_score is not None and home_score is not None:
+            if abs(away_score - home_score) <= CLOSE_MARGINS.get(sport_short, 3):
+                weight += 1
+                reasons.append('close')
+    elif status == "Final":
+        # Fresh finals get extra airtime that fades away
+        if key not in final_first_seen:
+            final_first_seen[key] = now
+        age = now - final_first_seen[key]
+        weight = 1 + 0.5 ** (age / FINAL_HALF_LIFE)
+        reasons.append(f"final {age / 60:.0f}m")
+    
+    for side in ('away_team', 'home_team'):
+        rank = parse_int((game.get(side) or {}).get('rank'))
+        if rank is not None and rank <= 25:
+            weight += 0.5
+            reasons.append('ranked')
+    if is_favorite_game(game):
+        weight += 2
+        reasons.append('favorite')
+    
+    return weight, reasons
+
+def build_rotation(now):
+    """Schedule a pass over all known games with a smooth weighted round robin
+
+    Each game gets between 1 and MAX_GAME_SLOTS slots from its weight, and the
+    slots are interleaved so heavy games recur through the pass instead of
+    repeating back to back.
+    """
+    global rotation
+    
+    game_weights.clear()
+    if grid_mode_active:
+        # Grid scenes show games in API order, one per panel
+        rotation = [get_game_key(game) for game in games]
+        return
+    
+    keys = []
+    slots = []
+    for game in games:
+        weight, reasons = get_game_weight(game, now)
+        key = get_game_key(game)
+        game_weights[key] = (weight, reasons)
+        keys.append(key)
+        slots.append(min(MAX_GAME_SLOTS, max(1, int(weight + 0.5))))
+    
+    total = sum(slots)
+    credit = [0] * len(keys)
+    remaining = list(slots)
+    rotation = []
+    for _ in range(total):
+        best = None
+        for index in range(len(keys)):
+            if remaining[index]:
+                credit[index] += slots[index]
+                if best is None or credit[index] > credit[best]:
+                    best = index
+        credit[best] -= total
+        remaining[best] -= 1
+        rotation.append(keys[best])
+    
+    # Bound memory - a final seen again after this just restarts its decay
+    if len(final_first_seen) > 100:
+        final_first_seen.clear()
+
+def count_duplicates():
+    """Return how many extra copies of games the merge removed: games in several collections or pages"""
+    extra = 0
+    for sources in game_pages.values():
+        extra += len(sources) - 1
+    return extra + pass_stats['duplicates']
+
+def start_rotation_pass(now):
+    """Begin a new pass over every known game and report on the last one"""
+    global current_game, pass_start_time
+    
+    wait, key = get_longest_unshown(now)
+    if wait > fairness_stats['worst_wait']:
+        fairness_stats['worst_wait'] = wait
+        fairness_stats['worst_game'] = key
+    if games and pass_start_time is not None:
+        duplicates = count_duplicates()
+        print(f"Rotation pass: {len(rotation)} scenes in {now - pass_start_time:.0f}s "
+              f"({'grid' if grid_mode_active else DISPLAY_MODE} mode), {len(games)} games, "
+              f"{duplicates} duplicates removed ({duplicates * DISPLAY_TIME}s of airtime reclaimed), "
+              f"longest unshown {wait:.0f}s (worst so far {fairness_stats['worst_wait']:.0f}s)")
+        pass_stats['last_duplicates'] = duplicates
+    pass_stats['duplicates'] = 0
+    pass_start_time = now
+    build_rotation(now)
+    current_game = 0
+
+def merge_games(new_games, collection, page, last_page, now):
+    """Merge a fetched page into games by game key, keeping the rotation position
+
+    Known games are updated in place, new ones are added to the end of the
+    current pass, and games that were on this page last time but are gone now
+    are retired. The last page of a collection also retires its pages past
+    the end. A game in several collections or pages (or twice on one) is kept
+    once, with every (collection, page) it came from, and only retired when it
+    is gone from all of them.
+    """
+    global rotation
+    
+    source = (collection, page)
+    updated = 0
+    added = []
+    seen = set()
+    for game in new_games:
+        key = get_game_key(game)
+        if key in seen:
+            pass_stats['duplicates'] += 1  # Twice on one page - don't show it twice
+            continue
+        seen.add(key)
+        if key not in game_pages:
+            game_pages[key] = set()
+        game_pages[key].add(source)
+        # A game already merged from another collection or an unchanged re-poll carries no new clock
+        if key not in game_index or games[game_index[key]] != game:
+            update_clock_model(key, game, now)
+        if key in game_index:
+            games[game_index[key]] = game
+            updated += 1
+        else:
+            game_index[key] = len(games)
+            games.append(game)
+            game_last_shown[key] = now  # Waiting time counts from when the game appeared
+            added.append(key)
+    
+    retired = set()
+    for key, sources in game_pages.items():
+        if key in seen:
+            continue
+        sources.discard(source)
+        if last_page:
+            for gone in [s for s in sources if s[0] == collection and s[1] > page]:
+                sources.discard(gone)
+        if not sources:
+            retired.add(key)
+    retire_games(retired)
+    
+    # New games join the current pass instead of waiting for the next one
+    rotation.extend(added)
+    print(f"Merged {collection} page {page + 1}: {updated} updated, {len(added)} new, {len(retired)} retired")
+
+def retire_games(retired):
+    """Remove games by key, keeping the rotation position"""
+    global current_game, rotation
+    
+    if not retired:
+        return
+    for key in retired:
+        game_pages.pop(key, None)
+        game_last_shown.pop(key, None)
+        game_weights.pop(key, None)
+        clock_models.pop(key, None)
+    games[:] = [game for game in games if get_game_key(game) not in retired]
+    game_index.clear()
+    for index, game in enumerate(games):
+        game_index[get_game_key(game)] = index
+    # Keep the position by counting only the games already shown that are still around
+    shown = [key for key in rotation[:current_game] if key not in retired]
+    rotation = shown + [key for key in rotation[current_game:] if key not in retired]
+    current_game = len(shown)
+
+def mark_game_shown(game, now):
+    """Record that a game was just on screen for the fairness metric"""
+    game_last_shown[get_game_key(game)] = now
+
+def get_longest_unshown(now):
+    """Return (seconds, game key) for the game that has gone longest without being shown"""
+    wait = 0
+    longest = None
+    for key, shown_time in game_last_shown.items():
+        if now - shown_time > wait:
+            wait = now - shown_time
+            longest = key
+    return wait, longest
+
+def get_rotation_game(position):
+    """Return the game at a rotation position, or None past the end"""
+    if position < len(rotation) and rotation[position] in game_index:
+        return games[game_index[rotation[position]]]
+    return None
+
+def get_schedule_info():
+    """Return the current schedule, weights and fairness for the config server"""
+    now = time.monotonic()
+    schedule = []
+    for position, key in enumerate(rotation):
+        game = get_rotation_game(position)
+        if game is None:
+            continue
+        weight, reasons = game_weights.get(key, (1, []))
+        away_team = game.get('away_team') or {}
+        home_team = game.get('home_team') or {}
+        schedule.append({
+            'position': position,
+            'id': key,
+            'matchup': f"{away_team.get('abbreviation', '')} @ {home_team.get('abbreviation', '')}",
+            'status': game.get('status', ''),
+            'weight': round(weight, 2),
+            'reasons': reasons,
+            'sources': sorted(f"{name} p{page + 1}" for name, page in game_pages.get(key, ())),
+        })
+    wait, longest = get_longest_unshown(now)
+    return {
+        'current_position': current_game,
+        'mode': 'grid' if grid_mode_active else DISPLAY_MODE,
+        'favorites': FAVORITE_TEAMS,
+        'longest_unshown_seconds': round(wait),
+        'longest_unshown_game': longest,
+        'worst_unshown_seconds': round(max(wait, fairness_stats['worst_wait'])),
+        'duplicates_removed': {'now': count_duplicates(), 'last_pass': pass_stats['last_duplicates']},
+        'streams': get_stream_info(now),
+        'schedule': schedule,
+    }
+
+# Collection streams - each collection pages through on its own schedule into the shared game set
+def get_due_stream(now):
+    """Return the stream whose next fetch is most overdue, or None if none is due"""
+    due_stream = None
+    for stream in streams:
+        if stream['due'] <= now and (due_stream is None or stream['due'] < due_stream['due']):
+            due_stream = stream
+    return due_stream
+
+def fetch_stream_page(stream, now):
+    """Fetch a stream's next page and merge it into games"""
+    global last_update
+    
+    if stream['next_url'] is None:
+        # Starting a refresh from the first page
+        stream['page'] = 0
+        stream['pending_games'] = 0
+        stream['refresh_start'] = now
+    url = stream['next_url'] or stream['url']
+    new_games, next_url = fetch_sports_data(url)
+    stream['requests'] += 1
+    last_update = now
+    record_fetch(stream, new_games is not None, len(new_games or ()), now, time.monotonic())
+    
+    if new_games is None:
+        # Keep the games we have and try again a little later
+        stream['errors'] += 1
+        stream['next_url'] = None
+        stream['due'] = now + UPDATE_INTERVAL
+        return
+    
+    new_games = [game for game in new_games if game is not None]
+    merge_games(new_games, stream['name'], stream['page'], next_url is None, now)
+    stream['page_urls'][stream['page']] = url
+    stream['pending_games'] += len(new_games)
+    stream['page'] += 1
+    stream['next_url'] = next_url
+    if next_url:
+        stream['due'] = now  # Carry on with the next page
+    else:
+        stream['refreshed_at'] = now
+        stream['games'] = stream['pending_games']
+        stream['due'] = stream['refresh_start'] + stream['interval']
+        print(f"Refreshed {stream['name']}: {stream['games']} games in {stream['page']} pages, "
+              f"{now - stream['refresh_start']:.1f}s, next in {stream['interval']}s")
+    check_favorite_changes(now)
+
+def get_stream_info(now):
+    """Return request counts and data freshness for each stream"""
+    info = []
+    for stream in streams:
+        refreshed_at = stream['refreshed_at']
+        info.append({
+            'collection': stream['name'],
+            'interval': stream['interval'],
+            'games': stream['games'],
+            'requests': stream['requests'],
+            'errors': stream['errors'],
+            'age_seconds': round(now - refreshed_at) if refreshed_at is not None else None,
+        })
+    return info
+
+# Live display state for /api/state - kept up to date as scenes change and pages arrive,
+# so a request only adds ages to what is already here
+STATE_QUEUE_LENGTH = 5  # Upcoming games listed in the state
+display_state = {
+    'scene': None,   # What is on the panel: type, games, since, until
+    'queue': [],     # Upcoming games with the time each is planned for (None in ticker mode)
+    'fetch': None,   # Outcome of the most recent API request
+}
+
+def describe_game(game):
+    """Return the short form of a game used in the display state"""
+    away_team = game.get('away_team') or {}
+    home_team = game.get('home_team') or {}
+    return {
+        'id': get_game_key(game),
+        'matchup': f"{away_team.get('abbreviation', '')} @ {home_team.get('abbreviation', '')}",
+        'score': f"{away_team.get('score', '')}-{home_team.get('score', '')}",
+        'status': game.get('status', ''),
+    }
+
+def set_scene(scene_type, scene_games, now, until, next_position, games_per_scene=1):
+    """Record the scene going up and plan the queue after it from next_position"""
+    display_state['scene'] = {
+        'type': scene_type,
+        'games': [describe_game(game) for game in scene_games],
+        'since': now,
+        'until': until,
+    }
+    queue = []
+    for offset in range(STATE_QUEUE_LENGTH):
+        game = get_rotation_game(next_position + offset)
+        if game is None:
+            break
+        entry = describe_game(game)
+        entry['at'] = until + (offset // games_per_scene) * DISPLAY_TIME if until is not None else None
+        queue.append(entry)
+    display_state['queue'] = queue
+
+def record_fetch(stream, ok, game_count, started, now):
+    """Record the outcome of a stream page request"""
+    display_state['fetch'] = {
+        'collection': stream['name'],
+        'page': stream['page'] + 1,
+        'ok': ok,
+        'games': game_count,
+        'seconds': round(now - started, 2),
+        'at': now,
+    }
+
+def get_state_info():
+    """Return the display state with ages worked out for now"""
+    now = time.monotonic()
+    scene = display_state['scene']
+    if scene is not None:
+        scene = dict(scene)
+        scene['shown_seconds'] = round(now - scene.pop('since'))
+        until = scene.pop('until')
+        scene['remaining_seconds'] = max(0, round(until - now)) if until is not None else None
+    queue = []
+    for entry in display_state['queue']:
+        entry = dict(entry)
+        at = entry.pop('at')
+        entry['in_seconds'] = max(0, round(at - now)) if at is not None else None
+        queue.append(entry)
+    fetch = display_state['fetch']
+    if fetch is not None:
+        fetch = dict(fetch)
+        fetch['age_seconds'] = round(now - fetch.pop('at'))
+    
+    data_streams = []
+    for stream in streams:
+        refreshed_at = stream['refreshed_at']
+        age = round(now - refreshed_at) if refreshed_at is not None else None
+        # Stale once a stream has missed two refreshes (or has never finished one)
+        data_streams.append({'collection': stream['name'], 'age_seconds': age,
+                             'stale': age is None or age > 2 * stream['interval']})
+    ages = [stream['age_seconds'] for stream in data_streams if stream['age_seconds'] is not None]
+    return {
+        'uptime_seconds': round(now - start_time),
+        'mode': 'grid' if grid_mode_active else DISPLAY_MODE,
+        'scene': scene,
+        'queue': queue,
+        'last_fetch': fetch,
+        'data': {
+            'games': len(games),
+            'oldest_age_seconds': max(ages) if ages else None,
+            'stale': not games or any(stream['stale'] for stream in data_streams),
+            'streams': data_streams,
+        },
+    }
+
+# Favorite alerts - favorites' pages are re-polled quickly and changes jump the rotation
+def check_favorite_changes(fetched_at):
+    """Queue an alert if a favorite game's score or status changed since it was last seen"""
+    global favorite_alert
+    
+    for game in games:
+        if not is_favorite_game(game):
+            continue
+        key = get_game_key(game)
+        away_team = game.get('away_team') or {}
+        home_team = game.get('home_team') or {}
+        state = (away_team.get('score'), home_team.get('score'), game.get('status'))
+        previous = favorite_states.get(key)
+        favorite_states[key] = state
+        if previous is not None and previous != state:
+            print(f"Favorite update: {away_team.get('abbreviation', '')} @ {home_team.get('abbreviation', '')} "
+                  f"{state[0]}-{state[1]} {state[2]}")
+            favorite_alert = (key, fetched_at)
+
+def poll_favorites(now):
+    """Re-fetch only the pages holding unfinished favorite games, return True if an alert is waiting"""
+    global last_favorite_poll
+    
+    if not FAVORITE_TEAMS or now - last_favorite_poll < FAVORITE_POLL_INTERVAL:
+        return favorite_alert is not None
+    last_favorite_poll = now
+    
+    stream_names = {}
+    for stream in streams:
+        stream_names[stream['name']] = stream
+    sources = set()
+    for game in games:
+        if is_favorite_game(game) and game.get('status') != "Final":
+            for name, page in game_pages.get(get_game_key(game), ()):
+                if page in stream_names[name]['page_urls']:
+                    sources.add((name, page))
+                    break  # One page with the game is enough
+    for name, page in sources:
+        stream = stream_names[name]
+        fetched_at = time.monotonic()
+        new_games, new_next_page_url = fetch_sports_data(stream['page_urls'][page])
+        stream['requests'] += 1
+        if new_games is not None:
+            new_games = [game for game in new_games if game is not None]
+            merge_games(new_games, name, page, new_next_page_url is None, fetched_at)
+            check_favorite_changes(fetched_at)
+    return favorite_alert is not None
+
+def show_favorite_alert(now):
+    """Show the changed favorite game with a highlighted border, ahead of the rotation"""
+    global favorite_alert, alert_until
+    
+    key, fetched_at = favorite_alert
+    favorite_alert = None
+    if key not in game_index:
+        return
+    game = games[game_index[key]]
+    if display.root_group is not main_group:
+        display.root_group = main_group
+    if background_palette:
+        background_palette[BACKGROUND_BORDER] = FAVORITE_ALERT_COLOR
+    update_game_display(game)
+    mark_game_shown(game, now)
+    alert_until = now + DISPLAY_TIME
+    set_scene('alert', [game], now, alert_until, current_game)
+    
+    latency = time.monotonic() - fetched_at
+    alert_stats['count'] += 1
+    alert_stats['total_latency'] += latency
+    alert_stats['max_latency'] = max(alert_stats['max_latency'], latency)
+    print(f"Favorite alert on panel {latency * 1000:.0f} ms after the fetch that saw it "
+          f"(average {alert_stats['total_latency'] / alert_stats['count'] * 1000:.0f} ms, "
+          f"max {alert_stats['max_latency'] * 1000:.0f} ms over {alert_stats['count']} alerts)")
+
+def end_favorite_alert():
+    """Put the normal border back once an alert scene is done"""
+    if background_palette and background_palette[BACKGROUND_BORDER] != BORDER_COLOR:
+        set_border_color(BORDER_COLOR)
+
+# Ticker mode - each game is prerendered once into a wide strip that crawls across the chain
+TICKER_GAP = 24                 # pixels between consecutive games
+TICKER_STRIP_CACHE_LIMIT = 20   # strips kept in RAM (about 3-6 KB each)
+TICKER_COLORS = [0x000000, TEXT_WHITE, TEXT_YELLOW, TEXT_CYAN, TEXT_GREEN]  # Fixed palette entries
+TICKER_AWAY_COLOR = len(TICKER_COLORS)      # Palette index for the away team color
+TICKER_HOME_COLOR = len(TICKER_COLORS) + 1  # Palette index for the home team color
+TICKER_STATUS_COLOR = len(TICKER_COLORS) + 2
+
+ticker_group = None
+ticker_strips = {}        # Game key -> (line text, TileGrid) so unchanged games are never re-rendered
+ticker_active = []        # TileGrids currently on screen, left to right
+ticker_offset = 0         # Fraction of a pixel carried over to the next frame
+ticker_stats = {'frames': 0, 'total_time': 0, 'max_time': 0, 'late': 0, 'last_frame': 0}
+
+def get_ticker_segments(game):
+    """Return the ticker line for a game as (text, palette index) segments"""
+    sport_short = get_sport_short(game.get('sport_display', ''))
+    away_team = game.get('away_team') or {}
+    home_team = game.get('home_team') or {}
+    status_text, _ = format_game_status(game)
+    segments = [(f"{sport_short}  ", 3)]
+    
+    for team, color_index in ((away_team, TICKER_AWAY_COLOR), (home_team, TICKER_HOME_COLOR)):
+        name = format_pro_team_name(team.get('name', team.get('abbreviation', '')), sport_short)
+        rank = team.get('rank')
+        if rank is not None:
+            segments.append((f"#{rank} ", 3))
+        segments.append((f"{name} ", color_index))
+        segments.append((f"{format_score(team.get('score'))}   ", 2))
+    segments.append((status_text, TICKER_STATUS_COLOR))
+    
+    for performer in (game.get('top_performers') or [])[:3]:
+        name = format_player_name(performer.get('player_name', 'Player'))
+        segments.append((f"   {name} ", 1))
+        segments.append((f"{performer.get('value', '')} {performer.get('stat_category', '')}", 4))
+    
+    return segments
+
+def render_ticker_strip(game):
+    """Return a TileGrid showing the game's ticker line, reusing the cached strip when unchanged"""
+    segments = get_ticker_segments(game)
+    line = ''.join(text for text, _ in segments)
+    key = get_game_key(game)
+    cached = ticker_strips.get(key)
+    if cached and cached[0] == line:
+        return cached[1]
+    
+    width = max(1, sum(measure_text_width(text, FONT) for text, _ in segments))
+    bitmap = displayio.Bitmap(width, get_font_height(FONT), TICKER_STATUS_COLOR + 1)
+    palette = displayio.Palette(TICKER_STATUS_COLOR + 1)
+    for index, color in enumerate(TICKER_COLORS):
+        palette[index] = color
+    palette.make_transparent(0)
+    away_team = game.get('away_team') or {}
+    home_team = game.get('home_team') or {}
+    palette[TICKER_AWAY_COLOR] = hex_to_rgb(away_team.get('color')) or TEXT_WHITE
+    palette[TICKER_HOME_COLOR] = hex_to_rgb(home_team.get('color')) or TEXT_WHITE
+    palette[TICKER_STATUS_COLOR] = format_game_status(game)[1]
+    
+    x = 0
+    for text, color_index in segments:
+        draw_text_into_bitmap(bitmap, FONT, text, x, 0, color_index)
+        x += measure_text_width(text, FONT)
+    
+    strip = displayio.TileGrid(bitmap, pixel_shader=palette)
+    strip.y = (display_height - bitmap.height) // 2
+    if key not in ticker_strips and len(ticker_strips) >= TICKER_STRIP_CACHE_LIMIT:
+        # Drop strips that are not on screen to bound RAM
+        for old_key in list(ticker_strips):
+            if ticker_strips[old_key][1] not in ticker_active:
+                del ticker_strips[old_key]
+    ticker_strips[key] = (line, strip)
+    return strip
+
+def next_ticker_strip():
+    """Return the strip for the next game in the rotation, or None if there is nothing to show"""
+    global current_game, last_change
+    
+    now = time.monotonic()
+    if current_game >= len(rotation):
+        start_rotation_pass(now)
+    game = get_rotation_game(current_game)
+    if game is None:
+        return None
+    cached = ticker_strips.get(get_game_key(game))
+    if cached and cached[1] in ticker_active:
+        # Still crawling across (a one-game slate, or strips shorter than the chain) - keep its
+        # rotation slot and leave a gap until it has scrolled off
+        return None
+    strip = render_ticker_strip(game)
+    mark_game_shown(game, now)
+    current_game += 1
+    last_change = now
+    set_scene('ticker', [game], now, None, current_game)
+    return strip
+
+def report_ticker_stats():
+    """Print frame timing since the last report"""
+    frames = ticker_stats['frames']
+    if frames:
+        average = ticker_stats['total_time'] / frames
+        print(f"Ticker: {1 / average if average else 0:.1f} fps average (target {TICKER_FPS}), "
+              f"max frame {ticker_stats['max_time'] * 1000:.0f} ms, {ticker_stats['late']} late of {frames} frames")
+    ticker_stats['frames'] = 0
+    ticker_stats['total_time'] = 0
+    ticker_stats['max_time'] = 0
+    ticker_stats['late'] = 0
+
+def ticker_step(now):
+    """Advance the crawl to where it should be at time now, return seconds until the next frame"""
+    global ticker_group, ticker_offset
+    
+    frame_time = 1 / TICKER_FPS
+    if ticker_group is None:
+        ticker_group = displayio.Group()
+    if display.root_group is not ticker_group:
+        display.root_group = ticker_group
+    
+    # Frame timing: how long since the last frame and whether it missed its slot
+    interval = frame_time
+    if ticker_stats['last_frame']:
+        interval = now - ticker_stats['last_frame']
+        ticker_stats['frames'] += 1
+        ticker_stats['total_time'] += interval
+        ticker_stats['max_time'] = max(ticker_stats['max_time'], interval)
+        if interval > frame_time * 1.5:
+            ticker_stats['late'] += 1
+    ticker_stats['last_frame'] = now
+    
+    # Move by elapsed time so the crawl speed stays steady when a frame is a little late,
+    # but don't jump across the screen after a long pause like a page fetch
+    ticker_offset += min(interval, frame_time * 3) * TICKER_SPEED
+    step = int(ticker_offset)
+    ticker_offset -= step
+    if step:
+        # Only the TileGrid positions change - the strip bitmaps are never redrawn while scrolling
+        for strip in ticker_active:
+            strip.x -= step
+    
+    # Drop strips that have scrolled off the left edge
+    while ticker_active and ticker_active[0].x + ticker_active[0].bitmap.width < 0:
+        ticker_group.remove(ticker_active.pop(0))
+        report_ticker_stats()
+    
+    # Queue the next game once the last one has fully entered with a gap behind it
+    if not ticker_active or ticker_active[-1].x + ticker_active[-1].bitmap.width + TICKER_GAP <= display_width:
+        strip = next_ticker_strip()
+        if strip is not None:
+            strip.x = ticker_active[-1].x + ticker_active[-1].bitmap.width + TICKER_GAP if ticker_active else display_width
+            ticker_group.append(strip)
+            ticker_active.append(strip)
+    
+    return max(0, frame_time - (time.monotonic() - now))
+
+# Settings changed on the config server that apply without a restart
+def update_streams(new_streams):
+    """Switch to a new set of collection streams, keeping the state of unchanged ones"""
+    global streams
+    
+    old_streams = {}
+    for stream in streams:
+        old_streams[stream['name']] = stream
+    kept = []
+    for stream in new_streams:
+        old = old_streams.pop(stream['name'], None)
+        if old is not None and old['url'] == stream['url']:
+            old['interval'] = stream['interval']
+            stream = old
+        kept.append(stream)  # New or changed streams are due right away
+    streams = kept
+    
+    # Games only the removed collections had are retired
+    retired = set()
+    for key, sources in game_pages.items():
+        for source in [s for s in sources if s[0] in old_streams]:
+            sources.discard(source)
+        if not sources:
+            retired.add(key)
+    retire_games(retired)
+
+def apply_settings(changes):
+    """Apply changed settings to the running display, return the names that were applied"""
+    global TIMEZONE, UTC_OFFSET, DISPLAY_TIME, FAVORITE_TEAMS, API_BASE, COLLECTIONS, API_URL
+    
+    applied = []
+    if 'timezone' in changes:
+        TIMEZONE = changes['timezone']
+        UTC_OFFSET = TIMEZONE_OFFSETS.get(TIMEZONE, -7)
+        applied.append('timezone')
+    if 'display_time' in changes:
+        try:
+            DISPLAY_TIME = max(1, int(changes['display_time']))
+            applied.append('display_time')
+        except (TypeError, ValueError):
+            print(f"Invalid display time: {changes['display_time']}")
+    if 'favorites' in changes:
+        FAVORITE_TEAMS = parse_favorites(changes['favorites'])
+        applied.append('favorites')
+    if 'collections' in changes or 'api_url' in changes:
+        API_BASE = changes.get('api_url', API_BASE)
+        COLLECTIONS = changes.get('collections', COLLECTIONS)
+        API_URL = build_api_url()
+        update_streams(build_streams())
+        applied.extend(name for name in ('collections', 'api_url') if name in changes)
+    if applied:
+        print(f"Applied settings without restart: {', '.join(applied)}")
+    return applied
+
+def display_wait(seconds):
+    """Wait while a game is shown, keeping short-lived display effects updated
+
+    Returns False if a favorite alert cut the wait short.
+    """
+    end_time = time.monotonic() + seconds
+    while True:
+        now = time.monotonic()
+        record_loop_lag()
+        game_score_label.tick(now)
+        refresh_live_clock(now)
+        if poll_favorites(now):
+            return False
+        if now >= end_time:
+            return True
+        sample_health()
+        loop_sleep(min(0.1, end_time - now))
 
 # Create the display layout once
 setup_display_layout()
+if DEBUG_LAYOUT:
+    # Off by default: measuring pauses auto-refresh while it redraws the frame
+    print(f"Display layout: {count_display_nodes(display.root_group)} group nodes, {measure_refresh_time():.1f} ms per full refresh")
+
+# Let the config server inspect display state
+if config_server:
+    setup.display_hooks['schedule'] = get_schedule_info
+    setup.display_hooks['apply_settings'] = apply_settings
+    setup.display_hooks['screenshot'] = screenshot_bmp
+    setup.display_hooks['state'] = get_state_info
+
 # Main loop
 while True:
     current_time = time.monotonic()
@@ -1544,48 +3089,69 @@ while True:
     # Poll configuration server if available
     if wifi_connected and config_server:
         try:
-            result = config_server.poll()
+            # Bounded: slow or piled-up requests get cut off or a 503 instead of stalling the display
+            setup.poll_server(config_server)
         except Exception as poll_error:
             print(f"Config server poll error: {poll_error}")
+        # Saving new WiFi settings restarts once the response has gone out
+        setup.check_pending_reset()
     elif wifi_connected:
         # Debug: why isn't config_server available?
         if current_time - last_update < 10:  
             print(f"Config server not available: config_server={config_server}")
 
-    timeout = min(len(games) * DISPLAY_TIME + 1, UPDATE_INTERVAL*3)  # Dynamic timeout when no more pages
-        
-    need_new_data = (
-        len(games) == 0 or  # No games loaded yet
-        (current_game >= len(games) and next_page_url and current_time - last_change >= DISPLAY_TIME) or  # Ready for next page
-        (not next_page_url and current_time - last_update >= timeout)  or # Dynamic timeout only when no next page
-        (current_time - last_update >= UPDATE_INTERVAL * 4)  # fallback max timeout
-    )
-    
-    if need_new_data:
-        url_to_fetch = next_page_url if next_page_url else None
-        new_games, new_next_page_url = fetch_sports_data(url_to_fetch)
-        
-        if new_games:
-            # Filter out any None games to prevent crashes
-            games = [game for game in new_games if game is not None]
-            next_page_url = new_next_page_url
-            current_game = 0
-            last_update = current_time
+    # Fetch at most one page per loop so the display keeps moving
+    stream = get_due_stream(current_time)
+    if stream is not None:
+        had_games = bool(games)
+        fetch_stream_page(stream, current_time)
+        update_grid_mode()
+        if games and not had_games:
             # Force immediate display by resetting the timer to trigger cycling logic
             last_change = current_time - DISPLAY_TIME
-        else:
-            # If no new games and we have a next_page_url, reset to beginning
-            if next_page_url:
-                next_page_url = None
+    
+    record_loop_lag()
+    game_score_label.tick(current_time)
+    refresh_live_clock(current_time)
+    poll_favorites(current_time)
+    sample_health()
     
     # Show next game
-    if games and current_time - last_change >= DISPLAY_TIME:
-        if current_game < len(games) and games[current_game] is not None:
-            update_game_display(games[current_game])
-            display_stats()
+    frame_wait = 0.1
+    if favorite_alert is not None:
+        # Preempt the rotation; it picks up where it was once the alert has been up for DISPLAY_TIME
+        timed_render('alert', show_favorite_alert, current_time)
+        last_change = current_time
+    elif DISPLAY_MODE == 'ticker':
+        if current_time >= alert_until:
+            end_favorite_alert()
+            frame_wait = timed_render('ticker', ticker_step, current_time) if games else 0.1
+    elif games and current_time - last_change >= DISPLAY_TIME:
+        end_favorite_alert()
+        if current_game >= len(rotation):
+            start_rotation_pass(current_time)  # Shown everything in this pass, go around again
+        if grid_mode_active:
+            # One game per panel - no stats, the whole scene stays up for DISPLAY_TIME
+            shown = max(1, timed_render('grid', show_game_grid, current_game))
+            scene_games = [get_rotation_game(current_game + offset) for offset in range(shown)]
+            set_scene('grid', [game for game in scene_games if game is not None],
+                      current_time, current_time + DISPLAY_TIME, current_game + shown, len(grid_cells))
+            current_game += shown
         else:
-            print(f"DEBUG: Skipping game {current_game} - out of range or None")
-        current_game = current_game + 1  # Remove modulo - let pagination logic handle wraparound
+            game = get_rotation_game(current_game)
+            if game is not None:
+                if display.root_group is not main_group:
+                    display.root_group = main_group
+                start_heap_tracking()
+                timed_render('game', update_game_display, game)
+                mark_game_shown(game, current_time)
+                set_scene('game', [game], current_time, current_time + DISPLAY_TIME, current_game + 1)
+                sample_heap()
+                display_stats()
+                report_heap_tracking()
+            else:
+                print(f"DEBUG: Skipping game {current_game} - out of range or None")
+            current_game = current_game + 1  # Remove modulo - let pagination logic handle wraparound
         last_change = current_time
     
-    time.sleep(0.1)  # Reduced sleep time since stats function handles its own timing
+    loop_sleep(frame_wait)  # Next ticker frame, or a short nap since stats function handles its own timing
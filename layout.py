@@ -0,0 +1,108 @@
+# Screen layout computed from the LED panel geometry
+#
+# Kept apart from code.py, which needs the display hardware, so the layout for
+# any chain of panels can be checked on a computer (see tests/test_layout.py).
+# Everything here is plain arithmetic on the panel size and count.
+
+def compute_layout(matrix_width, matrix_height, chain_across, tile_down):
+    """Compute every screen region and position from the panel geometry
+    
+    Regions are (x, y, width, height) tuples, or None when the chain has no room:
+      1 row, 4+ panels:   sport | matchup (all middle panels) | stats
+      1 row, 3 panels:    matchup (2 panels) | stats
+      1 row, 1-2 panels:  matchup only
+      2+ rows:            matchup across the top row, sport and stats on the second row
+    Positions are relative to the region they belong to, so the game scene looks
+    the same on every supported chain. Computed once at boot.
+    """
+    width = matrix_width * chain_across
+    height = matrix_height * tile_down
+    
+    sport = None
+    stats = None
+    if tile_down >= 2:
+        matchup = (0, 0, width, matrix_height)
+        stats = (width - matrix_width, matrix_height, matrix_width, matrix_height)
+        if chain_across >= 2:
+            sport = (0, matrix_height, matrix_width, matrix_height)
+    elif chain_across >= 4:
+        sport = (0, 0, matrix_width, matrix_height)
+        matchup = (matrix_width, 0, width - 2 * matrix_width, matrix_height)
+        stats = (width - matrix_width, 0, matrix_width, matrix_height)
+    elif chain_across == 3:
+        matchup = (0, 0, 2 * matrix_width, matrix_height)
+        stats = (2 * matrix_width, 0, matrix_width, matrix_height)
+    else:
+        matchup = (0, 0, width, matrix_height)
+    
+    layout = {
+        'width': width,
+        'height': height,
+        'sport': sport,
+        'matchup': matchup,
+        'stats': stats,
+        # Each panel row gets top and bottom borders
+        'border_rows': [row * matrix_height for row in range(tile_down)],
+    }
+    
+    if sport:
+        x, y, w, h = sport
+        layout['league_logo'] = (x + 1, y + h // 2 - 14)   # Just clear of the left border
+        layout['sport_label'] = (x + w, y + h // 2)        # Right aligned against the matchup
+    
+    # Matchup: team logos either side of center with status, abbreviations and score between
+    x, y, w, h = matchup
+    center_x = x + w // 2
+    middle_y = y + h // 2
+    layout['matchup_center'] = (center_x, middle_y)
+    layout['home_logo'] = (center_x - 62, middle_y - 14)   # Logos are ~27px tall after scaling
+    layout['away_logo'] = (center_x + 30, middle_y - 14)
+    layout['home_logo_label'] = (center_x - 52, middle_y)  # Text fallbacks when no logo is available
+    layout['away_logo_label'] = (center_x + 52, middle_y)
+    layout['away_abbrev'] = (center_x - 8, middle_y + 2)
+    layout['vs'] = (center_x, middle_y + 2)
+    layout['home_abbrev'] = (center_x + 8, middle_y + 2)
+    layout['away_rank'] = (center_x - 15, middle_y - 1)
+    layout['home_rank'] = (center_x + 15, middle_y - 1)
+    layout['period'] = (center_x, y + 2)
+    layout['score'] = (center_x, y + h)
+    layout['matchup_text_width'] = min(60, w - 4)          # Between the team logos
+    
+    if stats:
+        x, y, w, h = stats
+        center_x = x + w // 2
+        layout['stats_title'] = (center_x - 28, y + 2)
+        layout['stats_team'] = (center_x + 5, y + 2)
+        layout['stats_player'] = (center_x, y + h // 2)
+        layout['stats_value'] = (center_x, y + h - 2)
+    # Stats text widths are sized for one panel even when there is no stats region,
+    # so the (unused) labels can still be created
+    layout['stats_text_width'] = matrix_width - 2          # Inside the panel borders
+    layout['stats_team_width'] = matrix_width // 2 - 6
+    
+    # Grid mode: one game per panel
+    layout['grid_cells'] = [(col * matrix_width, row * matrix_height, matrix_width, matrix_height)
+                            for row in range(tile_down) for col in range(chain_across)]
+    layout['grid_status_width'] = matrix_width - 4         # Status line across the panel
+    layout['grid_team_width'] = matrix_width // 2          # Rank and abbreviation on the left
+    layout['grid_score_width'] = matrix_width - 8 - matrix_width // 2  # Score on the right, 2px clear of the team
+    
+    # Startup screens: branding on the first panel, details from the second panel on,
+    # update notice on the last panel of the top row (or of the second row on short chains)
+    layout['info_x'] = matrix_width + 4 if chain_across >= 2 else 4
+    if chain_across >= 4:
+        layout['update_notice'] = (width - matrix_width + 11, 0)
+    elif tile_down >= 2:
+        layout['update_notice'] = (width - matrix_width + 11, matrix_height)
+    else:
+        layout['update_notice'] = None
+    # Setup screen: instructions on the left, network details in a second column
+    # (below the instructions when the chain is too narrow for two columns)
+    if width >= 4 * matrix_width:
+        layout['setup_details'] = (matrix_width + 56, 0)
+    elif tile_down >= 2:
+        layout['setup_details'] = (2, matrix_height)
+    else:
+        layout['setup_details'] = None
+    
+    return layout
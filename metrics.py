@@ -0,0 +1,91 @@
+# In-process metrics registry, exported in Prometheus text format by setup.py's /metrics
+#
+# code.py records counters, gauges and histograms as it runs; the config server
+# formats them on request. Recording is a dict lookup and an add, so it is cheap
+# enough for the render loop. Gauges that are only worth reading when scraped
+# (RSSI, free memory) are filled in by collectors just before formatting.
+
+PREFIX = 'sports_display_'
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (1024, 4096, 16384, 32768, 65536, 131072, 262144)
+
+_metrics = {}     # Name -> {'kind', 'help', 'buckets', 'samples': {labels: value}}
+_collectors = []  # Functions called before formatting to update scrape-time gauges
+
+def describe(name, kind, help_text, buckets=None):
+    """Register a metric; kind is 'counter', 'gauge' or 'histogram'"""
+    if name not in _metrics:
+        _metrics[name] = {'kind': kind, 'help': help_text, 'buckets': buckets or TIME_BUCKETS, 'samples': {}}
+
+def label_key(labels):
+    """Return labels as a sorted tuple, usable as a dict key"""
+    return tuple(sorted(labels.items())) if labels else ()
+
+def inc(name, amount=1, **labels):
+    """Add amount to a counter"""
+    samples = _metrics[name]['samples']
+    key = label_key(labels)
+    samples[key] = samples.get(key, 0) + amount
+
+def set_gauge(name, value, **labels):
+    """Set a gauge to value"""
+    _metrics[name]['samples'][label_key(labels)] = value
+
+def observe(name, value, **labels):
+    """Add one observation to a histogram"""
+    metric = _metrics[name]
+    key = label_key(labels)
+    sample = metric['samples'].get(key)
+    if sample is None:
+        # Per-bucket counts (not cumulative), then the running sum and count
+        sample = [0] * (len(metric['buckets']) + 1) + [0, 0]
+        metric['samples'][key] = sample
+    buckets = metric['buckets']
+    index = 0
+    while index < len(buckets) and value > buckets[index]:
+        index += 1
+    sample[index] += 1
+    sample[-2] += value
+    sample[-1] += 1
+
+def add_collector(collector):
+    """Call collector() before every export, to set gauges that are read on demand"""
+    _collectors.append(collector)
+
+def format_labels(key, extra=None):
+    """Return Prometheus label text for a label tuple, e.g. {scene="game"}"""
+    pairs = list(key)
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for name, value in pairs) + '}'
+
+def format_number(value):
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+def export():
+    """Yield the registry in Prometheus text format, one metric family at a time"""
+    for collector in _collectors:
+        try:
+            collector()
+        except Exception as e:
+            print(f"Metrics collector error: {e}")
+    for name in sorted(_metrics):
+        metric = _metrics[name]
+        full_name = PREFIX + name
+        lines = [f"# HELP {full_name} {metric['help']}", f"# TYPE {full_name} {metric['kind']}"]
+        for key, sample in metric['samples'].items():
+            if metric['kind'] != 'histogram':
+                lines.append(f"{full_name}{format_labels(key)} {format_number(sample)}")
+                continue
+            total = 0
+            for bound, count in zip(metric['buckets'], sample):
+                total += count
+                lines.append(f"{full_name}_bucket{format_labels(key, ('le', bound))} {total}")
+            lines.append(f"{full_name}_bucket{format_labels(key, ('le', '+Inf'))} {sample[-1]}")
+            lines.append(f"{full_name}_sum{format_labels(key)} {format_number(sample[-2])}")
+            lines.append(f"{full_name}_count{format_labels(key)} {sample[-1]}")
+        yield '\n'.join(lines) + '\n'
@@ -0,0 +1,294 @@
+# Reader/writer for CircuitPython's settings.toml
+#
+# settings.toml only holds top-level KEY = value lines (strings and integers) and
+# comments, so this is not a general TOML parser. The file is kept in memory as
+# its list of lines plus an index from key to line, so saving rewrites only the
+# values of changed keys - unknown keys, key order and comments stay as they were.
+# Saves write a temp file and rename it over settings.toml, so a reset or a full
+# disk mid-write never leaves a half-written settings file behind.
+#
+# code.py and setup.py share this one cached copy. snapshot() hands out a
+# read-only view that is only rebuilt when the file changes, so repeated reads
+# cost no file I/O beyond an occasional stat to notice edits made elsewhere.
+
+import os
+import time
+
+SETTINGS_FILE = 'settings.toml'
+KEY_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-'
+ESCAPES = {'"': '"', '\\': '\\', 'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f'}
+CHECK_INTERVAL = 2  # Seconds between checks for outside edits, so busy readers don't stat every call
+
+_path = None       # File the cache was loaded from
+_lines = []        # Lines of the file, without line endings
+_index = {}        # Key -> line number in _lines
+_values = {}       # Key -> parsed value (str or int)
+_spans = {}        # Key -> (start, end) columns of the value text in its line
+_top_level_end = 0  # Line number of the first [table] header, new keys go before it
+_stamp = None      # (size, mtime) of the file when it was last loaded or saved
+_checked_at = None  # When _stamp was last compared with the file
+_version = 0       # Bumped on every change to the model
+_snapshot = None   # Snapshot of the current version, built on demand
+
+class Snapshot:
+    """Read-only view of the settings as they were at one version"""
+
+    def __init__(self, values, version):
+        self._values = values
+        self.version = version
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def keys(self):
+        return self._values.keys()
+
+    def items(self):
+        return self._values.items()
+
+def parse_string(text, start):
+    """Parse a quoted TOML string starting at text[start], return (value, end column)"""
+    quote = text[start]
+    i = start + 1
+    if quote == "'":
+        end = text.find("'", i)
+        if end < 0:
+            raise ValueError("unterminated string")
+        return text[i:end], end + 1
+    chars = []
+    while i < len(text):
+        c = text[i]
+        if c == '"':
+            return ''.join(chars), i + 1
+        if c == '\\':
+            code = text[i + 1:i + 2]
+            if code in ESCAPES:
+                chars.append(ESCAPES[code])
+                i += 2
+                continue
+            if code in ('u', 'U'):
+                digits = 4 if code == 'u' else 8
+                chars.append(chr(int(text[i + 2:i + 2 + digits], 16)))
+                i += 2 + digits
+                continue
+            raise ValueError(f"bad escape \\{code}")
+        chars.append(c)
+        i += 1
+    raise ValueError("unterminated string")
+
+def parse_line(line):
+    """Return (key, value, value start, value end) for a KEY = value line, or None"""
+    text = line.strip()
+    if not text or text[0] in '#[':
+        return None
+    equals = line.find('=')
+    if equals < 0:
+        return None
+    key = line[:equals].strip()
+    if not key or any(c not in KEY_CHARS for c in key):
+        return None
+    start = equals + 1
+    while start < len(line) and line[start] in ' \t':
+        start += 1
+    if start < len(line) and line[start] in '"\'':
+        value, end = parse_string(line, start)
+        return key, value, start, end
+    end = line.find('#', start)
+    if end < 0:
+        end = len(line)
+    while end > start and line[end - 1] in ' \t':
+        end -= 1
+    raw = line[start:end]
+    try:
+        value = int(raw.replace('_', ''), 0)
+    except ValueError:
+        value = raw  # Anything else (true, 1.5, arrays) is kept as written
+    return key, value, start, end
+
+def format_value(value):
+    """Return value as TOML text: integers bare, everything else as a basic string"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    chars = []
+    for c in str(value):
+        if c == '"' or c == '\\':
+            chars.append('\\' + c)
+        elif c == '\n':
+            chars.append('\\n')
+        elif c == '\t':
+            chars.append('\\t')
+        elif ord(c) < 0x20 or ord(c) == 0x7f:
+            chars.append(f'\\u{ord(c):04x}')
+        else:
+            chars.append(c)
+    return '"' + ''.join(chars) + '"'
+
+def recover(path):
+    """Finish a save that was interrupted between its renames"""
+    try:
+        os.stat(path)
+        return
+    except OSError:
+        pass
+    try:
+        os.rename(path + '.bak', path)
+        print(f"Recovered {path} from an interrupted save")
+    except OSError:
+        pass
+
+def file_stamp(path):
+    """Return (size, mtime) of path, or None if it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    # Size as well as mtime: without a set clock FAT timestamps may never change
+    return stat[6], stat[8]
+
+def load(path=SETTINGS_FILE):
+    """Read path into the in-memory model, return the number of keys; a missing file loads as empty"""
+    global _path, _lines, _index, _values, _spans, _top_level_end
+    global _stamp, _checked_at, _version, _snapshot
+    recover(path)
+    stamp = file_stamp(path)
+    try:
+        with open(path, 'r') as f:
+            content = f.read()
+    except OSError:
+        content = ''
+    lines = content.split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+    index, values, spans = {}, {}, {}
+    top_level_end = len(lines)
+    for number, line in enumerate(lines):
+        if line.strip().startswith('['):
+            # Keys in [tables] aren't visible to os.getenv, so leave them alone
+            top_level_end = number
+            while top_level_end > 0 and not lines[top_level_end - 1].strip():
+                top_level_end -= 1
+            break
+        try:
+            parsed = parse_line(line)
+        except ValueError as e:
+            print(f"{path} line {number + 1} skipped: {e}")
+            continue
+        if parsed:
+            key, value, start, end = parsed
+            index[key] = number
+            values[key] = value
+            spans[key] = (start, end)
+    _path, _lines, _index, _values, _spans, _top_level_end = path, lines, index, values, spans, top_level_end
+    _stamp, _checked_at = stamp, time.monotonic()
+    _version += 1
+    _snapshot = None
+    return len(values)
+
+def ensure_loaded():
+    if _path is None:
+        load()
+
+def refresh():
+    """Reload if the file was changed by someone else, return True if it was reloaded"""
+    global _checked_at
+    if _path is None:
+        load()
+        return True
+    now = time.monotonic()
+    if now - _checked_at < CHECK_INTERVAL:
+        return False
+    _checked_at = now
+    if file_stamp(_path) == _stamp:
+        return False
+    print(f"{_path} changed, reloading settings")
+    load(_path)
+    return True
+
+def snapshot():
+    """Return a read-only Snapshot of the current settings, shared until they change"""
+    global _snapshot
+    refresh()
+    if _snapshot is None:
+        _snapshot = Snapshot(dict(_values), _version)
+    return _snapshot
+
+def get(key, default=None):
+    """Return the value of key from the cached model"""
+    ensure_loaded()
+    return _values.get(key, default)
+
+def get_all():
+    """Return a copy of every key and value in the cached model"""
+    ensure_loaded()
+    return dict(_values)
+
+def update(changes):
+    """Set keys in the cached model, return the keys whose value changed; call save() to write them"""
+    global _top_level_end, _version, _snapshot
+    ensure_loaded()
+    changed = []
+    for key, value in changes.items():
+        if any(c not in KEY_CHARS for c in key):
+            raise ValueError(f"invalid key {key!r}")
+        if key in _values and _values[key] == value and type(_values[key]) == type(value):
+            continue
+        text = format_value(value)
+        if key in _index:
+            # Replace only the value so the key's spacing and trailing comment stay
+            number = _index[key]
+            start, end = _spans[key]
+            line = _lines[number]
+            _lines[number] = line[:start] + text + line[end:]
+            _spans[key] = (start, start + len(text))
+        else:
+            line = f"{key} = {text}"
+            number = _top_level_end
+            _lines.insert(number, line)
+            for other in _index:
+                if _index[other] >= number:
+                    _index[other] += 1
+            _top_level_end += 1
+            _index[key] = number
+            _spans[key] = (len(key) + 3, len(line))
+        _values[key] = value
+        changed.append(key)
+    if changed:
+        _version += 1
+        _snapshot = None
+    return changed
+
+def save():
+    """Write the cached model back to its file through a temp file and rename"""
+    global _stamp, _checked_at
+    ensure_loaded()
+    path = _path
+    temp = path + '.tmp'
+    with open(temp, 'w') as f:
+        f.write('\n'.join(_lines) + '\n')
+    try:
+        os.rename(temp, path)
+    except OSError:
+        # FAT won't rename over an existing file, so move the old one aside first;
+        # load() puts it back if we reset between these renames
+        backup = path + '.bak'
+        try:
+            os.remove(backup)
+        except OSError:
+            pass
+        os.rename(path, backup)
+        os.rename(temp, path)
+        os.remove(backup)
+    # Our own write shouldn't look like an outside edit
+    _stamp, _checked_at = file_stamp(path), time.monotonic()
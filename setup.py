@@ -6,178 +6,402 @@ import socketpool
 import microcontroller
 import time
 import os
+import settings_store
+import metrics
 
 # Version info (keep in sync with code.py)
 VERSION = "1.0.0"
 GITHUB_REPO = "kevinfenger/ticker"
 
+# The setup page is a static file gzipped on the computer (tools/build_web.py) and sent
+# in chunks as-is, so the page is never built or held in RAM on the device
+WEB_ROOT = "/web"
+SETUP_PAGE = "setup.html.gz"
+WEB_CHUNK_SIZE = 1024
+NOT_MODIFIED_304 = (304, "Not Modified")
+BAD_REQUEST_400 = (400, "Bad Request")
+INTERNAL_SERVER_ERROR_500 = (500, "Internal Server Error")
+
+# Settings code.py can apply while running; anything else (WiFi) needs a restart
+SETTINGS_FIELDS = ('wifi_ssid', 'wifi_password', 'collections', 'timezone', 'api_url', 'favorites', 'display_time')
+HOT_SETTINGS = ('collections', 'timezone', 'api_url', 'favorites', 'display_time')
+RESTART_DELAY = 3  # Seconds to let the response reach the browser before resetting
+SCREENSHOT_INTERVAL = 10  # Minimum seconds between screenshots, each one pauses rendering briefly
+TOO_MANY_REQUESTS_429 = (429, "Too Many Requests")
+
+# Limits that keep the config server from stalling the display's main loop
+SERVER_TICK_BUDGET = 0.03      # Seconds of request handling per main loop tick before shedding
+SERVER_MAX_CONNECTIONS = 3     # Connections accepted per tick; the rest wait in the listen backlog
+SERVER_SOCKET_TIMEOUT = 0.5    # Seconds a single socket read or write may block
+REQUEST_RECEIVE_TIME = 0.1     # Seconds to receive a request's headers, however slowly they trickle in
+BODY_RECEIVE_TIME = 1.0        # Seconds to receive a request body once its headers are in
+SHED_RECEIVE_TIME = 0.05       # Seconds to receive a request that is only going to get a 503
+SETUP_RECEIVE_TIME = 5         # Headers and body deadline in setup mode, where there's no display to hold up
+SERVICE_UNAVAILABLE_503 = (503, "Service Unavailable")
+REQUEST_TIMEOUT_408 = (408, "Request Timeout")
+
+pending_reset_at = None  # When a scheduled restart is due
+last_screenshot_at = None  # When /screenshot.bmp last sent an image
+
 try:
-    from adafruit_httpserver import Server, Request, Response, GET, POST
+    from adafruit_httpserver import Server, Request, Response, FileResponse, ChunkedResponse, GET, POST, PATCH
+    from adafruit_httpserver import NO_REQUEST, CONNECTION_TIMED_OUT
     HTTPSERVER_AVAILABLE = True
 except ImportError:
     print("adafruit_httpserver not available - using simple socket server")
     HTTPSERVER_AVAILABLE = False
 
-def url_decode(url):
-    """Decodes a percent-encoded URL string."""
-    # First replace + with spaces (URL form encoding)
-    url = url.replace('+', ' ')
-    
-    l = len(url)
-    data = bytearray()
-    i = 0
-    while i < l:
-        if url[i] != '%':
-            d = ord(url[i])
-            i += 1
+metrics.describe('config_requests_total', 'counter', 'Config server connections by result')
+metrics.describe('config_poll_seconds', 'histogram', 'Time the config server held the main loop in one tick')
+
+if HTTPSERVER_AVAILABLE:
+    class GuardedServer(Server):
+        """Server that bounds how long one request can hold up the display
+
+        Receiving a request stops at a deadline however slowly the client sends it, and
+        while shedding is set requests get a fast 503 instead of running their handler.
+        A body cut off by its deadline gets a 408, so handlers never see part of a form.
+        """
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.shedding = False
+            self.receive_deadline = None
+            self.header_receive_time = REQUEST_RECEIVE_TIME
+            self.body_receive_time = BODY_RECEIVE_TIME
+            self.body_incomplete = False
+
+        def _receive_request(self, sock, client_address):
+            self.receive_deadline = time.monotonic() + (SHED_RECEIVE_TIME if self.shedding else self.header_receive_time)
+            self.body_incomplete = False
+            try:
+                return super()._receive_request(sock, client_address)
+            finally:
+                sock.settimeout(self._timeout)  # Back to the normal timeout for sending the response
+
+        def _receive_until(self, sock, received_bytes, done):
+            """Read from sock into received_bytes until done(received_bytes), a timeout or the deadline"""
+            while not done(received_bytes):
+                remaining = self.receive_deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Each read may only wait until the deadline, not a full socket timeout
+                sock.settimeout(min(remaining, self._timeout))
+                try:
+                    length = sock.recv_into(self._buffer, len(self._buffer))
+                except OSError:
+                    break  # Timed out (or the client went away) - handle what arrived
+                if not length:
+                    break
+                received_bytes += self._buffer[:length]
+            return received_bytes
+
+        def _receive_header_bytes(self, sock):
+            received = self._receive_until(sock, b"", lambda received: b"\r\n\r\n" in received)
+            # Incomplete headers can't be parsed - nothing received makes poll() close it as timed out
+            return received if b"\r\n\r\n" in received else b""
+
+        def _receive_body_bytes(self, sock, received_body_bytes, content_length):
+            if not self.shedding and len(received_body_bytes) < content_length:
+                # A form post over a weak link takes longer than its headers, so the body gets its own deadline
+                self.receive_deadline = time.monotonic() + self.body_receive_time
+            received = self._receive_until(sock, received_body_bytes, lambda received: len(received) >= content_length)
+            self.body_incomplete = len(received) < content_length
+            return received[:content_length]
+
+        def _handle_request(self, request, handler):
+            if self.shedding:
+                return Response(request, "Display is busy, try again shortly", content_type="text/plain",
+                                status=SERVICE_UNAVAILABLE_503, headers={"Retry-After": "1"})
+            if self.body_incomplete:
+                # Part of a form would save defaults over the settings that didn't arrive
+                return Response(request, "Request body did not arrive in time, please try again",
+                                content_type="text/plain", status=REQUEST_TIMEOUT_408)
+            return super()._handle_request(request, handler)
+
+def poll_server(server):
+    """Handle waiting connections within SERVER_TICK_BUDGET, return how many were handled
+
+    Once the budget is spent, connections still waiting get a fast 503, up to
+    SERVER_MAX_CONNECTIONS per tick; anything beyond that waits for the next tick.
+    """
+    start = time.monotonic()
+    handled = 0
+    try:
+        while handled < SERVER_MAX_CONNECTIONS:
+            if not server.shedding and time.monotonic() - start >= SERVER_TICK_BUDGET:
+                server.shedding = True
+            shedding = server.shedding
+            try:
+                result = server.poll()
+            except OSError as e:
+                # The client went away mid-response; the server has closed its socket
+                print(f"Config server connection error: {e}")
+                metrics.inc('config_requests_total', result='error')
+                break
+            if result == NO_REQUEST:
+                break
+            handled += 1
+            if result == CONNECTION_TIMED_OUT:
+                metrics.inc('config_requests_total', result='timed_out')
+                break  # A slow client already used this tick's time
+            else:
+                outcome = 'shed' if shedding else 'incomplete' if server.body_incomplete else 'served'
+                metrics.inc('config_requests_total', result=outcome)
+    finally:
+        server.shedding = False
+        if handled:
+            metrics.observe('config_poll_seconds', time.monotonic() - start)
+    return handled
+
+# Functions code.py registers so the background server can report display state
+# (e.g. display_hooks['schedule'] returns the rotation schedule and weights)
+display_hooks = {}
+
+def form_unquote(part):
+    """Decode %XX escapes in form bytes ('+' already turned into spaces) to str"""
+    if b'%' not in part:
+        return part.decode('utf-8', 'replace')
+    # Every chunk after a '%' starts with its two hex digits; the rest is copied as one slice
+    from binascii import unhexlify
+    chunks = part.split(b'%')
+    data = bytearray(chunks[0])
+    for chunk in chunks[1:]:
+        try:
+            if len(chunk) < 2:
+                raise ValueError
+            data += unhexlify(chunk[:2])
+            data += chunk[2:]
+        except ValueError:
+            # Not a valid escape, keep the '%' as it was
+            data += b'%'
+            data += chunk
+    return data.decode('utf-8', 'replace')
+
+def add_form_value(form_data, key, value):
+    """Add a value to form_data, collecting repeated keys (checkboxes) into a list"""
+    if key in form_data:
+        if isinstance(form_data[key], list):
+            form_data[key].append(value)
         else:
-            d = int(url[i+1:i+3], 16)
-            i += 3
-        data.append(d)
-    return data.decode('utf-8')
+            form_data[key] = [form_data[key], value]
+    else:
+        form_data[key] = value
+
+def parse_form_body(body, content_type=''):
+    """Parse a form POST body (urlencoded bytes or JSON) into a dict; repeated keys become lists"""
+    form_data = {}
+    if 'json' in content_type or body[:1] == b'{':
+        import json
+        for key, value in json.loads(body).items():
+            if isinstance(value, list):
+                form_data[key] = [str(item) for item in value]
+            elif value is not None:
+                form_data[key] = str(value)
+        return form_data
+    # Whole-body bulk operations; values without escapes are decoded as one slice
+    if b'+' in body:
+        body = body.replace(b'+', b' ')
+    for pair in body.split(b'&'):
+        equals = pair.find(b'=')
+        if equals >= 0:
+            add_form_value(form_data, form_unquote(pair[:equals]), form_unquote(pair[equals + 1:]))
+    return form_data
+
+def make_etag(*parts):
+    """Return an ETag for a response built from parts, tagged with the firmware VERSION"""
+    import binascii
+    crc = 0
+    for part in parts:
+        crc = binascii.crc32(str(part).encode('utf-8'), crc)
+    return f'"{VERSION}-{crc:08x}"'
+
+def get_settings_etag(settings):
+    """Return the ETag for a settings dict - it changes whenever any setting changes"""
+    return make_etag(*(f"{key}={settings[key]}" for key in sorted(settings)))
+
+def is_not_modified(request, etag):
+    """Return True if the browser's cached copy (If-None-Match) is still current"""
+    cached = request.headers.get("If-None-Match")
+    if not cached:
+        return False
+    if cached.strip() == "*":
+        return True
+    for tag in cached.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+def not_modified_response(request, etag, cache_control):
+    """Return an empty 304 telling the browser to use its cached copy"""
+    return Response(request, "", status=NOT_MODIFIED_304,
+                    headers={"ETag": etag, "Cache-Control": cache_control})
+
+def schedule_reset(delay=RESTART_DELAY):
+    """Restart the board after delay seconds, once the response has been sent"""
+    global pending_reset_at
+    pending_reset_at = time.monotonic() + delay
+    print(f"Restarting in {delay} seconds to apply settings...")
+
+def check_pending_reset():
+    """Restart if a scheduled restart is due - call this after each server poll"""
+    if pending_reset_at is not None and time.monotonic() >= pending_reset_at:
+        microcontroller.reset()
+
+def apply_saved_settings(old_settings, new_settings):
+    """Apply saved settings to the running display, return True if a restart was scheduled instead"""
+    if (old_settings.get('wifi_ssid') != new_settings.get('wifi_ssid')
+            or old_settings.get('wifi_password') != new_settings.get('wifi_password')):
+        schedule_reset()
+        return True
+    changes = {}
+    for name in HOT_SETTINGS:
+        if new_settings.get(name) != old_settings.get(name):
+            changes[name] = new_settings.get(name)
+    if not changes:
+        return False
+    hook = display_hooks.get('apply_settings')
+    if hook is None:
+        # The display isn't running (setup mode), it picks the settings up when it starts
+        schedule_reset()
+        return True
+    hook(changes)
+    return False
+
+def save_settings_dict(settings):
+    """Save a full settings dict with save_settings, return its result"""
+    return save_settings(settings['wifi_ssid'], settings['wifi_password'], settings['collections'],
+                         settings['timezone'], settings['api_url'], settings.get('favorites', ''),
+                         settings.get('display_time', '10'))
+
+# settings.toml key for each setting the setup page edits
+SETTINGS_KEYS = {
+    'wifi_ssid': 'CIRCUITPY_WIFI_SSID',
+    'wifi_password': 'CIRCUITPY_WIFI_PASSWORD',
+    'collections': 'COLLECTIONS',
+    'timezone': 'TIMEZONE',
+    'favorites': 'FAVORITE_TEAMS',
+    'display_time': 'DISPLAY_TIME',
+    'api_url': 'API_BASE_URL'
+}
 
 def read_current_settings():
-    """Read existing settings from settings.toml"""
+    """Return the setup page's settings from the cached settings.toml"""
     settings = {
         'wifi_ssid': '',
         'wifi_password': '',
         'collections': 'nfl',
         'timezone': 'America/Denver',
+        'favorites': '',
+        'display_time': '10',
         'api_url': 'http://143.110.202.154/api/live'
     }
     
     try:
-        with open('settings.toml', 'r') as f:
-            content = f.read()
-            # Simple parsing for key settings
-            for line in content.split('\n'): 
-                if 'CIRCUITPY_WIFI_SSID' in line and '=' in line:
-                    settings['wifi_ssid'] = line.split('=')[1].strip().strip('"\'')
-                elif 'CIRCUITPY_WIFI_PASSWORD' in line and '=' in line:
-                    settings['wifi_password'] = line.split('=')[1].strip().strip('"\'')
-                elif 'COLLECTIONS' in line and '=' in line:
-                    collections_value = line.split('=')[1].strip().strip('"\'')
-                    settings['collections'] = collections_value
-                elif 'TIMEZONE' in line and '=' in line:
-                    settings['timezone'] = line.split('=')[1].strip().strip('"\'')
+        # Cached snapshot - only rebuilt when settings.toml changes
+        current = settings_store.snapshot()
+        for name, key in SETTINGS_KEYS.items():
+            value = current.get(key)
+            if value is not None:
+                settings[name] = str(value)
     except Exception as e:
         print(f"Error reading settings: {e}")
     
     return settings
 
-def save_settings(wifi_ssid, wifi_password, collections, timezone, api_url):
-    """Save new settings to settings.toml"""
-    debug_info = []
-    debug_info.append(f"Attempting to save settings...")
-    debug_info.append(f"SSID='{wifi_ssid}', Collections='{collections}'")
-    
+def generate_password(length=12):
+    """Return a random password for the web workflow"""
+    alphabet = 'abcdefghjkmnpqrstuvwxyz23456789'
+    return ''.join(alphabet[b % len(alphabet)] for b in os.urandom(length))
+
+def diagnose_write_failure(debug_info):
+    """Probe the filesystem after a failed save, return the probe's exception or None if it can write"""
     # Check what USB mode we're in and web workflow status
     try:
         import supervisor
-        usb_connected = supervisor.runtime.usb_connected
-        serial_connected = supervisor.runtime.serial_connected
-        debug_info.append(f"USB connected: {usb_connected}")
-        debug_info.append(f"Serial connected: {serial_connected}")
-        
-        # Check if web workflow is enabled
-        try:
-            # Read settings.toml directly to check web workflow config
-            web_workflow_configured = False
-            web_api_port = None
-            web_api_password = None
-            
-            try:
-                with open('settings.toml', 'r') as f:
-                    settings_content = f.read()
-                    for line in settings_content.split('\n'):
-                        if 'CIRCUITPY_WEB_API_PORT' in line and '=' in line:
-                            web_api_port = line.split('=')[1].strip().strip('"\'')
-                        elif 'CIRCUITPY_WEB_API_PASSWORD' in line and '=' in line:
-                            web_api_password = line.split('=')[1].strip().strip('"\'')
-                    
-                    if web_api_port and web_api_password:
-                        web_workflow_configured = True
-                        
-            except Exception as settings_e:
-                debug_info.append(f"Could not read settings.toml for web workflow check: {settings_e}")
-            
-            debug_info.append(f"Web workflow port in settings.toml: {web_api_port}")
-            debug_info.append(f"Web workflow password in settings.toml: {'Yes' if web_api_password else 'No'}")
-            debug_info.append(f"Web workflow configured: {web_workflow_configured}")
-            
-        except Exception as wf_e:
-            debug_info.append(f"Web workflow check failed: {wf_e}")
-            
+        debug_info.append(f"USB connected: {supervisor.runtime.usb_connected}")
+        debug_info.append(f"Serial connected: {supervisor.runtime.serial_connected}")
     except:
         debug_info.append("Could not check USB status")
-    
-    # Print to serial (if connected) and store for web display
-    for msg in debug_info:
-        print(f"DEBUG: {msg}")
+    debug_info.append(f"Web workflow port in settings.toml: {settings_store.get('CIRCUITPY_WEB_API_PORT')}")
+    debug_info.append(f"Web workflow password in settings.toml: {'Yes' if settings_store.get('CIRCUITPY_WEB_API_PASSWORD') else 'No'}")
     
     try:
-        # First, let's test if we can write to the filesystem at all
-        try:
-            test_content = f'filesystem write test at {time.monotonic()}'
-            with open('debug_write_test.txt', 'w') as test_file:
-                test_file.write(test_content)
-            debug_info.append("Filesystem write test passed - filesystem is writable!")
-            
-            # Verify we can read it back
-            with open('debug_write_test.txt', 'r') as test_file:
-                read_content = test_file.read()
-                debug_info.append(f"Read back: {read_content}")
-            
-            import os
-            os.remove('debug_write_test.txt')
-            debug_info.append("Test file cleanup successful")
-            
-        except Exception as test_e:
-            debug_info.append(f"Filesystem write test FAILED: {test_e}")
-            debug_info.append(f"Error type: {type(test_e).__name__}")
-            
-            # Check if this is actually a read-only error
-            if isinstance(test_e, OSError):
-                errno_val = getattr(test_e, 'errno', None)
-                strerror_val = getattr(test_e, 'strerror', 'N/A')
-                debug_info.append(f"OSError errno: {errno_val}, strerror: {strerror_val}")
-                
-                # Check specific errno values
-                if errno_val == 30:  # EROFS - Read-only file system
-                    debug_info.append("Confirmed EROFS (Read-only file system)")
-                elif errno_val == 28:  # ENOSPC - No space left
-                    debug_info.append("Confirmed ENOSPC (No space left)")
-                elif errno_val == 13:  # EACCES - Permission denied
-                    debug_info.append("Confirmed EACCES (Permission denied)")
-                else:
-                    debug_info.append(f"Unknown errno: {errno_val}")
-            
-            # Print debug info and return detailed error
-            for msg in debug_info:
-                print(f"DEBUG: {msg}")
-            
-            return ("test_failed", debug_info, test_e)
+        test_content = f'filesystem write test at {time.monotonic()}'
+        with open('debug_write_test.txt', 'w') as test_file:
+            test_file.write(test_content)
+        debug_info.append("Filesystem write test passed - filesystem is writable!")
         
-        settings_content = f'''# Comments are supported
-CIRCUITPY_WIFI_SSID = "{wifi_ssid}"
-CIRCUITPY_WIFI_PASSWORD = "{wifi_password}"
-
-# Web Workflow - Enables file writing even when connected via USB
-CIRCUITPY_WEB_API_PORT = 80
-CIRCUITPY_WEB_API_PASSWORD = "passw0rd"
-CIRCUITPY_WEB_INSTANCE_NAME = "SportsDisplay"
-
-# Timezone
-TIMEZONE = "{timezone}"
+        # Verify we can read it back
+        with open('debug_write_test.txt', 'r') as test_file:
+            read_content = test_file.read()
+            debug_info.append(f"Read back: {read_content}")
+        
+        os.remove('debug_write_test.txt')
+        debug_info.append("Test file cleanup successful")
+        return None
+        
+    except Exception as test_e:
+        debug_info.append(f"Filesystem write test FAILED: {test_e}")
+        debug_info.append(f"Error type: {type(test_e).__name__}")
+        
+        # Check if this is actually a read-only error
+        if isinstance(test_e, OSError):
+            errno_val = getattr(test_e, 'errno', None)
+            strerror_val = getattr(test_e, 'strerror', 'N/A')
+            debug_info.append(f"OSError errno: {errno_val}, strerror: {strerror_val}")
+            
+            # Check specific errno values
+            if errno_val == 30:  # EROFS - Read-only file system
+                debug_info.append("Confirmed EROFS (Read-only file system)")
+            elif errno_val == 28:  # ENOSPC - No space left
+                debug_info.append("Confirmed ENOSPC (No space left)")
+            elif errno_val == 13:  # EACCES - Permission denied
+                debug_info.append("Confirmed EACCES (Permission denied)")
+            else:
+                debug_info.append(f"Unknown errno: {errno_val}")
+        return test_e
 
-# Sports API Configuration  
-API_BASE_URL = "{api_url}"
-COLLECTIONS = "{collections}"
-'''
+def save_settings(wifi_ssid, wifi_password, collections, timezone, api_url, favorites='', display_time='10'):
+    """Save new settings to settings.toml, keeping any other keys and comments in it"""
+    debug_info = []
+    debug_info.append(f"Attempting to save settings...")
+    debug_info.append(f"SSID='{wifi_ssid}', Collections='{collections}'")
+    
+    try:
+        display_time = int(display_time)
+    except ValueError:
+        display_time = 10
+    
+    try:
+        changes = {
+            'CIRCUITPY_WIFI_SSID': wifi_ssid,
+            'CIRCUITPY_WIFI_PASSWORD': wifi_password,
+            'TIMEZONE': timezone,
+            'API_BASE_URL': api_url,
+            'COLLECTIONS': collections,
+            'FAVORITE_TEAMS': favorites,
+            'DISPLAY_TIME': display_time
+        }
+        # Web Workflow - Enables file writing even when connected via USB.
+        # Only filled in when missing, with a password unique to this board
+        if settings_store.get('CIRCUITPY_WEB_API_PORT') is None:
+            changes['CIRCUITPY_WEB_API_PORT'] = 80
+        if not settings_store.get('CIRCUITPY_WEB_API_PASSWORD'):
+            changes['CIRCUITPY_WEB_API_PASSWORD'] = generate_password()
+            print(f"Web workflow password: {changes['CIRCUITPY_WEB_API_PASSWORD']}")
+        if settings_store.get('CIRCUITPY_WEB_INSTANCE_NAME') is None:
+            changes['CIRCUITPY_WEB_INSTANCE_NAME'] = "SportsDisplay"
         
-        debug_info.append(f"Writing {len(settings_content)} characters to settings.toml")
-        with open('settings.toml', 'w') as f:
-            f.write(settings_content)
+        changed = settings_store.update(changes)
+        if not changed:
+            debug_info.append("Settings unchanged, nothing to write")
+            return True
+        debug_info.append(f"Writing {', '.join(changed)} to settings.toml")
+        settings_store.save()
         
         debug_info.append("Settings saved successfully!")
         
@@ -188,6 +412,9 @@ COLLECTIONS = "{collections}"
         return True
         
     except OSError as e:
+        # The cached model no longer matches the file, read it again
+        settings_store.load()
+        
         error_msg = str(e).lower()
         errno_val = getattr(e, 'errno', None)
         strerror_val = getattr(e, 'strerror', 'N/A')
@@ -196,11 +423,17 @@ COLLECTIONS = "{collections}"
         debug_info.append(f"Full OSError: {e}")
         debug_info.append(f"Error message contains 'readonly': {'readonly' in error_msg}")
         
+        # Only probe the filesystem once a write has actually failed
+        test_e = diagnose_write_failure(debug_info)
+        
         # Print debug info to serial
         for msg in debug_info:
             print(f"DEBUG: {msg}")
         
-        if "readonly" in error_msg or "read-only" in error_msg or "permission" in error_msg:
+        if test_e is not None:
+            return ("test_failed", debug_info, test_e)
+        
+        if errno_val == 30 or "readonly" in error_msg or "read-only" in error_msg or "permission" in error_msg:
             # Check if we can actually see any signs of computer connection
             try:
                 import supervisor
@@ -213,12 +446,13 @@ COLLECTIONS = "{collections}"
                     return ("readonly", debug_info, e)
             except:
                 return ("readonly", debug_info, e)
-        elif "space" in error_msg or "full" in error_msg:
+        elif errno_val == 28 or "space" in error_msg or "full" in error_msg:
             return ("disk_full", debug_info, e)
         else:
             return ("filesystem_error", debug_info, e)
             
     except Exception as e:
+        settings_store.load()
         debug_info.append(f"Unexpected error type: {type(e).__name__}")
         debug_info.append(f"Unexpected error details: {e}")
         
@@ -228,1492 +462,6 @@ COLLECTIONS = "{collections}"
             
         return ("unknown_error", debug_info, e)
 
-def get_setup_html(current_settings):
-    """Generate the setup HTML page"""
-    
-    # Get current collections settings (unified approach)
-    current_collections = current_settings.get('collections', '')
-    
-    # Split collections into a set for exact matching
-    collections_list = set(col.strip() for col in current_collections.split(',') if col.strip())
-    
-    # Helper function for exact collection matching
-    def is_checked(collection_name):
-        return 'checked' if collection_name in collections_list else ''
-    
-    # Pre-compute checkbox states (unified approach with exact matching)
-    collections_checked = {
-        # Sports
-        'nba': is_checked('nba'),
-        'wnba': is_checked('wnba'),
-        'nfl': is_checked('nfl'),
-        'mlb': is_checked('mlb'),
-        'nhl': is_checked('nhl'),
-        'mens_college_basketball': is_checked('mens_college_basketball'),
-        'womens_college_basketball': is_checked('womens_college_basketball'),
-        'fcs_football': is_checked('fcs_football'),
-        'fbs_football': is_checked('fbs_football'),
-        'd2_football': is_checked('d2_football'),
-        'd3_football': is_checked('d3_football'),
-        'cfb': is_checked('cfb'),
-        'college_football': is_checked('college_football'),
-        'all_college_football': is_checked('all_college_football'),
-        'college_baseball': is_checked('college_baseball'),
-        'premier_league': is_checked('premier_league'),
-        'mls': is_checked('mls'),
-        'champions_league': is_checked('champions_league'),
-        'tennis_atp': is_checked('tennis_atp'),
-        'tennis_wta': is_checked('tennis_wta'),
-        'golf_pga': is_checked('golf_pga'),
-        # Top 25 Rankings
-        'cfb_top_25': is_checked('cfb_top_25'),
-        'mcbb_top_25': is_checked('mcbb_top_25'),
-        # Conference Sports
-        'acc_mens_basketball': is_checked('acc_mens_basketball'),
-        'acc_womens_basketball': is_checked('acc_womens_basketball'),
-        'acc_football': is_checked('acc_football'),
-        'america_east_mens_basketball': is_checked('america_east_mens_basketball'),
-        'america_east_womens_basketball': is_checked('america_east_womens_basketball'),
-        'asun_mens_basketball': is_checked('asun_mens_basketball'),
-        'asun_womens_basketball': is_checked('asun_womens_basketball'),
-        'a_10_mens_basketball': is_checked('a_10_mens_basketball'),
-        'a_10_womens_basketball': is_checked('a_10_womens_basketball'),
-        'big_12_mens_basketball': is_checked('big_12_mens_basketball'),
-        'big_12_womens_basketball': is_checked('big_12_womens_basketball'),
-        'big_12_football': is_checked('big_12_football'),
-        'big_east_mens_basketball': is_checked('big_east_mens_basketball'),
-        'big_east_womens_basketball': is_checked('big_east_womens_basketball'),
-        'big_sky_mens_basketball': is_checked('big_sky_mens_basketball'),
-        'big_sky_womens_basketball': is_checked('big_sky_womens_basketball'),
-        'big_sky_football': is_checked('big_sky_football'),
-        'big_ten_mens_basketball': is_checked('big_ten_mens_basketball'),
-        'big_ten_womens_basketball': is_checked('big_ten_womens_basketball'),
-        'big_ten_football': is_checked('big_ten_football'),
-        'big_west_mens_basketball': is_checked('big_west_mens_basketball'),
-        'big_west_womens_basketball': is_checked('big_west_womens_basketball'),
-        'coastal_mens_basketball': is_checked('coastal_mens_basketball'),
-        'coastal_womens_basketball': is_checked('coastal_womens_basketball'),
-        'conference_usa_mens_basketball': is_checked('conference_usa_mens_basketball'),
-        'conference_usa_womens_basketball': is_checked('conference_usa_womens_basketball'),
-        'conference_usa_football': is_checked('conference_usa_football'),
-        'horizon_league_mens_basketball': is_checked('horizon_league_mens_basketball'),
-        'horizon_league_womens_basketball': is_checked('horizon_league_womens_basketball'),
-        'ivy_league_mens_basketball': is_checked('ivy_league_mens_basketball'),
-        'ivy_league_womens_basketball': is_checked('ivy_league_womens_basketball'),
-        'mac_mens_basketball': is_checked('mac_mens_basketball'),
-        'mac_womens_basketball': is_checked('mac_womens_basketball'),
-        'mac_football': is_checked('mac_football'),
-        'maac_mens_basketball': is_checked('maac_mens_basketball'),
-        'maac_womens_basketball': is_checked('maac_womens_basketball'),
-        'meac_mens_basketball': is_checked('meac_mens_basketball'),
-        'meac_womens_basketball': is_checked('meac_womens_basketball'),
-        'missouri_valley_mens_basketball': is_checked('missouri_valley_mens_basketball'),
-        'missouri_valley_womens_basketball': is_checked('missouri_valley_womens_basketball'),
-        'mvfc_football': is_checked('mvfc_football'),
-        'mountain_west_football': is_checked('mountain_west_football'),
-        'northeast_mens_basketball': is_checked('northeast_mens_basketball'),
-        'northeast_womens_basketball': is_checked('northeast_womens_basketball'),
-        'ohio_valley_mens_basketball': is_checked('ohio_valley_mens_basketball'),
-        'ohio_valley_womens_basketball': is_checked('ohio_valley_womens_basketball'),
-        'pac_12_mens_basketball': is_checked('pac_12_mens_basketball'),
-        'pac_12_womens_basketball': is_checked('pac_12_womens_basketball'),
-        'patriot_league_mens_basketball': is_checked('patriot_league_mens_basketball'),
-        'patriot_league_womens_basketball': is_checked('patriot_league_womens_basketball'),
-        'patriot_league_football': is_checked('patriot_league_football'),
-        'sec_mens_basketball': is_checked('sec_mens_basketball'),
-        'sec_womens_basketball': is_checked('sec_womens_basketball'),
-        'sec_football': is_checked('sec_football'),
-        'southern_mens_basketball': is_checked('southern_mens_basketball'),
-        'southern_womens_basketball': is_checked('southern_womens_basketball'),
-        'southern_football': is_checked('southern_football'),
-        'southland_mens_basketball': is_checked('southland_mens_basketball'),
-        'southland_womens_basketball': is_checked('southland_womens_basketball'),
-        'sun_belt_mens_basketball': is_checked('sun_belt_mens_basketball'),
-        'sun_belt_womens_basketball': is_checked('sun_belt_womens_basketball'),
-        'swac_mens_basketball': is_checked('swac_mens_basketball'),
-        'swac_womens_basketball': is_checked('swac_womens_basketball'),
-        'swac_football': is_checked('swac_football'),
-        'uac_football': is_checked('uac_football'),
-        'wac_mens_basketball': is_checked('wac_mens_basketball'),
-        'wac_womens_basketball': is_checked('wac_womens_basketball'),
-        'wcc_mens_basketball': is_checked('wcc_mens_basketball'),
-        'wcc_womens_basketball': is_checked('wcc_womens_basketball'),
-        # Legacy Conferences (keep for backward compatibility)
-        #'big_sky': 'checked' if 'big_sky' in current_collections else '',
-        #'big_12': 'checked' if 'big_12' in current_collections else '',
-        #'mvfc': 'checked' if 'mvfc' in current_collections else '',
-    }
-    
-    print(f"Collections settings: '{current_collections}'")
-    print(f"Collections checked states: {collections_checked}")
-    
-    return f'''<!DOCTYPE html>
-<html>
-<head>
-    <title>Sports Display Setup</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{ 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Arial, sans-serif; 
-            margin: 0; 
-            padding: 10px; 
-            background: #f0f0f0; 
-            line-height: 1.4;
-        }}
-        .container {{ 
-            max-width: 600px; 
-            margin: 0 auto; 
-            background: white; 
-            padding: 15px; 
-            border-radius: 12px; 
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{ 
-            color: #333; 
-            text-align: center; 
-            margin: 0 0 20px 0; 
-            font-size: 24px;
-        }}
-        h3 {{ 
-            color: #444; 
-            margin: 15px 0 10px 0; 
-            font-size: 18px;
-        }}
-        h4 {{ 
-            color: #555; 
-            margin: 15px 0 8px 0; 
-            font-size: 16px;
-        }}
-        input, select {{ 
-            width: 100%; 
-            padding: 12px; 
-            margin: 8px 0; 
-            border: 2px solid #ddd; 
-            border-radius: 8px; 
-            font-size: 16px;
-            -webkit-appearance: none;
-        }}
-        input:focus, select:focus {{ 
-            outline: none; 
-            border-color: #007cba; 
-            box-shadow: 0 0 0 3px rgba(0,124,186,0.1);
-        }}
-        button {{ 
-            width: 100%; 
-            padding: 16px; 
-            background: #007cba; 
-            color: white; 
-            border: none; 
-            border-radius: 8px; 
-            font-size: 18px; 
-            font-weight: 600;
-            cursor: pointer;
-            transition: background 0.2s;
-        }}
-        button:hover {{ background: #005a87; }}
-        button:active {{ background: #004a70; }}
-        .current {{ 
-            font-size: 12px; 
-            color: #666; 
-            margin-bottom: 5px;
-            word-break: break-all;
-        }}
-        .section {{ 
-            margin: 25px 0; 
-            border-bottom: 1px solid #eee; 
-            padding-bottom: 20px;
-        }}
-        .section:last-of-type {{ border-bottom: none; }}
-        .password-container {{ position: relative; }}
-        .toggle-password {{ 
-            position: absolute; 
-            right: 12px; 
-            top: 50%; 
-            transform: translateY(-50%); 
-            background: none; 
-            border: none; 
-            color: #666; 
-            cursor: pointer; 
-            padding: 8px; 
-            width: auto; 
-            font-size: 16px;
-            touch-action: manipulation;
-        }}
-        .toggle-password:hover {{ color: #333; }}
-        
-        /* Mobile-specific improvements */
-        @media (max-width: 480px) {{
-            body {{ padding: 5px; }}
-            .container {{ 
-                padding: 12px; 
-                border-radius: 8px;
-                margin: 0 5px;
-            }}
-            h1 {{ font-size: 20px; }}
-            h3 {{ font-size: 16px; }}
-            h4 {{ font-size: 14px; }}
-            input, select {{ 
-                padding: 14px 12px; 
-                font-size: 16px; /* Prevents zoom on iOS */
-            }}
-            .checkbox-grid {{
-                grid-template-columns: 1fr !important;
-            }}
-        }}
-        
-        /* Checkbox grid for conferences */
-        .checkbox-grid {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 8px;
-            margin: 10px 0;
-        }}
-        .checkbox-item {{
-            display: flex;
-            align-items: flex-start;
-            padding: 12px;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            background: #fafafa;
-            transition: all 0.2s;
-            cursor: pointer;
-            position: relative;
-        }}
-        .checkbox-item:hover {{ 
-            border-color: #007cba; 
-            background: #f0f8ff;
-        }}
-        .checkbox-item input[type="checkbox"] {{
-            margin: 2px 10px 0 0;
-            width: auto;
-            flex-shrink: 0;
-            cursor: pointer;
-            z-index: 10;
-            position: relative;
-            accent-color: #007cba;
-            transform: scale(1.1);
-        }}
-        .checkbox-item input[type="checkbox"]:checked {{
-            background-color: #007cba;
-        }}
-        .checkbox-item input[type="checkbox"]:checked + .checkbox-label {{
-            font-weight: 600;
-            color: #007cba;
-        }}
-        .checkbox-label {{
-            flex-grow: 1;
-            font-size: 14px;
-            line-height: 1.3;
-        }}
-        .checkbox-small {{
-            font-size: 11px;
-            color: #666;
-            margin-top: 2px;
-        }}
-        
-        /* Collapsible Conference Sections */
-        .conference-section {{
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            margin: 10px 0;
-            overflow: hidden;
-        }}
-        .conference-header {{
-            background: #f8f9fa;
-            padding: 12px 16px;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            font-weight: 600;
-            font-size: 14px;
-            color: #333;
-            border-bottom: 1px solid #ddd;
-            transition: background-color 0.2s;
-        }}
-        .conference-header:hover {{
-            background: #e9ecef;
-        }}
-        .conference-header.expanded {{
-            background: #007cba;
-            color: white;
-            border-color: #007cba;
-        }}
-        .conference-toggle {{
-            font-size: 18px;
-            font-weight: bold;
-            transition: transform 0.2s;
-        }}
-        .conference-toggle.expanded {{
-            transform: rotate(90deg);
-        }}
-        .conference-content {{
-            display: none;
-            padding: 12px;
-            background: white;
-        }}
-        .conference-content.expanded {{
-            display: block;
-        }}
-        .conference-sports {{
-            display: grid;
-            grid-template-columns: 1fr;
-            gap: 8px;
-        }}
-        .sport-item {{
-            display: flex;
-            align-items: center;
-            padding: 8px 12px;
-            border: 1px solid #e0e0e0;
-            border-radius: 6px;
-            background: #fafafa;
-            transition: all 0.2s;
-        }}
-        .sport-item:hover {{
-            border-color: #007cba;
-            background: #f0f8ff;
-        }}
-        .sport-item input[type="checkbox"] {{
-            margin-right: 10px;
-            transform: scale(1.1);
-            accent-color: #007cba;
-            width: auto;
-            flex-shrink: 0;
-        }}
-        .sport-item input[type="checkbox"]:checked {{
-            background-color: #007cba;
-        }}
-        .sport-item input[type="checkbox"]:checked + .sport-label {{
-            font-weight: 600;
-            color: #007cba;
-        }}
-        .sport-label {{
-            font-size: 13px;
-            line-height: 1.2;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>&#9632; Sports Display Setup</h1>
-        
-        <form method="POST" action="/save">
-            <div class="section">
-                <h3>WiFi Configuration</h3>
-                <div class="current">Current: {current_settings['wifi_ssid'] or 'Not configured'}</div>
-                <input type="text" name="wifi_ssid" placeholder="WiFi Network Name (SSID)" value="{current_settings['wifi_ssid']}" required>
-                <div class="password-container">
-                    <input type="password" id="wifi_password" name="wifi_password" placeholder="WiFi Password" value="{current_settings['wifi_password']}" required>
-                    <button type="button" class="toggle-password" onclick="togglePassword()">Show</button>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h3>&#9733; What Do You Want to Follow?</h3>
-                <div class="current">
-                    <strong>Currently following:</strong> 
-                    <span id="current-selections">Loading selections...</span>
-                </div>
-                
-                <h4>&#8226; Professional Sports:</h4>
-                <div class="checkbox-grid">
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="nba" {collections_checked['nba']}>
-                        <div class="checkbox-label">
-                            [NBA] Basketball
-                            <div class="checkbox-small">Professional basketball league</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="wnba" {collections_checked['wnba']}>
-                        <div class="checkbox-label">
-                            [WNBA] Basketball
-                            <div class="checkbox-small">Women's professional basketball</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="nfl" {collections_checked['nfl']}>
-                        <div class="checkbox-label">
-                            [NFL] Football
-                            <div class="checkbox-small">Professional football league</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="mlb" {collections_checked['mlb']}>
-                        <div class="checkbox-label">
-                            [MLB] Baseball
-                            <div class="checkbox-small">Professional baseball league</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="nhl" {collections_checked['nhl']}>
-                        <div class="checkbox-label">
-                            [NHL] Hockey
-                            <div class="checkbox-small">Professional hockey league</div>
-                        </div>
-                    </label>
-                </div>
-                    
-                <h4>&#8226; College Sports:</h4>
-                <div class="checkbox-grid">
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="mens_college_basketball" {collections_checked['mens_college_basketball']}>
-                        <div class="checkbox-label">
-                            [College] Basketball (Men)
-                            <div class="checkbox-small">Featured mens college basketball games</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="womens_college_basketball" {collections_checked['womens_college_basketball']}>
-                        <div class="checkbox-label">
-                            [College] Basketball (Womens)
-                            <div class="checkbox-small">Featured womens college basketball games</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="college_football" {collections_checked['college_football']}>
-                        <div class="checkbox-label">
-                            [College] FBS + FCS College Football
-                            <div class="checkbox-small">All college football - fbs + fcs</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="all_college_football" {collections_checked['all_college_football']}>
-                        <div class="checkbox-label">
-                            [College] FBS + FCS + D2 + D3 College Football
-                            <div class="checkbox-small">All college football - all divisions</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="cfb" {collections_checked['cfb']}>
-                        <div class="checkbox-label">
-                            [College] College Football Smaller Subset
-                            <div class="checkbox-small">All college football - small</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="fcs_football" {collections_checked['fcs_football']}>
-                        <div class="checkbox-label">
-                            [College] FCS College Football
-                            <div class="checkbox-small">just FCS football</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="fbs_football" {collections_checked['fbs_football']}>
-                        <div class="checkbox-label">
-                            [College] FBS Football
-                            <div class="checkbox-small">Division I FBS college football</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="d2_football" {collections_checked['d2_football']}>
-                        <div class="checkbox-label">
-                            [College] Division II Football
-                            <div class="checkbox-small">NCAA Division II college football</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="d3_football" {collections_checked['d3_football']}>
-                        <div class="checkbox-label">
-                            [College] Division III Football
-                            <div class="checkbox-small">NCAA Division III college football</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="college_baseball" {collections_checked['college_baseball']}>
-                        <div class="checkbox-label">
-                            [College] Baseball
-                            <div class="checkbox-small">Featured college baseball games</div>
-                        </div>
-                    </label>
-                </div>
-                    
-                <h4>&#8226; Top 25 Rankings:</h4>
-                <div class="checkbox-grid">
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="cfb_top_25" {collections_checked['cfb_top_25']}>
-                        <div class="checkbox-label">
-                            [Top 25] College Football
-                            <div class="checkbox-small">Top 25 ranked college football teams</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="mcbb_top_25" {collections_checked['mcbb_top_25']}>
-                        <div class="checkbox-label">
-                            [Top 25] Men's College Basketball
-                            <div class="checkbox-small">Top 25 ranked mens college basketball teams</div>
-                        </div>
-                    </label>
-                </div>
-                    
-                <h4>&#8226; International Sports:</h4>
-                <div class="checkbox-grid">
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="premier_league" {collections_checked['premier_league']}>
-                        <div class="checkbox-label">
-                            [Soccer] Premier League
-                            <div class="checkbox-small">English football</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="mls" {collections_checked['mls']}>
-                        <div class="checkbox-label">
-                            [Soccer] MLS
-                            <div class="checkbox-small">Major League Soccer</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="champions_league" {collections_checked['champions_league']}>
-                        <div class="checkbox-label">
-                            [Soccer] Champions League
-                            <div class="checkbox-small">European tournament</div>
-                        </div>
-                    </label>
-                </div>
-                <!-- TODO TEMPORARILY DISABLED - No handling for individual leaderboards on the frontend -->
-                <!--    
-                <h4>&#8226; Individual Sports:</h4>
-                <div class="checkbox-grid">
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="tennis_atp" {collections_checked['tennis_atp']}>
-                        <div class="checkbox-label">
-                            [Tennis] ATP
-                            <div class="checkbox-small">Men's professional tennis</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="tennis_wta" {collections_checked['tennis_wta']}>
-                        <div class="checkbox-label">
-                            [Tennis] WTA
-                            <div class="checkbox-small">Women's professional tennis</div>
-                        </div>
-                    </label>
-                    <label class="checkbox-item">
-                        <input type="checkbox" name="collections" value="golf_pga" {collections_checked['golf_pga']}>
-                        <div class="checkbox-label">
-                            [Golf] PGA
-                            <div class="checkbox-small">Professional golf tour</div>
-                        </div>
-                    </label>
-                </div>
-                -->
-
-                <h4>&#8226; College Sports by Conference:</h4>
-                
-                <!-- ACC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('acc')">
-                        <span>ACC (Atlantic Coast Conference)</span>
-                        <span class="conference-toggle" id="acc-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="acc-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="acc_mens_basketball" {collections_checked['acc_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="acc_womens_basketball" {collections_checked['acc_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="acc_football" {collections_checked['acc_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- America East Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('america-east')">
-                        <span>America East Conference</span>
-                        <span class="conference-toggle" id="america-east-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="america-east-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="america_east_mens_basketball" {collections_checked['america_east_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="america_east_womens_basketball" {collections_checked['america_east_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- ASUN Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('asun')">
-                        <span>ASUN Conference</span>
-                        <span class="conference-toggle" id="asun-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="asun-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="asun_mens_basketball" {collections_checked['asun_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="asun_womens_basketball" {collections_checked['asun_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Atlantic 10 Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('a10')">
-                        <span>Atlantic 10 Conference (A-10)</span>
-                        <span class="conference-toggle" id="a10-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="a10-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="a_10_mens_basketball" {collections_checked['a_10_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="a_10_womens_basketball" {collections_checked['a_10_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Big 12 Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('big12')">
-                        <span>Big 12 Conference</span>
-                        <span class="conference-toggle" id="big12-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="big12-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_12_mens_basketball" {collections_checked['big_12_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_12_womens_basketball" {collections_checked['big_12_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_12_football" {collections_checked['big_12_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Big East Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('big-east')">
-                        <span>Big East Conference</span>
-                        <span class="conference-toggle" id="big-east-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="big-east-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_east_mens_basketball" {collections_checked['big_east_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_east_womens_basketball" {collections_checked['big_east_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Big Sky Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('big-sky')">
-                        <span>Big Sky Conference</span>
-                        <span class="conference-toggle" id="big-sky-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="big-sky-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_sky_mens_basketball" {collections_checked['big_sky_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_sky_womens_basketball" {collections_checked['big_sky_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_sky_football" {collections_checked['big_sky_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Big Ten Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('big-ten')">
-                        <span>Big Ten Conference</span>
-                        <span class="conference-toggle" id="big-ten-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="big-ten-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_ten_mens_basketball" {collections_checked['big_ten_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_ten_womens_basketball" {collections_checked['big_ten_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_ten_football" {collections_checked['big_ten_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Big West Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('big-west')">
-                        <span>Big West Conference</span>
-                        <span class="conference-toggle" id="big-west-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="big-west-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_west_mens_basketball" {collections_checked['big_west_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="big_west_womens_basketball" {collections_checked['big_west_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Coastal Athletic Association -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('coastal')">
-                        <span>Coastal Athletic Association</span>
-                        <span class="conference-toggle" id="coastal-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="coastal-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="coastal_mens_basketball" {collections_checked['coastal_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="coastal_womens_basketball" {collections_checked['coastal_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Conference USA -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('cusa')">
-                        <span>Conference USA (C-USA)</span>
-                        <span class="conference-toggle" id="cusa-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="cusa-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="conference_usa_mens_basketball" {collections_checked['conference_usa_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="conference_usa_womens_basketball" {collections_checked['conference_usa_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="conference_usa_football" {collections_checked['conference_usa_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Horizon League -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('horizon')">
-                        <span>Horizon League</span>
-                        <span class="conference-toggle" id="horizon-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="horizon-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="horizon_league_mens_basketball" {collections_checked['horizon_league_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="horizon_league_womens_basketball" {collections_checked['horizon_league_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Ivy League -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('ivy')">
-                        <span>Ivy League</span>
-                        <span class="conference-toggle" id="ivy-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="ivy-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="ivy_league_mens_basketball" {collections_checked['ivy_league_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="ivy_league_womens_basketball" {collections_checked['ivy_league_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- MAC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('mac')">
-                        <span>MAC (Mid-American Conference)</span>
-                        <span class="conference-toggle" id="mac-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="mac-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="mac_mens_basketball" {collections_checked['mac_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="mac_womens_basketball" {collections_checked['mac_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="mac_football" {collections_checked['mac_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- MAAC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('maac')">
-                        <span>MAAC (Metro Atlantic Athletic Conference)</span>
-                        <span class="conference-toggle" id="maac-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="maac-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="maac_mens_basketball" {collections_checked['maac_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="maac_womens_basketball" {collections_checked['maac_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- MEAC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('meac')">
-                        <span>MEAC (Mid-Eastern Athletic Conference)</span>
-                        <span class="conference-toggle" id="meac-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="meac-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="meac_mens_basketball" {collections_checked['meac_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="meac_womens_basketball" {collections_checked['meac_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Missouri Valley Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('mvc')">
-                        <span>Missouri Valley Conference (MVC)</span>
-                        <span class="conference-toggle" id="mvc-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="mvc-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="missouri_valley_mens_basketball" {collections_checked['missouri_valley_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="missouri_valley_womens_basketball" {collections_checked['missouri_valley_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- MVFC Football Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('mvfc')">
-                        <span>MVFC (Missouri Valley Football Conference)</span>
-                        <span class="conference-toggle" id="mvfc-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="mvfc-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="mvfc_football" {collections_checked['mvfc_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Mountain West Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('mountain-west')">
-                        <span>Mountain West Conference</span>
-                        <span class="conference-toggle" id="mountain-west-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="mountain-west-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="mountain_west_football" {collections_checked['mountain_west_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Northeast Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('nec')">
-                        <span>Northeast Conference (NEC)</span>
-                        <span class="conference-toggle" id="nec-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="nec-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="northeast_mens_basketball" {collections_checked['northeast_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="northeast_womens_basketball" {collections_checked['northeast_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Ohio Valley Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('ovc')">
-                        <span>Ohio Valley Conference (OVC)</span>
-                        <span class="conference-toggle" id="ovc-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="ovc-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="ohio_valley_mens_basketball" {collections_checked['ohio_valley_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="ohio_valley_womens_basketball" {collections_checked['ohio_valley_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Pac-12 Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('pac12')">
-                        <span>Pac-12 Conference</span>
-                        <span class="conference-toggle" id="pac12-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="pac12-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="pac_12_mens_basketball" {collections_checked['pac_12_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="pac_12_womens_basketball" {collections_checked['pac_12_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Patriot League -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('patriot')">
-                        <span>Patriot League</span>
-                        <span class="conference-toggle" id="patriot-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="patriot-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="patriot_league_mens_basketball" {collections_checked['patriot_league_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="patriot_league_womens_basketball" {collections_checked['patriot_league_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="patriot_league_football" {collections_checked['patriot_league_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- SEC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('sec')">
-                        <span>SEC (Southeastern Conference)</span>
-                        <span class="conference-toggle" id="sec-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="sec-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="sec_mens_basketball" {collections_checked['sec_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="sec_womens_basketball" {collections_checked['sec_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="sec_football" {collections_checked['sec_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Southern Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('socon')">
-                        <span>Southern Conference (SoCon)</span>
-                        <span class="conference-toggle" id="socon-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="socon-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="southern_mens_basketball" {collections_checked['southern_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="southern_womens_basketball" {collections_checked['southern_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="southern_football" {collections_checked['southern_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Southland Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('southland')">
-                        <span>Southland Conference</span>
-                        <span class="conference-toggle" id="southland-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="southland-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="southland_mens_basketball" {collections_checked['southland_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="southland_womens_basketball" {collections_checked['southland_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Sun Belt Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('sunbelt')">
-                        <span>Sun Belt Conference</span>
-                        <span class="conference-toggle" id="sunbelt-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="sunbelt-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="sun_belt_mens_basketball" {collections_checked['sun_belt_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="sun_belt_womens_basketball" {collections_checked['sun_belt_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- SWAC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('swac')">
-                        <span>SWAC (Southwestern Athletic Conference)</span>
-                        <span class="conference-toggle" id="swac-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="swac-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="swac_mens_basketball" {collections_checked['swac_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="swac_womens_basketball" {collections_checked['swac_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="swac_football" {collections_checked['swac_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- UAC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('uac')">
-                        <span>UAC (United Athletic Conference)</span>
-                        <span class="conference-toggle" id="uac-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="uac-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="uac_football" {collections_checked['uac_football']}>
-                                <span class="sport-label">Football</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- WAC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('wac')">
-                        <span>WAC (Western Athletic Conference)</span>
-                        <span class="conference-toggle" id="wac-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="wac-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="wac_mens_basketball" {collections_checked['wac_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="wac_womens_basketball" {collections_checked['wac_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- WCC Conference -->
-                <div class="conference-section">
-                    <div class="conference-header" onclick="toggleConference('wcc')">
-                        <span>WCC (West Coast Conference)</span>
-                        <span class="conference-toggle" id="wcc-toggle">+</span>
-                    </div>
-                    <div class="conference-content" id="wcc-content">
-                        <div class="conference-sports">
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="wcc_mens_basketball" {collections_checked['wcc_mens_basketball']}>
-                                <span class="sport-label">Men's Basketball</span>
-                            </label>
-                            <label class="sport-item">
-                                <input type="checkbox" name="collections" value="wcc_womens_basketball" {collections_checked['wcc_womens_basketball']}>
-                                <span class="sport-label">Women's Basketball</span>
-                            </label>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h3>Timezone Configuration</h3>
-                <div class="current">Current: {current_settings.get('timezone', 'America/Denver')}</div>
-                <select name="timezone">
-                    <optgroup label="US Timezones">
-                        <option value="America/New_York" {'selected' if current_settings.get('timezone') == 'America/New_York' else ''}>Eastern Time (New York)</option>
-                        <option value="America/Chicago" {'selected' if current_settings.get('timezone') == 'America/Chicago' else ''}>Central Time (Chicago)</option>
-                        <option value="America/Denver" {'selected' if current_settings.get('timezone') == 'America/Denver' else ''}>Mountain Time (Denver)</option>
-                        <option value="America/Phoenix" {'selected' if current_settings.get('timezone') == 'America/Phoenix' else ''}>Arizona Time (Phoenix)</option>
-                        <option value="America/Los_Angeles" {'selected' if current_settings.get('timezone') == 'America/Los_Angeles' else ''}>Pacific Time (Los Angeles)</option>
-                        <option value="America/Anchorage" {'selected' if current_settings.get('timezone') == 'America/Anchorage' else ''}>Alaska Time (Anchorage)</option>
-                        <option value="Pacific/Honolulu" {'selected' if current_settings.get('timezone') == 'Pacific/Honolulu' else ''}>Hawaii Time (Honolulu)</option>
-                    </optgroup>
-                    <optgroup label="Canada">
-                        <option value="America/Toronto" {'selected' if current_settings.get('timezone') == 'America/Toronto' else ''}>Eastern Time (Toronto)</option>
-                        <option value="America/Winnipeg" {'selected' if current_settings.get('timezone') == 'America/Winnipeg' else ''}>Central Time (Winnipeg)</option>
-                        <option value="America/Edmonton" {'selected' if current_settings.get('timezone') == 'America/Edmonton' else ''}>Mountain Time (Edmonton)</option>
-                        <option value="America/Vancouver" {'selected' if current_settings.get('timezone') == 'America/Vancouver' else ''}>Pacific Time (Vancouver)</option>
-                    </optgroup>
-                    <optgroup label="Europe">
-                        <option value="Europe/London" {'selected' if current_settings.get('timezone') == 'Europe/London' else ''}>GMT (London)</option>
-                        <option value="Europe/Paris" {'selected' if current_settings.get('timezone') == 'Europe/Paris' else ''}>CET (Paris)</option>
-                        <option value="Europe/Berlin" {'selected' if current_settings.get('timezone') == 'Europe/Berlin' else ''}>CET (Berlin)</option>
-                        <option value="Europe/Rome" {'selected' if current_settings.get('timezone') == 'Europe/Rome' else ''}>CET (Rome)</option>
-                    </optgroup>
-                    <optgroup label="Other">
-                        <option value="UTC" {'selected' if current_settings.get('timezone') == 'UTC' else ''}>UTC (Coordinated Universal Time)</option>
-                    </optgroup>
-                </select>
-            </div>
-            
-            <div class="section">
-                <div class="advanced-toggle" onclick="toggleAdvanced()">
-                    <h3 style="margin: 0; display: flex; align-items: center; cursor: pointer; user-select: none;">
-                        <span id="advanced-icon" style="margin-right: 8px; font-size: 18px; transition: transform 0.2s;">+</span>
-                        Advanced Settings
-                    </h3>
-                </div>
-                
-                <div id="advanced-content" style="display: none; margin-top: 15px;">
-                    <div style="background: #fff3cd; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #f39c12;">
-                        <h4 style="color: #856404; margin: 0 0 8px 0; font-size: 14px;">Warning</h4>
-                        <p style="color: #856404; margin: 0; font-size: 13px; line-height: 1.4;">
-                            These are advanced settings. Changing the API URL could result in incomplete or no sports data. 
-                            Only modify these settings if you know what you're doing or have been instructed to do so.
-                        </p>
-                    </div>
-                    
-                    <h4>API Configuration</h4>
-                    <input type="url" name="api_url" placeholder="API Base URL" value="{current_settings['api_url']}" required>
-                </div>
-            </div>
-            
-            <button type="submit">Save Settings & Restart</button>
-        </form>
-        
-                <div class="section" style="text-align: center; margin-top: 15px;">
-            <div style="background: #e3f2fd; padding: 12px; border-radius: 6px; margin: 10px 0; font-size: 13px;">
-                <strong>Pro Tip</strong><br>
-                <span style="color: #1976d2;">After startup, this URL will be displayed on your LED matrix for easy access!</span>
-            </div>
-        </div>
-        
-        <div class="section" style="margin-top: 20px;">
-            <h4 style="margin-bottom: 10px; color: #333;">Device Information</h4>
-            <div style="background: #f8f9fa; padding: 15px; border-radius: 6px; border-left: 4px solid #28a745;">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
-                    <span><strong>Current Version:</strong></span>
-                    <code style="background: #e9ecef; padding: 2px 6px; border-radius: 3px;">v{VERSION}</code>
-                </div>
-                <!-- TODO TEMPORARILY DISABLED - Update functionality hidden until implementation decided -->
-                <!--
-                <div style="margin-bottom: 10px;">
-                    <button type="button" id="checkUpdatesBtn" onclick="checkForUpdates()" 
-                            style="background: #007bff; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer;">
-                        Check for Updates
-                    </button>
-                </div>
-                <div id="updateStatus" style="margin-top: 10px; font-size: 13px;"></div>
-                -->
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        function togglePassword() {{
-            const passwordField = document.getElementById('wifi_password');
-            const toggleButton = document.querySelector('.toggle-password');
-            
-            if (passwordField.type === 'password') {{
-                passwordField.type = 'text';
-                toggleButton.textContent = 'Hide';
-            }} else {{
-                passwordField.type = 'password';
-                toggleButton.textContent = 'Show';
-            }}
-        }}
-
-        function toggleAdvanced() {{
-            const content = document.getElementById('advanced-content');
-            const icon = document.getElementById('advanced-icon');
-            
-            if (content.style.display === 'none') {{
-                content.style.display = 'block';
-                icon.textContent = '-';
-                icon.style.transform = 'rotate(0deg)';
-            }} else {{
-                content.style.display = 'none';
-                icon.textContent = '+';
-                icon.style.transform = 'rotate(0deg)';
-            }}
-        }}
-
-        function toggleConference(conferenceId) {{
-            const content = document.getElementById(conferenceId + '-content');
-            const toggle = document.getElementById(conferenceId + '-toggle');
-            const header = content.previousElementSibling;
-            
-            if (content.classList.contains('expanded')) {{
-                content.classList.remove('expanded');
-                toggle.classList.remove('expanded');
-                header.classList.remove('expanded');
-                toggle.textContent = '+';
-            }} else {{
-                content.classList.add('expanded');
-                toggle.classList.add('expanded');
-                header.classList.add('expanded');
-                toggle.textContent = '-';
-            }}
-        }}
-
-        function checkForUpdates() {{
-            const btn = document.getElementById('checkUpdatesBtn');
-            const status = document.getElementById('updateStatus');
-            
-            btn.disabled = true;
-            btn.textContent = 'Checking...';
-            status.innerHTML = '<span style="color: #6c757d;">Checking GitHub for updates...</span>';
-            
-            fetch('/check-updates')
-                .then(response => response.json())
-                .then(data => {{
-                    if (data.available) {{
-                        status.innerHTML = `
-                            <div style="color: #28a745; margin-bottom: 8px;">
-                                <strong>✓ Update Available: v${{data.version}}</strong>
-                            </div>
-                            <div style="font-size: 12px; color: #6c757d; margin-bottom: 8px;">
-                                Released: ${{data.published}}
-                            </div>
-                            <button onclick="installUpdate('${{data.version}}')" 
-                                    style="background: #28a745; color: white; border: none; padding: 6px 12px; border-radius: 3px; cursor: pointer; font-size: 12px;">
-                                Install Update
-                            </button>
-                        `;
-                    }} else if (data.error) {{
-                        status.innerHTML = `<span style="color: #dc3545;">Error: ${{data.error}}</span>`;
-                    }} else {{
-                        status.innerHTML = `<span style="color: #28a745;">✓ Running latest version (${{data.current}})</span>`;
-                    }}
-                }})
-                .catch(err => {{
-                    status.innerHTML = `<span style="color: #dc3545;">Error checking for updates: ${{err.message}}</span>`;
-                }})
-                .finally(() => {{
-                    btn.disabled = false;
-                    btn.textContent = 'Check for Updates';
-                }});
-        }}
-        
-        function installUpdate(version) {{
-            if (!confirm(`Install update v${{version}}? This will restart the device.`)) {{
-                return;
-            }}
-            
-            const status = document.getElementById('updateStatus');
-            status.innerHTML = '<span style="color: #007bff;">Installing update... Device will restart automatically.</span>';
-            
-            fetch('/install-update', {{
-                method: 'POST',
-                headers: {{'Content-Type': 'application/json'}},
-                body: JSON.stringify({{version: version}})
-            }})
-            .then(response => response.json())
-            .then(data => {{
-                if (data.success) {{
-                    status.innerHTML = '<span style="color: #28a745;">Update installed successfully. Restarting...</span>';
-                }} else {{
-                    status.innerHTML = `<span style="color: #dc3545;">Update failed: ${{data.error}}</span>`;
-                }}
-            }})
-            .catch(err => {{
-                status.innerHTML = `<span style="color: #dc3545;">Update failed: ${{err.message}}</span>`;
-            }});
-        }}
-
-        function updateCurrentSelections() {{
-            const allSelected = [];
-
-            // Get all selected collections
-            const collectionCheckboxes = document.querySelectorAll('input[name="collections"]:checked');
-            collectionCheckboxes.forEach(checkbox => {{
-                // Handle both old checkbox-item structure and new sport-item structure
-                let collectionName = '';
-                
-                // Try new conference sport structure first
-                const sportItem = checkbox.closest('.sport-item');
-                if (sportItem) {{
-                    const sportLabel = sportItem.querySelector('.sport-label');
-                    const conferenceHeader = checkbox.closest('.conference-section').querySelector('.conference-header span');
-                    const conferenceName = conferenceHeader.textContent.split('(')[0].trim(); // Remove parenthetical parts
-                    const sportName = sportLabel.textContent.trim();
-                    collectionName = `${{conferenceName}} - ${{sportName}}`;
-                }} else {{
-                    // Fall back to old checkbox-item structure
-                    const checkboxItem = checkbox.closest('.checkbox-item');
-                    if (checkboxItem) {{
-                        const label = checkboxItem.querySelector('.checkbox-label');
-                        collectionName = label.firstChild.textContent.trim();
-                    }}
-                }}
-                
-                if (collectionName) {{
-                    allSelected.push(collectionName);
-                }}
-            }});
-
-            // Update display
-            const currentDisplay = document.getElementById('current-selections');
-            let displayText = '';
-            
-            if (allSelected.length > 0) {{
-                displayText = allSelected.join(', ');
-            }} else {{
-                displayText = 'Nothing selected';
-            }}
-            
-            currentDisplay.textContent = displayText;
-            
-            // Update styling based on selections
-            if (allSelected.length > 0) {{
-                currentDisplay.style.color = '#007cba';
-                currentDisplay.style.fontWeight = '600';
-            }} else {{
-                currentDisplay.style.color = '#666';
-                currentDisplay.style.fontWeight = 'normal';
-            }}
-        }}
-
-        // Add event listeners when page loads
-        document.addEventListener('DOMContentLoaded', function() {{
-            // Update display on page load
-            updateCurrentSelections();
-            
-            // Add change listeners to all checkboxes
-            const allCheckboxes = document.querySelectorAll('input[name="collections"]');
-            allCheckboxes.forEach(checkbox => {{
-                checkbox.addEventListener('change', updateCurrentSelections);
-            }});
-        }});
-    </script>
-</body>
-</html>'''
-
 def get_success_html():
     """Generate success page"""
     return '''<!DOCTYPE html>
@@ -1775,7 +523,12 @@ def start_config_server(setup_mode=True, pool=None):
             return None
     
     # Create server
-    server = Server(pool, debug=(setup_mode))
+    server = GuardedServer(pool, debug=(setup_mode))
+    server.socket_timeout = SERVER_SOCKET_TIMEOUT
+    if setup_mode:
+        # Phones on the access point can be slow, and nothing else is waiting on the server
+        server.header_receive_time = SETUP_RECEIVE_TIME
+        server.body_receive_time = SETUP_RECEIVE_TIME
     
     # Get current settings
     current_settings = read_current_settings()
@@ -1786,32 +539,76 @@ def start_config_server(setup_mode=True, pool=None):
         print(f"HTTP GET request received for / from {request.client_address if hasattr(request, 'client_address') else 'unknown'}")
         print(f"Request path: {request.path}")
         print(f"Request method: {request.method}")
+        # The page only changes with the file (or firmware), so repeat visits get a 304
+        page_stat = os.stat(WEB_ROOT + '/' + SETUP_PAGE)
+        etag = make_etag(SETUP_PAGE, page_stat[6], page_stat[8])
+        if is_not_modified(request, etag):
+            return not_modified_response(request, etag, "no-cache")
+        # The page fills itself in from /api/settings
+        return FileResponse(request, SETUP_PAGE, root_path=WEB_ROOT, content_type="text/html",
+                            headers={"Content-Encoding": "gzip", "ETag": etag, "Cache-Control": "no-cache"},
+                            buffer_size=WEB_CHUNK_SIZE)
+    
+    @server.route("/api/settings", GET)
+    def settings_endpoint(request: Request):
+        """API endpoint with the current settings for the setup page"""
+        import json
         # Always read fresh settings to show current state
-        fresh_settings = read_current_settings()
-        return Response(request, get_setup_html(fresh_settings), content_type="text/html")
+        settings = read_current_settings()
+        settings['version'] = VERSION
+        etag = get_settings_etag(settings)
+        if is_not_modified(request, etag):
+            return not_modified_response(request, etag, "no-cache")
+        return Response(request, json.dumps(settings), content_type="application/json",
+                        headers={"ETag": etag, "Cache-Control": "no-cache"})
+    
+    @server.route("/api/settings", PATCH)
+    def patch_settings_endpoint(request: Request):
+        """API endpoint to change some settings, applying them without a restart where possible"""
+        import json
+        try:
+            changes = request.json()
+        except ValueError:
+            changes = None
+        if not isinstance(changes, dict):
+            return Response(request, json.dumps({'error': 'Expected a JSON object'}),
+                            content_type="application/json", status=BAD_REQUEST_400)
+        unknown = [name for name in changes if name not in SETTINGS_FIELDS]
+        if unknown:
+            return Response(request, json.dumps({'error': f"Unknown settings: {', '.join(unknown)}"}),
+                            content_type="application/json", status=BAD_REQUEST_400)
+        
+        old_settings = read_current_settings()
+        new_settings = dict(old_settings)
+        for name, value in changes.items():
+            new_settings[name] = str(value).strip()
+        if 'favorites' in changes:
+            new_settings['favorites'] = ','.join(team.strip().upper() for team in new_settings['favorites'].split(',') if team.strip())
+        if not new_settings['wifi_ssid'] or not new_settings['wifi_password']:
+            return Response(request, json.dumps({'error': 'WiFi SSID and password required'}),
+                            content_type="application/json", status=BAD_REQUEST_400)
+        try:
+            if int(new_settings['display_time']) < 1:
+                raise ValueError
+        except ValueError:
+            return Response(request, json.dumps({'error': 'display_time must be a whole number of seconds'}),
+                            content_type="application/json", status=BAD_REQUEST_400)
+        
+        save_result = save_settings_dict(new_settings)
+        if save_result != True:
+            error = save_result[0] if isinstance(save_result, tuple) else str(save_result)
+            return Response(request, json.dumps({'error': f"Could not save settings: {error}"}),
+                            content_type="application/json", status=INTERNAL_SERVER_ERROR_500)
+        restarting = apply_saved_settings(old_settings, new_settings)
+        new_settings['version'] = VERSION
+        return Response(request, json.dumps({'settings': new_settings, 'restarting': restarting}),
+                        content_type="application/json", headers={"ETag": get_settings_etag(new_settings)})
     
     @server.route("/save", POST)
     def save_configuration(request: Request):
         """Handle form submission"""
         try:
-            # Parse form data - always use manual parsing to ensure URL decoding
-            form_data = {}
-            # Always use manual parsing to ensure proper URL decoding
-            body = request.body.decode('utf-8')
-            for pair in body.split('&'):
-                if '=' in pair:
-                    key, value = pair.split('=', 1)
-                    # Handle multiple values for same key (checkboxes)
-                    # URL decode the value using our custom function
-                    decoded_value = url_decode(value)
-                    
-                    if key in form_data:
-                        if isinstance(form_data[key], list):
-                            form_data[key].append(decoded_value)
-                        else:
-                            form_data[key] = [form_data[key], decoded_value]
-                    else:
-                        form_data[key] = decoded_value
+            form_data = parse_form_body(request.body, request.headers.get('Content-Type') or '')
             
             wifi_ssid = form_data.get('wifi_ssid', '').strip()
             wifi_password = form_data.get('wifi_password', '').strip()
@@ -1829,35 +626,36 @@ def start_config_server(setup_mode=True, pool=None):
             
             timezone = form_data.get('timezone', 'America/Denver').strip()
             api_url = form_data.get('api_url', 'http://143.110.202.154/api/live').strip()
+            favorites = ','.join(team.strip().upper() for team in form_data.get('favorites', '').split(',') if team.strip())
             
             print(f"Saving: SSID={wifi_ssid}, Collections={collections}, TZ={timezone}")
             
             if wifi_ssid and wifi_password:
-                save_result = save_settings(wifi_ssid, wifi_password, collections, timezone, api_url)
+                old_settings = read_current_settings()
+                new_settings = dict(old_settings)
+                new_settings.update({'wifi_ssid': wifi_ssid, 'wifi_password': wifi_password, 'collections': collections,
+                                     'timezone': timezone, 'api_url': api_url, 'favorites': favorites})
+                save_result = save_settings_dict(new_settings)
                 
                 # Handle both old format (True/False/string) and new format (tuple with debug info)
                 if save_result == True:
                     if setup_mode:
-                        # In setup mode, restart immediately after showing success page
-                        response = Response(request, get_success_html(), content_type="text/html")
-                        print("Configuration saved, restarting in 3 seconds...")
-                        time.sleep(3)
-                        microcontroller.reset()
-                        return response
+                        # In setup mode, restart once the success page has been sent
+                        schedule_reset()
+                        return Response(request, get_success_html(), content_type="text/html")
                     else:
-                        # In background mode, just restart after brief delay
-                        response_html = '''<!DOCTYPE html>
+                        # In background mode, only WiFi changes need a restart
+                        restarting = apply_saved_settings(old_settings, new_settings)
+                        restart_note = ("Device will restart in 3 seconds to apply changes..." if restarting
+                                        else "Changes are already showing on the display.")
+                        response_html = f'''<!DOCTYPE html>
 <html><head><title>Settings Updated</title><meta name="viewport" content="width=device-width, initial-scale=1"></head>
 <body style="font-family: Arial; text-align: center; padding: 50px; background: #f0f0f0;">
 <div style="max-width: 400px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px;">
 <h1 style="color: #28a745;">✓ Settings Updated!</h1>
 <p>Configuration saved successfully.</p>
-<p>Device will restart in 3 seconds to apply changes...</p>
+<p>{restart_note}</p>
 </div></body></html>'''
-                        
-                        print("Background config saved, restarting in 3 seconds...")
-                        time.sleep(3)
-                        microcontroller.reset()
                         return Response(request, response_html, content_type="text/html")
                         
                 elif isinstance(save_result, tuple) and save_result[0] == "test_failed":
@@ -1962,7 +760,7 @@ def start_config_server(setup_mode=True, pool=None):
 </div></body></html>'''
                     return Response(request, readonly_html, content_type="text/html")
                     
-                elif save_result == "disk_full":
+                elif save_result == "disk_full" or (isinstance(save_result, tuple) and save_result[0] == "disk_full"):
                     disk_full_html = '''<!DOCTYPE html>
 <html><head><title>Disk Full</title><meta name="viewport" content="width=device-width, initial-scale=1"></head>
 <body style="font-family: Arial; text-align: center; padding: 20px; background: #f0f0f0;">
@@ -1974,7 +772,7 @@ def start_config_server(setup_mode=True, pool=None):
 </div></body></html>'''
                     return Response(request, disk_full_html, content_type="text/html")
                     
-                elif save_result == "filesystem_error":
+                elif save_result == "filesystem_error" or (isinstance(save_result, tuple) and save_result[0] == "filesystem_error"):
                     fs_error_html = '''<!DOCTYPE html>
 <html><head><title>Filesystem Error</title><meta name="viewport" content="width=device-width, initial-scale=1"></head>
 <body style="font-family: Arial; text-align: center; padding: 20px; background: #f0f0f0;">
@@ -2024,6 +822,54 @@ def start_config_server(setup_mode=True, pool=None):
             import json
             return Response(request, json.dumps(error_response), content_type="application/json")
     
+    @server.route("/api/schedule", GET)
+    def schedule_endpoint(request: Request):
+        """API endpoint showing the game rotation schedule and weights"""
+        import json
+        hook = display_hooks.get('schedule')
+        if hook is None:
+            return Response(request, json.dumps({'error': 'Display is not running'}), content_type="application/json")
+        try:
+            return Response(request, json.dumps(hook()), content_type="application/json")
+        except Exception as e:
+            print(f"Error reading schedule: {e}")
+            return Response(request, json.dumps({'error': str(e)}), content_type="application/json")
+    
+    @server.route("/api/state", GET)
+    def state_endpoint(request: Request):
+        """API endpoint with what the display is showing, what's next and how fresh the data is"""
+        import json
+        hook = display_hooks.get('state')
+        if hook is None:
+            return Response(request, json.dumps({'error': 'Display is not running'}), content_type="application/json")
+        try:
+            return Response(request, json.dumps(hook()), content_type="application/json",
+                            headers={"Cache-Control": "no-store"})
+        except Exception as e:
+            print(f"Error reading display state: {e}")
+            return Response(request, json.dumps({'error': str(e)}), content_type="application/json")
+    
+    @server.route("/metrics", GET)
+    def metrics_endpoint(request: Request):
+        """Runtime metrics in Prometheus text format, streamed one metric family per chunk"""
+        return ChunkedResponse(request, metrics.export, content_type="text/plain; version=0.0.4")
+    
+    @server.route("/screenshot.bmp", GET)
+    def screenshot_endpoint(request: Request):
+        """The current frame as a BMP, streamed row by row and limited to one per SCREENSHOT_INTERVAL"""
+        global last_screenshot_at
+        hook = display_hooks.get('screenshot')
+        if hook is None:
+            return Response(request, "Display is not running", content_type="text/plain")
+        now = time.monotonic()
+        if last_screenshot_at is not None and now - last_screenshot_at < SCREENSHOT_INTERVAL:
+            retry_after = int(SCREENSHOT_INTERVAL - (now - last_screenshot_at)) + 1
+            return Response(request, "Too many screenshots, try again shortly", content_type="text/plain",
+                            status=TOO_MANY_REQUESTS_429, headers={"Retry-After": str(retry_after)})
+        last_screenshot_at = now
+        return ChunkedResponse(request, hook, content_type="image/bmp",
+                               headers={"Cache-Control": "no-store"})
+    
     @server.route("/install-update", POST)
     def install_update_endpoint(request: Request):
         """API endpoint to install updates (placeholder for now)"""
@@ -2049,7 +895,13 @@ def start_config_server(setup_mode=True, pool=None):
         # Blocking server for initial setup
         try:
             print("Web server starting...")
-            server.serve_forever(str(wifi.radio.ipv4_address_ap))
+            server.start(str(wifi.radio.ipv4_address_ap))
+            while True:
+                try:
+                    server.poll()
+                except OSError as e:
+                    print(f"Config server connection error: {e}")
+                check_pending_reset()
         except Exception as e:
             print(f"Server error: {e}")
             return False
@@ -0,0 +1,32 @@
+# Host-side tests for the modules that don't need display hardware
+# Run on your computer (CPython) from the repository root:
+#
+#   python -m pytest
+#
+# setup.py imports the board's wifi, socketpool and microcontroller modules at the
+# top; the tests only call its route handlers and parsers, so small stand-ins are
+# enough. The config server tests also need adafruit_httpserver, which on a computer
+# comes from pip (pip install adafruit-circuitpython-httpserver); without it they skip.
+
+import os
+import sys
+import types
+
+# Appended, not prepended: code.py would otherwise shadow the standard library's code module
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+class FakeRadio:
+    ipv4_address = "127.0.0.1"
+    ipv4_address_ap = "192.168.4.1"
+    connected = True
+
+def install_board_modules():
+    wifi = types.ModuleType("wifi")
+    wifi.radio = FakeRadio()
+    microcontroller = types.ModuleType("microcontroller")
+    microcontroller.reset = lambda: None
+    sys.modules["wifi"] = wifi
+    sys.modules["socketpool"] = types.ModuleType("socketpool")
+    sys.modules["microcontroller"] = microcontroller
+
+install_board_modules()
@@ -0,0 +1,117 @@
+# Fuzz tests for setup.py's form body parser
+#
+# Random bodies use fixed seeds so a failure can be replayed. Urlencoded bodies are
+# checked against the standard library's parse_qsl, which treats '+', malformed
+# escapes and invalid UTF-8 the same way parse_form_body promises to.
+
+import json
+import random
+from urllib.parse import parse_qsl, urlencode
+
+import pytest
+
+import setup
+
+FUZZ_ROUNDS = 2000
+TEXT_ALPHABET = "abcXYZ09 _-.~+&=%/?#é☃\n\"'{}[]"
+BYTE_ALPHABET = b"ab%2Fz09+&=\xff\xc3\xa9\x80{"
+
+def random_text(rng, longest):
+    return "".join(rng.choice(TEXT_ALPHABET) for _ in range(rng.randint(0, longest)))
+
+def expected_form(pairs):
+    """Build what parse_form_body should return for (key, value) pairs"""
+    form_data = {}
+    for key, value in pairs:
+        setup.add_form_value(form_data, key, value)
+    return form_data
+
+def stdlib_parse(body):
+    """parse_qsl's reading of a body, for the pairs parse_form_body keeps (those with '=')"""
+    pairs = []
+    for pair in body.split(b"&"):
+        if b"=" not in pair:
+            continue
+        # latin-1 keeps every byte, so escapes and raw bytes decode as UTF-8 together afterwards
+        for key, value in parse_qsl(pair.decode("latin-1"), keep_blank_values=True, encoding="latin-1"):
+            pairs.append((key.encode("latin-1").decode("utf-8", "replace"),
+                          value.encode("latin-1").decode("utf-8", "replace")))
+    return expected_form(pairs)
+
+@pytest.mark.parametrize("seed", range(4))
+def test_urlencoded_round_trip(seed):
+    rng = random.Random(seed)
+    for _ in range(FUZZ_ROUNDS):
+        pairs = [(random_text(rng, 6), random_text(rng, 10)) for _ in range(rng.randint(0, 6))]
+        # Repeated keys (checkboxes) must come back as lists
+        if pairs and rng.random() < 0.3:
+            pairs.append((pairs[0][0], random_text(rng, 10)))
+        body = urlencode(pairs).encode()
+        assert setup.parse_form_body(body) == expected_form(pairs), body
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_bytes_match_stdlib(seed):
+    rng = random.Random(1000 + seed)
+    for _ in range(FUZZ_ROUNDS):
+        body = bytes(rng.choice(BYTE_ALPHABET) for _ in range(rng.randint(0, 24)))
+        if body[:1] == b"{":
+            body = b"x" + body  # A leading '{' is taken as JSON
+        assert setup.parse_form_body(body) == stdlib_parse(body), body
+
+@pytest.mark.parametrize("body, expected", [
+    (b"a=%zz", {"a": "%zz"}),
+    (b"a=%", {"a": "%"}),
+    (b"a=%4", {"a": "%4"}),
+    (b"a=100%25", {"a": "100%"}),
+    (b"a=%%41", {"a": "%A"}),
+    (b"a=%41%", {"a": "A%"}),
+    (b"a=%g1%41", {"a": "%g1A"}),
+    (b"%zz=1", {"%zz": "1"}),
+    (b"a=%2", {"a": "%2"}),
+])
+def test_malformed_escapes_are_kept_as_text(body, expected):
+    assert setup.parse_form_body(body) == expected
+
+@pytest.mark.parametrize("body, expected", [
+    (b"a=%ff", {"a": "�"}),
+    (b"a=\xff\xfe", {"a": "��"}),
+    (b"a=%c3", {"a": "�"}),
+    (b"a=%c3%a9", {"a": "é"}),
+    (b"a=\xc3%a9", {"a": "é"}),
+    (b"%ff=x", {"�": "x"}),
+])
+def test_invalid_utf8_is_replaced(body, expected):
+    assert setup.parse_form_body(body) == expected
+
+def test_pairs_without_equals_are_skipped():
+    assert setup.parse_form_body(b"&a&b=1&&c=") == {"b": "1", "c": ""}
+
+def test_json_body_with_list_values():
+    body = json.dumps({"collections": ["nfl", "nba", 3], "wifi_ssid": "Home Net",
+                       "display_time": 10, "favorites": None}).encode()
+    assert setup.parse_form_body(body, "application/json") == {
+        "collections": ["nfl", "nba", "3"],
+        "wifi_ssid": "Home Net",
+        "display_time": "10",
+    }
+
+def test_json_detected_without_content_type():
+    assert setup.parse_form_body(b'{"collections": []}') == {"collections": []}
+
+@pytest.mark.parametrize("seed", range(2))
+def test_json_round_trip(seed):
+    rng = random.Random(2000 + seed)
+    for _ in range(FUZZ_ROUNDS // 4):
+        data = {}
+        for _ in range(rng.randint(0, 5)):
+            key = random_text(rng, 6)
+            if rng.random() < 0.4:
+                data[key] = [random_text(rng, 8) for _ in range(rng.randint(0, 4))]
+            else:
+                data[key] = random_text(rng, 8)
+        assert setup.parse_form_body(json.dumps(data).encode(), "application/json") == data
+
+def test_invalid_json_raises_value_error():
+    # save_configuration reports parse errors to the browser
+    with pytest.raises(ValueError):
+        setup.parse_form_body(b'{"collections": [', "application/json")
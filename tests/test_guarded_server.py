@@ -0,0 +1,147 @@
+# GuardedServer receive deadlines: a body that doesn't arrive in time must never reach a handler
+#
+# Connections are scripted: each recv_into returns the next chunk of the request, or
+# waits out the socket timeout like a client that has gone quiet.
+
+import errno
+import time
+from urllib.parse import urlencode
+
+import pytest
+
+pytest.importorskip("adafruit_httpserver")
+
+import settings_store
+import setup
+
+SAVED_COLLECTIONS = "nba,nhl"
+
+class ScriptedConnection:
+    """Client connection that sends its chunks with a pause before each one"""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)  # (seconds to wait first, bytes)
+        self.timeout = None
+        self.sent = bytearray()
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def setblocking(self, flag):
+        pass
+
+    def recv_into(self, buffer, nbytes=0):
+        if not self.chunks:
+            time.sleep(self.timeout or 0)
+            raise OSError(errno.ETIMEDOUT, "timed out")
+        delay, data = self.chunks[0]
+        if self.timeout is not None and delay > self.timeout:
+            # The client is slower than this read may wait
+            time.sleep(self.timeout)
+            self.chunks[0] = (delay - self.timeout, data)
+            raise OSError(errno.ETIMEDOUT, "timed out")
+        time.sleep(delay)
+        self.chunks.pop(0)
+        size = min(len(data), nbytes or len(buffer))
+        buffer[:size] = data[:size]
+        if size < len(data):
+            self.chunks.insert(0, (0, data[size:]))
+        return size
+
+    def send(self, data):
+        self.sent += data
+        return len(data)
+
+    def close(self):
+        pass
+
+class ScriptedListener:
+    def __init__(self):
+        self.waiting = []
+
+    def accept(self):
+        if not self.waiting:
+            raise OSError(errno.EAGAIN, "no connection waiting")
+        return self.waiting.pop(0), ("127.0.0.1", 50000)
+
+    def setsockopt(self, *args):
+        pass
+
+    def bind(self, address):
+        pass
+
+    def listen(self, backlog):
+        pass
+
+    def setblocking(self, flag):
+        pass
+
+    def close(self):
+        pass
+
+class ScriptedPool:
+    AF_INET = 2
+    SOCK_STREAM = 1
+    SOL_SOCKET = 1
+    SO_REUSEADDR = 2
+
+    def __init__(self):
+        self.listener = ScriptedListener()
+
+    def getaddrinfo(self, host, port, *args):
+        return [(self.AF_INET, self.SOCK_STREAM, 0, "", (host, port))]
+
+    def socket(self, *args):
+        return self.listener
+
+@pytest.fixture
+def server(tmp_path):
+    settings_file = tmp_path / "settings.toml"
+    settings_file.write_text(f'CIRCUITPY_WIFI_SSID = "home"\nCOLLECTIONS = "{SAVED_COLLECTIONS}"\n')
+    settings_store.load(str(settings_file))
+    pool = ScriptedPool()
+    server = setup.start_config_server(setup_mode=False, pool=pool)
+    assert server is not None
+    server.pool = pool
+    server.body_receive_time = 0.3  # Keep the tests quick
+    yield server
+    settings_store.load(str(tmp_path / "missing.toml"))
+
+def save_form_chunks(body_delays):
+    """Headers, then the /save form body split into len(body_delays) chunks sent after those delays"""
+    body = urlencode([("wifi_ssid", "home"), ("wifi_password", "secret-pass"),
+                      ("collections", "nfl"), ("collections", "mlb")]).encode()
+    headers = (f"POST /save HTTP/1.1\r\nHost: display\r\nContent-Type: application/x-www-form-urlencoded\r\n"
+               f"Content-Length: {len(body)}\r\n\r\n").encode()
+    size = -(-len(body) // len(body_delays))
+    chunks = [(0, headers)]
+    for index, delay in enumerate(body_delays):
+        chunks.append((delay, body[index * size:(index + 1) * size]))
+    return chunks
+
+def run(server, chunks):
+    connection = ScriptedConnection(chunks)
+    server.pool.listener.waiting.append(connection)
+    setup.poll_server(server)
+    status_line = bytes(connection.sent).split(b"\r\n", 1)[0]
+    return int(status_line.split(b" ")[1]) if status_line else None
+
+def test_truncated_body_gets_408_and_saves_nothing(server):
+    # The last part of the body never comes
+    chunks = save_form_chunks([0, 0, 10])
+    assert run(server, chunks) == 408
+    assert settings_store.get("COLLECTIONS") == SAVED_COLLECTIONS
+
+def test_slow_body_within_its_deadline_is_saved(server):
+    # Each body chunk is later than the header deadline allows, but within the body deadline
+    chunks = save_form_chunks([0.05, 0.05, 0.05])
+    assert setup.REQUEST_RECEIVE_TIME < 0.15 < server.body_receive_time
+    assert run(server, chunks) == 200
+    assert settings_store.get("COLLECTIONS") == "nfl,mlb"
+
+def test_next_request_after_a_truncated_one_is_handled(server):
+    assert run(server, save_form_chunks([0, 10])) == 408
+    assert run(server, [(0, b"GET /api/settings HTTP/1.1\r\nHost: display\r\n\r\n")]) == 200
+
+def test_setup_mode_allows_slow_clients():
+    assert setup.SETUP_RECEIVE_TIME > setup.BODY_RECEIVE_TIME > setup.REQUEST_RECEIVE_TIME
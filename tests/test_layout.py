@@ -0,0 +1,64 @@
+# Golden tests for layout.compute_layout
+#
+# Each supported panel geometry has its expected layout saved under tests/golden/.
+# After an intended layout change, rewrite them with UPDATE_GOLDEN=1 and review the diff.
+
+import json
+import os
+
+import pytest
+
+import layout
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+GEOMETRIES = {
+    "2_panel": (64, 32, 2, 1),
+    "4_panel": (64, 32, 4, 1),
+    "6_panel": (64, 32, 6, 1),
+    "2x2": (64, 32, 2, 2),
+}
+
+def as_json(value):
+    """Round-trip through JSON so tuples compare equal to the lists in the golden files"""
+    return json.loads(json.dumps(value))
+
+@pytest.mark.parametrize("name", sorted(GEOMETRIES))
+def test_layout_matches_golden(name):
+    result = as_json(layout.compute_layout(*GEOMETRIES[name]))
+    path = os.path.join(GOLDEN_DIR, f"layout_{name}.json")
+    if os.environ.get("UPDATE_GOLDEN"):
+        with open(path, "w") as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+            f.write("\n")
+    with open(path) as f:
+        assert result == json.load(f)
+
+@pytest.mark.parametrize("name", sorted(GEOMETRIES))
+def test_regions_fit_on_the_display(name):
+    result = layout.compute_layout(*GEOMETRIES[name])
+    for region in ("sport", "matchup", "stats"):
+        if result[region] is None:
+            continue
+        x, y, w, h = result[region]
+        assert 0 <= x and x + w <= result["width"]
+        assert 0 <= y and y + h <= result["height"]
+    for x, y, w, h in result["grid_cells"]:
+        assert x + w <= result["width"] and y + h <= result["height"]
+
+@pytest.mark.parametrize("name", sorted(GEOMETRIES))
+def test_text_widths_fit_their_panel(name):
+    matrix_width = GEOMETRIES[name][0]
+    result = layout.compute_layout(*GEOMETRIES[name])
+    # Grid cells: team and score share a row with a 3px margin either side
+    assert result["grid_team_width"] + result["grid_score_width"] <= matrix_width - 6
+    assert result["grid_status_width"] <= matrix_width
+    assert result["stats_text_width"] <= matrix_width - 2
+    assert result["matchup_text_width"] <= result["matchup"][2]
+
+def test_text_widths_follow_panel_width():
+    narrow = layout.compute_layout(32, 16, 4, 1)
+    wide = layout.compute_layout(64, 32, 4, 1)
+    assert narrow["grid_status_width"] < wide["grid_status_width"]
+    assert narrow["grid_team_width"] + narrow["grid_score_width"] <= 32 - 6
+    assert narrow["stats_text_width"] == 30
@@ -0,0 +1,162 @@
+# Config server route tests: ETag, If-None-Match and 304 on / and /api/settings
+#
+# The handlers are found through the server's routing table and called with a
+# Request parsed from raw bytes, so the request and response go through the same
+# adafruit_httpserver code as on the display, minus the network.
+
+import os
+
+import pytest
+
+pytest.importorskip("adafruit_httpserver")
+
+from adafruit_httpserver import Request
+
+import settings_store
+import setup
+
+WEB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "web")
+
+class FakeListener:
+    """Server socket that never has a connection waiting"""
+
+    def setsockopt(self, *args):
+        pass
+
+    def bind(self, address):
+        pass
+
+    def listen(self, backlog):
+        pass
+
+    def setblocking(self, flag):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def close(self):
+        pass
+
+class FakePool:
+    AF_INET = 2
+    SOCK_STREAM = 1
+    SOL_SOCKET = 1
+    SO_REUSEADDR = 2
+
+    def getaddrinfo(self, host, port, *args):
+        return [(self.AF_INET, self.SOCK_STREAM, 0, "", (host, port))]
+
+    def socket(self, *args):
+        return FakeListener()
+
+class FakeConnection:
+    """Client connection that collects everything the response sends"""
+
+    def __init__(self):
+        self.sent = bytearray()
+
+    def send(self, data):
+        self.sent += data
+        return len(data)
+
+    def close(self):
+        pass
+
+def parse_response(data):
+    """Return (status code, {lowercase header: value}, body) of a raw HTTP response"""
+    head, _, body = bytes(data).partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        chunks = []
+        while body:
+            size_line, _, body = body.partition(b"\r\n")
+            size = int(size_line, 16)
+            if not size:
+                break
+            chunks.append(body[:size])
+            body = body[size + 2:]
+        body = b"".join(chunks)
+    return int(lines[0].split(" ")[1]), headers, body
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    settings_file = tmp_path / "settings.toml"
+    settings_file.write_text('CIRCUITPY_WIFI_SSID = "home"\nTIMEZONE = "America/Denver"\n')
+    settings_store.load(str(settings_file))
+    monkeypatch.setattr(setup, "WEB_ROOT", WEB_DIR)
+    server = setup.start_config_server(setup_mode=False, pool=FakePool())
+    assert server is not None
+    yield server
+    settings_store.load(str(tmp_path / "missing.toml"))
+
+def get(server, path, headers=None):
+    """Run the GET handler for path, return (status, headers, body)"""
+    raw = f"GET {path} HTTP/1.1\r\nHost: display\r\n"
+    for name, value in (headers or {}).items():
+        raw += f"{name}: {value}\r\n"
+    connection = FakeConnection()
+    request = Request(server, connection, ("127.0.0.1", 50000), (raw + "\r\n").encode())
+    handler = server._find_handler("GET", path)
+    handler(request)._send()
+    return parse_response(connection.sent)
+
+@pytest.mark.parametrize("path", ["/", "/api/settings"])
+def test_missing_tag_gets_full_response_with_etag(server, path):
+    status, headers, body = get(server, path)
+    assert status == 200
+    assert headers["etag"].startswith('"')
+    assert headers["cache-control"] == "no-cache"
+    assert body
+
+@pytest.mark.parametrize("path", ["/", "/api/settings"])
+def test_matching_tag_gets_304(server, path):
+    etag = get(server, path)[1]["etag"]
+    status, headers, body = get(server, path, {"If-None-Match": etag})
+    assert status == 304
+    assert headers["etag"] == etag
+    assert body == b""
+
+@pytest.mark.parametrize("path", ["/", "/api/settings"])
+def test_weak_and_listed_tags_match(server, path):
+    etag = get(server, path)[1]["etag"]
+    assert get(server, path, {"If-None-Match": f'"other", W/{etag}'})[0] == 304
+
+@pytest.mark.parametrize("path", ["/", "/api/settings"])
+def test_different_tag_gets_200(server, path):
+    status, headers, body = get(server, path, {"If-None-Match": '"1.0.0-00000000"'})
+    assert status == 200
+    assert headers["etag"] != '"1.0.0-00000000"'
+    assert body
+
+def test_setup_page_is_sent_gzipped(server):
+    status, headers, body = get(server, "/")
+    assert headers["content-encoding"] == "gzip"
+    with open(os.path.join(WEB_DIR, setup.SETUP_PAGE), "rb") as f:
+        assert body == f.read()
+
+def test_settings_etag_changes_with_settings(server):
+    status, headers, body = get(server, "/api/settings")
+    old_etag = headers["etag"]
+    assert b'"America/Denver"' in body
+
+    settings_store.update({"TIMEZONE": "America/Chicago"})
+    settings_store.save()
+
+    status, headers, body = get(server, "/api/settings", {"If-None-Match": old_etag})
+    assert status == 200
+    assert headers["etag"] != old_etag
+    assert b'"America/Chicago"' in body
+    assert get(server, "/api/settings", {"If-None-Match": headers["etag"]})[0] == 304
+
+def test_page_etag_changes_with_the_file(server, tmp_path, monkeypatch):
+    old_etag = get(server, "/")[1]["etag"]
+    (tmp_path / setup.SETUP_PAGE).write_bytes(b"\x1f\x8b changed page")
+    monkeypatch.setattr(setup, "WEB_ROOT", str(tmp_path))
+    status, headers, body = get(server, "/", {"If-None-Match": old_etag})
+    assert status == 200
+    assert headers["etag"] != old_etag
@@ -0,0 +1,108 @@
+# Host-side benchmark of the setup form parser
+# Run on your computer (CPython), not on the display:
+#
+#   python tools/bench_form.py --collections 120
+#
+# Times setup.parse_form_body against the per-character url_decode loop it
+# replaced (copied below as it was), on a setup form with --collections checkboxes
+# ticked. Both parsers must agree on the result before they are timed. Besides the
+# time, it counts the interpreted loop iterations each parser runs per form, which
+# is what costs the most on the display's interpreter.
+
+import argparse
+import os
+import sys
+import time
+import types
+from urllib.parse import urlencode
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# setup.py imports these board-only modules at the top; the parser doesn't use them
+for name in ("wifi", "socketpool", "microcontroller"):
+    sys.modules.setdefault(name, types.ModuleType(name))
+
+import setup  # noqa: E402
+
+def url_decode(url):
+    """The decoder parse_form_body replaced"""
+    url = url.replace('+', ' ')
+    l = len(url)
+    data = bytearray()
+    i = 0
+    while i < l:
+        if url[i] != '%':
+            d = ord(url[i])
+            i += 1
+        else:
+            d = int(url[i+1:i+3], 16)
+            i += 3
+        data.append(d)
+    return data.decode('utf-8')
+
+def old_parse_form(body):
+    """The form parsing save_configuration did before parse_form_body"""
+    form_data = {}
+    body = body.decode('utf-8')
+    for pair in body.split('&'):
+        if '=' in pair:
+            key, value = pair.split('=', 1)
+            decoded_value = url_decode(value)
+            if key in form_data:
+                if isinstance(form_data[key], list):
+                    form_data[key].append(decoded_value)
+                else:
+                    form_data[key] = [form_data[key], decoded_value]
+            else:
+                form_data[key] = decoded_value
+    return form_data
+
+def build_form(collections, password):
+    pairs = [
+        ("wifi_ssid", "My Home Network"),
+        ("wifi_password", password),
+        ("timezone", "America/Denver"),
+        ("api_url", "http://143.110.202.154/api/live"),
+        ("favorites", "DET,MONT"),
+        ("display_time", "10"),
+    ]
+    pairs += [("collections", f"collection_{index}") for index in range(collections)]
+    return urlencode(pairs).encode()
+
+def count_loops(body):
+    """Return (old, new) interpreted loop iterations for one form"""
+    old = 0
+    for pair in body.split(b'&'):
+        if b'=' in pair:
+            value = pair.split(b'=', 1)[1]
+            old += len(value) - 2 * value.count(b'%')  # One iteration per decoded byte
+    new = body.count(b'%')  # One iteration per escape, the rest is slicing
+    return old, new
+
+def time_parser(parser, body, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parser(body)
+    return (time.perf_counter() - start) / rounds
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the setup form parser with the old url_decode loop")
+    parser.add_argument("--collections", type=int, default=120, help="collection checkboxes ticked on the form")
+    parser.add_argument("--rounds", type=int, default=2000, help="parses timed per case")
+    args = parser.parse_args()
+
+    cases = [
+        ("plain password", build_form(args.collections, "correct horse")),
+        ("escape-heavy password", build_form(args.collections, "p@ss/w0rd&é€?=" * 8)),
+    ]
+    for name, body in cases:
+        if old_parse_form(body) != setup.parse_form_body(body):
+            raise SystemExit(f"{name}: parsers disagree")
+        old_time = time_parser(old_parse_form, body, args.rounds)
+        new_time = time_parser(setup.parse_form_body, body, args.rounds)
+        old_loops, new_loops = count_loops(body)
+        print(f"{name}: {len(body)} bytes, old {old_time * 1e6:.0f} us ({old_loops} loop iterations), "
+              f"new {new_time * 1e6:.0f} us ({new_loops} loop iterations), {old_time / new_time:.1f}x faster")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# Host-side tool that precompresses the setup page for the display
+# Run on your computer (CPython), not on the display:
+#
+#   python tools/build_web.py   # writes web/*.html.gz next to each web/*.html
+#
+# setup.py serves the .gz file as-is with Content-Encoding: gzip, reading it in
+# fixed-size chunks, so the device never holds the whole page in RAM and sends
+# a fraction of the bytes over WiFi. Re-run this after editing web/setup.html.
+
+import argparse
+import gzip
+import os
+
+WEB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "web")
+CHUNK_SIZE = 1024  # Keep in sync with WEB_CHUNK_SIZE in setup.py
+
+def compress_file(path):
+    """Write path + '.gz', return (original size, compressed size)"""
+    with open(path, "rb") as source:
+        data = source.read()
+    # mtime=0 keeps the output identical between runs so git only sees real changes
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    with open(path + ".gz", "wb") as target:
+        target.write(compressed)
+    return len(data), len(compressed)
+
+def main():
+    parser = argparse.ArgumentParser(description="Gzip the setup page for serving from flash")
+    parser.add_argument("--dir", default=WEB_DIR, help="directory with the .html files")
+    args = parser.parse_args()
+
+    for name in sorted(os.listdir(args.dir)):
+        if not name.endswith(".html"):
+            continue
+        size, compressed = compress_file(os.path.join(args.dir, name))
+        # The old f-string page was built as one str, then encoded to bytes for sending,
+        # so the largest blocks it needed were about twice the page size
+        print(f"{name}: {size} bytes -> {name}.gz {compressed} bytes "
+              f"({100 * compressed / size:.0f}% sent over WiFi); "
+              f"largest RAM block {CHUNK_SIZE} bytes per request instead of about {2 * size}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+# Host-side font subsetting and PCF conversion tool
+# Run on your computer (CPython), not on the display:
+#
+#   python tools/convert_fonts.py              # writes fonts/*.pcf next to the BDFs
+#   python tools/convert_fonts.py --benchmark  # compares BDF vs PCF load time and size
+#
+# The PCF files only contain the characters the display can draw, so they are a
+# fraction of the BDF size and load_glyphs can seek straight to each glyph
+# instead of scanning the whole text file. code.py loads the .pcf when present
+# and falls back to the .bdf otherwise.
+
+import argparse
+import os
+import struct
+import time
+
+# Every character the display can draw (keep in sync with UI_CHARACTERS in code.py)
+UI_CHARACTERS = (
+    "0123456789"
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "abcdefghijklmnopqrstuvwxyz"
+    " #.,:;-/&'()@%+!?"
+)
+
+FONT_NAMES = ["6x10", "5x7", "4x6"]
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "fonts")
+
+# PCF table types and formats understood by adafruit_bitmap_font.pcf
+PCF_METRICS = 1 << 2
+PCF_BITMAPS = 1 << 3
+PCF_BDF_ENCODINGS = 1 << 5
+PCF_BDF_ACCELERATORS = 1 << 8
+PCF_FORMAT = 0x0C          # Most significant byte and bit first, uncompressed metrics
+PCF_BITMAP_FORMAT = 0x0E   # As above with rows padded to 4 bytes (the only bitmap format supported)
+
+def read_bdf(path, code_points):
+    """Parse a BDF file, return (font_info, glyphs) for the requested code points"""
+    font_info = {'ascent': 0, 'descent': 0, 'bounding_box': (0, 0, 0, 0)}
+    glyphs = {}
+    glyph = None
+    bitmap_rows = None
+    
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if bitmap_rows is not None:
+                if line == 'ENDCHAR':
+                    if glyph is not None and glyph['code_point'] in code_points:
+                        glyph['rows'] = bitmap_rows
+                        glyphs[glyph['code_point']] = glyph
+                    glyph = None
+                    bitmap_rows = None
+                else:
+                    bitmap_rows.append(bytes.fromhex(line))
+                continue
+            
+            key, _, value = line.partition(' ')
+            if key == 'FONTBOUNDINGBOX':
+                font_info['bounding_box'] = tuple(int(v) for v in value.split())
+            elif key == 'FONT_ASCENT':
+                font_info['ascent'] = int(value)
+            elif key == 'FONT_DESCENT':
+                font_info['descent'] = int(value)
+            elif key == 'STARTCHAR':
+                glyph = {'code_point': None, 'dwidth': 0, 'bbx': (0, 0, 0, 0)}
+            elif key == 'ENCODING' and glyph is not None:
+                glyph['code_point'] = int(value.split()[0])
+            elif key == 'DWIDTH' and glyph is not None:
+                glyph['dwidth'] = int(value.split()[0])
+            elif key == 'BBX' and glyph is not None:
+                glyph['bbx'] = tuple(int(v) for v in value.split())
+            elif key == 'BITMAP':
+                bitmap_rows = []
+    
+    return font_info, glyphs
+
+def glyph_metrics(glyph):
+    """Return PCF metrics (lsb, rsb, width, ascent, descent, attributes) for a BDF glyph"""
+    width, height, x_offset, y_offset = glyph['bbx']
+    return (x_offset, x_offset + width, glyph['dwidth'], y_offset + height, -y_offset, 0)
+
+def glyph_bitmap(glyph, pad_bytes):
+    """Return the glyph rows MSB first, each padded to a multiple of pad_bytes"""
+    width = glyph['bbx'][0]
+    row_bytes = (width + 7) // 8
+    padded_bytes = (row_bytes + pad_bytes - 1) // pad_bytes * pad_bytes
+    data = bytearray()
+    for row in glyph['rows']:
+        data += row[:row_bytes].ljust(padded_bytes, b'\x00')
+    return bytes(data)
+
+def build_pcf(font_info, glyphs):
+    """Build PCF file bytes containing the given glyphs"""
+    code_points = sorted(glyphs)
+    metrics = [glyph_metrics(glyphs[cp]) for cp in code_points]
+    
+    # Font-wide bounds come from FONTBOUNDINGBOX so labels lay out exactly like the BDF
+    bbox_width, bbox_height, bbox_x, bbox_y = font_info['bounding_box']
+    minbounds = (bbox_x, min(m[1] for m in metrics), min(m[2] for m in metrics),
+                 min(m[3] for m in metrics), min(m[4] for m in metrics), 0)
+    maxbounds = (max(m[0] for m in metrics), bbox_x + bbox_width, max(m[2] for m in metrics),
+                 bbox_height + bbox_y, -bbox_y, 0)
+    
+    accelerators = struct.pack("<I", PCF_FORMAT)
+    accelerators += struct.pack(">BBBBBBBBIII", 0, 0, 0, int(minbounds[2] == maxbounds[2]), 0, 0, 0, 0,
+                                font_info['ascent'], font_info['descent'], 0)
+    accelerators += struct.pack(">5hH", *minbounds) + struct.pack(">5hH", *maxbounds)
+    
+    metrics_table = struct.pack("<I", PCF_FORMAT) + struct.pack(">I", len(metrics))
+    for m in metrics:
+        metrics_table += struct.pack(">5hH", *m)
+    
+    # Bitmap data is stored for 4-byte row padding; sizes for every padding are listed
+    bitmap_data = bytearray()
+    offsets = []
+    for cp in code_points:
+        offsets.append(len(bitmap_data))
+        bitmap_data += glyph_bitmap(glyphs[cp], 4)
+    bitmap_sizes = [sum(len(glyph_bitmap(glyphs[cp], pad)) for cp in code_points) for pad in (1, 2, 4, 8)]
+    bitmaps_table = struct.pack("<I", PCF_BITMAP_FORMAT) + struct.pack(">I", len(code_points))
+    bitmaps_table += struct.pack(f">{len(offsets)}I", *offsets)
+    bitmaps_table += struct.pack(">4I", *bitmap_sizes) + bytes(bitmap_data)
+    
+    # All UI characters are below 256, so a single row (byte1 == 0) encoding is enough
+    min_cp, max_cp = code_points[0], code_points[-1]
+    indices = [0xFFFF] * (max_cp - min_cp + 1)
+    for glyph_index, cp in enumerate(code_points):
+        indices[cp - min_cp] = glyph_index
+    encodings = struct.pack("<I", PCF_FORMAT)
+    encodings += struct.pack(">5h", min_cp, max_cp, 0, 0, ord(' ') if ord(' ') in glyphs else min_cp)
+    encodings += struct.pack(f">{len(indices)}H", *indices)
+    
+    tables = [
+        (PCF_BDF_ACCELERATORS, PCF_FORMAT, accelerators),
+        (PCF_METRICS, PCF_FORMAT, metrics_table),
+        (PCF_BITMAPS, PCF_BITMAP_FORMAT, bitmaps_table),
+        (PCF_BDF_ENCODINGS, PCF_FORMAT, encodings),
+    ]
+    
+    # Header, table of contents, then each table aligned to 4 bytes
+    offset = 8 + 16 * len(tables)
+    header = b"\x01fcp" + struct.pack("<I", len(tables))
+    body = bytearray()
+    for table_type, table_format, data in tables:
+        header += struct.pack("<IIII", table_type, table_format, len(data), offset + len(body))
+        body += data
+        body += b'\x00' * (-len(body) % 4)
+    
+    return header + bytes(body)
+
+def convert_fonts(characters):
+    """Subset each BDF font to the given characters and write a PCF next to it"""
+    code_points = set(ord(c) for c in characters)
+    for name in FONT_NAMES:
+        bdf_path = os.path.join(FONTS_DIR, f"{name}.bdf")
+        pcf_path = os.path.join(FONTS_DIR, f"{name}.pcf")
+        font_info, glyphs = read_bdf(bdf_path, code_points)
+        missing = ''.join(sorted(chr(cp) for cp in code_points - set(glyphs)))
+        if missing:
+            print(f"{name}: missing glyphs for {missing!r}")
+        
+        pcf_data = build_pcf(font_info, glyphs)
+        with open(pcf_path, 'wb') as f:
+            f.write(pcf_data)
+        print(f"{name}: {len(glyphs)} glyphs, {os.path.getsize(bdf_path)} -> {len(pcf_data)} bytes")
+
+def benchmark_fonts(characters, rounds):
+    """Compare load time and flash footprint of the BDF and PCF fonts"""
+    try:
+        import displayio
+        from adafruit_bitmap_font import bitmap_font
+    except ImportError:
+        print("Benchmark needs adafruit_bitmap_font on the host:")
+        print("  pip install adafruit-circuitpython-bitmap-font adafruit-blinka-displayio")
+        return
+    
+    print(f"{'font':<8}{'format':<8}{'bytes':>10}{'load ms':>10}{'match':>8}")
+    for name in FONT_NAMES:
+        reference = None
+        for extension in ("bdf", "pcf"):
+            path = os.path.join(FONTS_DIR, f"{name}.{extension}")
+            if not os.path.exists(path):
+                print(f"{name:<8}{extension:<8}{'missing':>10}")
+                continue
+            
+            start_time = time.perf_counter()
+            for _ in range(rounds):
+                font = bitmap_font.load_font(path, displayio.Bitmap)
+                font.load_glyphs(characters)
+            load_ms = (time.perf_counter() - start_time) * 1000 / rounds
+            
+            # Check the PCF draws exactly the same pixels and bounding box as the BDF
+            rendered = {'bounding_box': font.get_bounding_box()}
+            for c in characters:
+                glyph = font.get_glyph(ord(c))
+                if glyph:
+                    pixels = bytes(glyph.bitmap[x, y] for y in range(glyph.height) for x in range(glyph.width))
+                    rendered[c] = (glyph.width, glyph.height, glyph.dx, glyph.dy, glyph.shift_x, pixels)
+            if reference is None:
+                reference = rendered
+                match = "-"
+            else:
+                match = "yes" if rendered == reference else "NO"
+            
+            print(f"{name:<8}{extension:<8}{os.path.getsize(path):>10}{load_ms:>10.1f}{match:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Subset the display fonts and convert them to PCF")
+    parser.add_argument("--chars", default=UI_CHARACTERS, help="characters to keep (default: UI character set)")
+    parser.add_argument("--benchmark", action="store_true", help="compare BDF and PCF load time and size")
+    parser.add_argument("--rounds", type=int, default=5, help="load rounds per font for --benchmark")
+    args = parser.parse_args()
+    
+    if args.benchmark:
+        benchmark_fonts(args.chars, args.rounds)
+    else:
+        convert_fonts(args.chars)
+
+if __name__ == "__main__":
+    main()
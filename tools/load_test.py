@@ -0,0 +1,145 @@
+# Host-side load test for the display's config server
+# Run on your computer (CPython), not on the display:
+#
+#   python tools/load_test.py 192.168.1.50 --clients 20 --slow 2 --duration 30
+#
+# Opens --clients connections in parallel, each requesting --path over and over,
+# plus --slow clients that trickle their request in a byte at a time to tie the
+# server up. The display's render loop records how late it wakes from each sleep
+# (loop_lag_seconds on /metrics); the test scrapes that before and after an idle
+# period and the load period, so the two tick jitter distributions can be compared.
+
+import argparse
+import socket
+import threading
+import time
+
+LAG_METRIC = "sports_display_loop_lag_seconds"
+
+def http_get(host, port, path, timeout):
+    """Return (status, body) for a GET request, or (None, error text)"""
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            sock.sendall(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+            data = b""
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                data += chunk
+    except OSError as e:
+        return None, str(e)
+    head, _, body = data.partition(b"\r\n\r\n")
+    if b"transfer-encoding: chunked" in head.lower():
+        body = dechunk(body)
+    try:
+        return int(head.split(b" ", 2)[1]), body
+    except (IndexError, ValueError):
+        return None, "bad response"
+
+def dechunk(body):
+    """Return the data of a chunked transfer encoding body"""
+    parts = []
+    while body:
+        size_line, _, body = body.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            break
+        parts.append(body[:size])
+        body = body[size + 2:]
+    return b"".join(parts)
+
+def read_lag_histogram(host, port):
+    """Return ({bucket bound: cumulative count}, sum, count) for the loop lag histogram"""
+    status, body = http_get(host, port, "/metrics", 10)
+    if status != 200:
+        raise SystemExit(f"Could not read /metrics: {status} {body}")
+    buckets, total, count = {}, 0.0, 0
+    for line in body.decode().splitlines():
+        if line.startswith(LAG_METRIC + "_bucket"):
+            bound = line.split('le="', 1)[1].split('"', 1)[0]
+            buckets[float(bound)] = int(line.rsplit(" ", 1)[1])
+        elif line.startswith(LAG_METRIC + "_sum"):
+            total = float(line.rsplit(" ", 1)[1])
+        elif line.startswith(LAG_METRIC + "_count"):
+            count = int(line.rsplit(" ", 1)[1])
+    return buckets, total, count
+
+def lag_summary(before, after):
+    """Describe loop lag between two histogram scrapes: ticks, mean and bucketed percentiles"""
+    buckets = {bound: after[0].get(bound, 0) - before[0].get(bound, 0) for bound in after[0]}
+    count = after[2] - before[2]
+    if not count:
+        return "no loop ticks recorded"
+    mean = (after[1] - before[1]) / count
+    percentiles = []
+    for percentile in (50, 90, 99):
+        needed = count * percentile / 100
+        bound = next((bound for bound in sorted(buckets) if buckets[bound] >= needed), float("inf"))
+        percentiles.append(f"p{percentile} <= {bound * 1000:.0f} ms" if bound != float("inf") else f"p{percentile} > max bucket")
+    return f"{count} ticks, mean {mean * 1000:.1f} ms late, " + ", ".join(percentiles)
+
+def client(host, port, path, stop_at, results, lock):
+    while time.monotonic() < stop_at:
+        start = time.monotonic()
+        status, _ = http_get(host, port, path, 10)
+        with lock:
+            results.append((status, time.monotonic() - start))
+
+def slow_client(host, port, stop_at, interval):
+    """Hold a connection open by sending the request one byte every interval seconds"""
+    request = f"GET /api/state HTTP/1.1\r\nHost: {host}\r\nX-Padding: {'x' * 40}\r\n\r\n".encode()
+    while time.monotonic() < stop_at:
+        try:
+            with socket.create_connection((host, port), timeout=10) as sock:
+                for byte in request:
+                    if time.monotonic() >= stop_at:
+                        return
+                    sock.send(bytes([byte]))
+                    time.sleep(interval)
+                sock.recv(4096)
+        except OSError:
+            time.sleep(interval)
+
+def main():
+    parser = argparse.ArgumentParser(description="Load the display's config server and measure render loop jitter")
+    parser.add_argument("host", help="display IP address")
+    parser.add_argument("--port", type=int, default=5000, help="config server port")
+    parser.add_argument("--path", default="/api/state", help="path the fast clients request")
+    parser.add_argument("--clients", type=int, default=10, help="parallel clients")
+    parser.add_argument("--slow", type=int, default=0, help="clients that trickle requests a byte at a time")
+    parser.add_argument("--slow-interval", type=float, default=0.3, help="seconds between a slow client's bytes")
+    parser.add_argument("--idle", type=float, default=10, help="seconds to measure jitter without load first")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of load")
+    args = parser.parse_args()
+
+    start = read_lag_histogram(args.host, args.port)
+    time.sleep(args.idle)
+    idle = read_lag_histogram(args.host, args.port)
+    print(f"Idle:   {lag_summary(start, idle)}")
+
+    results, lock, threads = [], threading.Lock(), []
+    stop_at = time.monotonic() + args.duration
+    for _ in range(args.clients):
+        threads.append(threading.Thread(target=client, args=(args.host, args.port, args.path, stop_at, results, lock)))
+    for _ in range(args.slow):
+        threads.append(threading.Thread(target=slow_client, args=(args.host, args.port, stop_at, args.slow_interval)))
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join(args.duration + 15)
+    loaded = read_lag_histogram(args.host, args.port)
+    print(f"Loaded: {lag_summary(idle, loaded)}")
+
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    latencies = sorted(latency for status, latency in results if status == 200)
+    print(f"{len(results)} requests: " + ", ".join(f"{status or 'failed'}: {count}" for status, count in sorted(statuses.items(), key=str)))
+    if latencies:
+        print(f"200 latency: median {latencies[len(latencies) // 2] * 1000:.0f} ms, "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.0f} ms, max {latencies[-1] * 1000:.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# Local mock of the sports API for testing the display against known data
+# Run on your computer (CPython), not on the display:
+#
+#   python tools/mock_api.py --favorite DET --change-every 30
+#
+# Then point the display at it in settings.toml:
+#
+#   API_BASE_URL = "http://<computer-ip>:8000/api/live"
+#
+# Every collection gets its own set of games. The favorite team plays a live
+# game whose score changes every --change-every seconds; the server prints when
+# each change was made and how long it took until a request first picked it up,
+# so together with the display's "Favorite alert on panel" line you get the
+# end-to-end latency from API change to panel. Request counts are printed on exit.
+# With --shared N the first N games of every collection are the same games (same
+# ids), like a game that is in both fcs_football and big_sky_football.
+
+import argparse
+import json
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SPORTS = [
+    ("NFL Football", ["DET", "GB", "CHI", "MIN", "DAL", "PHI", "NYG", "WSH"]),
+    ("NBA Basketball", ["DET", "BOS", "MIL", "CLE", "LAL", "GSW", "DEN", "PHX"]),
+    ("NHL Hockey", ["DET", "TOR", "MTL", "BOS", "COL", "VGK", "EDM", "SEA"]),
+    ("College Football", ["MICH", "OSU", "PSU", "MSU", "MONT", "MTST", "IDHO", "WEB"]),
+]
+STATUSES = ["Final", "In Progress", "Scheduled"]
+
+class MockState:
+    """Games per collection plus the scripted favorite score changes"""
+
+    def __init__(self, games_per_collection, favorite, change_every, shared=0):
+        self.games_per_collection = games_per_collection
+        self.shared = shared
+        self.favorite = favorite
+        self.change_every = change_every
+        self.start_time = time.monotonic()
+        self.favorite_score = 0
+        self.change_time = None      # When the current favorite score was set
+        self.change_served = True    # Whether a request has returned it yet
+        self.requests = {}           # Collection list -> request count
+        self.bytes_sent = 0
+
+    def tick(self):
+        """Apply any favorite score change that is due"""
+        if not self.favorite or self.change_every <= 0:
+            return
+        changes = int((time.monotonic() - self.start_time) / self.change_every)
+        if changes * 3 != self.favorite_score:
+            self.favorite_score = changes * 3
+            self.change_time = self.start_time + changes * self.change_every  # When it was due, not when noticed
+            self.change_served = False
+            print(f"[{self.elapsed():7.1f}s] {self.favorite} score changed to {self.favorite_score}")
+
+    def elapsed(self):
+        return time.monotonic() - self.start_time
+
+    def make_game(self, collection, index):
+        """Return a game record in the API's format, stable for a collection and index"""
+        if index < self.shared:
+            collection = "shared"
+        seed = zlib.crc32(f"{collection}:{index}".encode())
+        sport, teams = SPORTS[seed % len(SPORTS)]
+        away = teams[seed % len(teams)]
+        home = teams[(seed // 7 + 1 + seed % len(teams)) % len(teams)]
+        if home == away:
+            home = teams[(teams.index(away) + 1) % len(teams)]
+        status = STATUSES[(seed // 3) % len(STATUSES)]
+        away_score = (seed // 11) % 35
+        home_score = (seed // 13) % 35
+        if self.favorite and index == 0:
+            # The first game of every collection is the favorite's live game
+            away, status = self.favorite, "In Progress"
+            away_score = self.favorite_score
+        if status == "Scheduled":
+            away_score = home_score = 0
+        return {
+            "id": f"{collection}-{index}",
+            "sport_display": sport,
+            "status": status,
+            "date": "2025-01-01T19:00:00Z",
+            "game_details": {"period": "Q4" if status == "In Progress" else "", "clock": "2:00"},
+            "away_team": {"abbreviation": away, "name": away, "score": away_score, "color": "0050a0", "rank": None},
+            "home_team": {"abbreviation": home, "name": home, "score": home_score, "color": "a02020", "rank": None},
+            "top_performers": [
+                {"player_name": "Alex Example", "team_abbr": away, "value": seed % 300, "stat_category": "YDS"},
+                {"player_name": "Sam Sample", "team_abbr": home, "value": seed % 120, "stat_category": "YDS"},
+            ],
+        }
+
+    def page(self, collections, page, page_size, base_url):
+        """Return the API response body for one page of the given collections"""
+        games = []
+        for collection in collections:
+            for index in range(self.games_per_collection):
+                games.append(self.make_game(collection, index))
+        start = page * page_size
+        next_page_url = None
+        if start + page_size < len(games):
+            next_page_url = f"{base_url}?collections={','.join(collections)}&page_size={page_size}&page={page + 1}"
+        return {
+            "data": games[start:start + page_size],
+            "pagination": {"page": page, "page_size": page_size, "total": len(games), "next_page_url": next_page_url},
+        }
+
+def make_handler(state):
+    class MockHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            collections = [c for c in query.get("collections", ["nfl"])[0].split(",") if c] or ["nfl"]
+            page = int(query.get("page", ["0"])[0])
+            page_size = int(query.get("page_size", ["10"])[0])
+            base_url = f"http://{self.headers.get('Host')}{url.path}"
+
+            state.tick()
+            response = state.page(collections, page, page_size, base_url)
+            body = json.dumps(response).encode()
+            if state.favorite and not state.change_served and state.change_time is not None:
+                if any(game["away_team"]["abbreviation"] == state.favorite for game in response["data"]):
+                    state.change_served = True
+                    print(f"[{state.elapsed():7.1f}s] change first served "
+                          f"{time.monotonic() - state.change_time:.1f}s after it was made")
+
+            key = ",".join(collections)
+            state.requests[key] = state.requests.get(key, 0) + 1
+            state.bytes_sent += len(body)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            print(f"[{state.elapsed():7.1f}s] {self.address_string()} {format % args}")
+
+    return MockHandler
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve mock sports API data for the display")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--games", type=int, default=12, help="games per collection")
+    parser.add_argument("--favorite", default="", help="team abbreviation whose live game changes score")
+    parser.add_argument("--shared", type=int, default=0, help="games per collection that are in every collection")
+    parser.add_argument("--change-every", type=float, default=30, help="seconds between favorite score changes")
+    args = parser.parse_args()
+
+    state = MockState(args.games, args.favorite.upper(), args.change_every, args.shared)
+    server = ThreadingHTTPServer(("0.0.0.0", args.port), make_handler(state))
+    print(f"Mock API on http://0.0.0.0:{args.port}/api/live")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    total = sum(state.requests.values())
+    print(f"\n{total} requests, {state.bytes_sent} bytes in {state.elapsed():.0f}s")
+    for collections, count in sorted(state.requests.items()):
+        print(f"  {collections}: {count} requests")
+
+if __name__ == "__main__":
+    main()